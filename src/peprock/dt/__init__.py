@@ -1,22 +1,52 @@
 """Date/time and related models and helpers.
 
 Complements the datetime package from the standard library
-(https://docs.python.org/3/library/datetime.html), adding datetime period models
-and timezone awareness helpers.
+(https://docs.python.org/3/library/datetime.html), adding datetime period models,
+indexes, sets and series of periods and timezone awareness helpers.
+
+PeriodSeries requires the optional numpy dependency. It is imported lazily.
 """
 
+import importlib
 import importlib.metadata
+import typing
 
 from .awareness import EnsureAwareError, ensure_aware, is_aware, is_naive
 from .period import (
     Period,
+    PeriodSlots,
 )
+from .period_index import PeriodIndex
+from .period_set import PeriodSet
+
+if typing.TYPE_CHECKING:
+    from .period_series import PeriodSeries
 
 __version__ = importlib.metadata.version("peprock")
 
+
+# attributes requiring optional dependencies, by module
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "PeriodSeries": ".period_series",
+}
+
+
+def __getattr__(name: str) -> typing.Any:  # noqa: ANN401
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(_LAZY_ATTRIBUTES[name], __name__)
+        return getattr(module, name)
+
+    msg: str = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
 __all__ = [
     "EnsureAwareError",
     "Period",
+    "PeriodIndex",
+    "PeriodSeries",
+    "PeriodSet",
+    "PeriodSlots",
     "__version__",
     "ensure_aware",
     "is_aware",
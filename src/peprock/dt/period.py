@@ -28,20 +28,51 @@ True
 ... ) in period
 False
 
+>>> slots = period.split(datetime.timedelta(minutes=15))
+>>> len(slots)
+96
+>>> slots[-1]
+Period(start=datetime.datetime(2022, 1, 2, 11, 45), \
+end=datetime.datetime(2022, 1, 2, 12, 0))
+>>> [slot.duration for slot in period.split_calendar("day")]
+[datetime.timedelta(seconds=43200), datetime.timedelta(seconds=43200)]
+
+>>> import zoneinfo
+>>> paris = zoneinfo.ZoneInfo("Europe/Paris")
+>>> day = Period(
+...     start=datetime.datetime(2022, 3, 27, tzinfo=paris),
+...     end=datetime.datetime(2022, 3, 28, tzinfo=paris),
+... )
+>>> day.duration
+datetime.timedelta(seconds=82800)
+>>> len(day.split(datetime.timedelta(hours=1)))
+23
+
 
 """
 
+import bisect
 import collections.abc
 import dataclasses
 import datetime
 import functools
 import sys
+import typing
+
+from .awareness import ensure_aware, is_aware
 
 if sys.version_info >= (3, 11):
     from typing import Self  # pragma: no cover
 else:
     from typing_extensions import Self  # pragma: no cover
 
+_CalendarUnit: typing.TypeAlias = typing.Literal["day", "month", "quarter", "year"]
+
+_UTC: typing.Final = datetime.timezone.utc
+# interval of probing UTC offsets for transitions, see _UtcOffsets
+_PROBE_INTERVAL: typing.Final = datetime.timedelta(days=1)
+_MICROSECOND: typing.Final = datetime.timedelta(microseconds=1)
+
 
 @dataclasses.dataclass(frozen=True)
 class Period(
@@ -54,12 +85,21 @@ class Period(
 
     @functools.cached_property
     def duration(self: Self) -> datetime.timedelta:
-        """Return duration of period."""
+        """Return duration of period, elapsed in UTC if aware."""
+        if is_aware(self.start) and is_aware(self.end):
+            start = ensure_aware(self.start, target_tz=_UTC)
+            return ensure_aware(self.end, target_tz=_UTC) - start
+
         return self.end - self.start
 
     @functools.cached_property
     def midpoint(self: Self) -> datetime.datetime:
-        """Return midpoint of period."""
+        """Return midpoint of period, in start timezone if aware."""
+        if is_aware(self.start) and is_aware(self.end):
+            return (
+                ensure_aware(self.start, target_tz=_UTC) + self.duration / 2
+            ).astimezone(self.start.tzinfo)
+
         return self.start + self.duration / 2
 
     def __contains__(self: Self, item: object) -> bool:
@@ -73,7 +113,253 @@ class Period(
         msg: str = f"expected peprock.dt.Period | datetime.datetime, got {item!r}"
         raise TypeError(msg)
 
+    def split(self: Self, step: datetime.timedelta, /) -> "PeriodSlots":
+        """Return slots of step from start, the last of which may end early.
+
+        Aware periods are split in UTC into slots in start timezone, so that days
+        of daylight saving time transitions have 23 or 25 hourly slots.
+        """
+        if step <= datetime.timedelta():
+            msg: str = f"expected positive step, got {step!r}"
+            raise ValueError(msg)
+
+        start = self.start
+        duration = self._checked_duration()
+        if not is_aware(start):
+            return PeriodSlots(
+                self,
+                lambda index: start + index * step,
+                -(-duration // step),
+            )
+
+        utc_start = ensure_aware(start, target_tz=_UTC).replace(tzinfo=None)
+        offsets = _UtcOffsets(
+            typing.cast("datetime.tzinfo", start.tzinfo),
+            utc_start,
+            utc_start + duration,
+            max(step, _PROBE_INTERVAL),
+        )
+        return PeriodSlots(
+            self,
+            lambda index: offsets.local(utc_start + index * step),
+            -(-duration // step),
+        )
+
+    def split_calendar(self: Self, unit: _CalendarUnit, /) -> "PeriodSlots":
+        """Return slots of calendar days, months, quarters or years in start timezone.
+
+        Slots are aligned to the calendar, so that the first and last slot may be
+        partial.
+        """
+        try:
+            index, boundary, multiple = _CALENDAR_UNITS[unit]
+        except KeyError:
+            msg: str = f"expected day, month, quarter or year, got {unit!r}"
+            raise ValueError(msg) from None
+
+        if not self._checked_duration():
+            return PeriodSlots(self, lambda _: self.start, 0)
+
+        end = self.end
+        tzinfo = self.start.tzinfo
+        if tzinfo is not None and end.tzinfo is not None:
+            end = end.astimezone(tzinfo)
+
+        first = index(self.start) - index(self.start) % multiple
+        count = (index(end) - first) // multiple
+        # end is after the boundary of the last slot, unless it is that boundary
+        if end != boundary(first + count * multiple, tzinfo):
+            count += 1
+
+        return PeriodSlots(
+            self,
+            lambda index_: boundary(first + index_ * multiple, tzinfo),
+            count,
+        )
+
+    def _checked_duration(self: Self) -> datetime.timedelta:
+        if self.duration < datetime.timedelta():
+            msg: str = f"expected period ending after its start, got {self!r}"
+            raise ValueError(msg)
+
+        return self.duration
+
+
+class PeriodSlots(collections.abc.Sequence[Period]):
+    """Lazy sequence of consecutive slots covering a period.
+
+    Slots are computed on access from their boundaries, in constant time by index.
+    """
+
+    __slots__ = ("_boundary", "_len", "period")
+
+    period: Period
+
+    def __init__(
+        self: Self,
+        period: Period,
+        boundary: collections.abc.Callable[[int], datetime.datetime],
+        length: int,
+        /,
+    ) -> None:
+        """Initialize slots of period, starting at boundary of their index.
+
+        The first slot starts at the start and the last slot ends at the end of
+        period instead.
+        """
+        self.period = period
+        self._boundary: collections.abc.Callable[[int], datetime.datetime] = boundary
+        self._len: int = length
+
+    def __repr__(self: Self) -> str:
+        """Return repr(self)."""
+        return f"<{type(self).__name__}: {len(self)} slots of {self.period!r}>"
+
+    def __len__(self: Self) -> int:
+        """Return number of slots."""
+        return self._len
+
+    @typing.overload
+    def __getitem__(self: Self, index: int, /) -> Period: ...
+
+    @typing.overload
+    def __getitem__(self: Self, index: slice, /) -> list[Period]: ...
+
+    def __getitem__(self, index, /):
+        """Return slot at index, or list of slots of slice."""
+        if isinstance(index, slice):
+            return list(map(self._slot, range(self._len)[index]))
+
+        if index < 0:
+            index += self._len
+
+        if not 0 <= index < self._len:
+            msg: str = "slot index out of range"
+            raise IndexError(msg)
+
+        return self._slot(index)
+
+    def __iter__(self: Self) -> collections.abc.Iterator[Period]:
+        """Return iterator over slots."""
+        return map(self._slot, range(self._len))
+
+    def _slot(self: Self, index: int, /) -> Period:
+        return Period(
+            self.period.start if not index else self._boundary(index),
+            self.period.end if index == self._len - 1 else self._boundary(index + 1),
+        )
+
+
+class _UtcOffsets:
+    """UTC offsets of a timezone within a UTC period, by transition.
+
+    Offsets are probed at intervals, and transitions located to the microsecond by
+    bisection, so that utcoffset() is called once per interval and a few dozen
+    times per transition instead of once per datetime. Pairs of transitions within
+    one interval that cancel each other out are missed.
+    """
+
+    __slots__ = ("_offsets", "_transitions", "tzinfo")
+
+    def __init__(
+        self: Self,
+        tzinfo: datetime.tzinfo,
+        start: datetime.datetime,
+        end: datetime.datetime,
+        interval: datetime.timedelta,
+        /,
+    ) -> None:
+        """Initialize offsets of tzinfo from naive UTC start to end."""
+        self.tzinfo: datetime.tzinfo = tzinfo
+        # offset before the first transition, and from each transition on
+        self._transitions: list[datetime.datetime] = []
+        self._offsets: list[datetime.timedelta] = [self._probe(start)]
+        previous = start
+        while previous < end:
+            moment = min(previous + interval, end)
+            offset = self._probe(moment)
+            low = previous
+            while offset != self._offsets[-1]:
+                low = self._locate(low, moment)
+
+            previous = moment
+
+    def _probe(self: Self, moment: datetime.datetime, /) -> datetime.timedelta:
+        return typing.cast(
+            "datetime.timedelta",
+            moment.replace(tzinfo=_UTC).astimezone(self.tzinfo).utcoffset(),
+        )
+
+    def _locate(
+        self: Self,
+        low: datetime.datetime,
+        high: datetime.datetime,
+        /,
+    ) -> datetime.datetime:
+        """Append and return first transition after low, up to high."""
+        offset = self._offsets[-1]
+        while high - low > _MICROSECOND:
+            middle = low + (high - low) // 2
+            if self._probe(middle) == offset:
+                low = middle
+            else:
+                high = middle
+
+        self._transitions.append(high)
+        self._offsets.append(self._probe(high))
+        return high
+
+    def local(self: Self, moment: datetime.datetime, /) -> datetime.datetime:
+        """Return naive UTC moment as datetime in timezone."""
+        index = bisect.bisect_right(self._transitions, moment)
+        offset = self._offsets[index]
+        # local times repeat after transitions to a smaller offset
+        fold = bool(index) and (
+            moment - self._transitions[index - 1] < self._offsets[index - 1] - offset
+        )
+        return (moment + offset).replace(tzinfo=self.tzinfo, fold=fold)
+
+
+def _day_index(moment: datetime.datetime, /) -> int:
+    return moment.toordinal()
+
+
+def _day_start(index: int, tzinfo: datetime.tzinfo | None, /) -> datetime.datetime:
+    return datetime.datetime.combine(
+        datetime.date.fromordinal(index),
+        datetime.time(),
+        tzinfo,
+    )
+
+
+def _month_index(moment: datetime.datetime, /) -> int:
+    return 12 * moment.year + moment.month - 1
+
+
+def _month_start(index: int, tzinfo: datetime.tzinfo | None, /) -> datetime.datetime:
+    year, month = divmod(index, 12)
+    return datetime.datetime(year, month + 1, 1, tzinfo=tzinfo)
+
+
+# index of calendar day or month, its start and the number of them per slot
+_CALENDAR_UNITS: typing.Final[
+    dict[
+        str,
+        tuple[
+            collections.abc.Callable[[datetime.datetime], int],
+            collections.abc.Callable[[int, datetime.tzinfo | None], datetime.datetime],
+            int,
+        ],
+    ]
+] = {
+    "day": (_day_index, _day_start, 1),
+    "month": (_month_index, _month_start, 1),
+    "quarter": (_month_index, _month_start, 3),
+    "year": (_month_index, _month_start, 12),
+}
+
 
 __all__ = [
     "Period",
+    "PeriodSlots",
 ]
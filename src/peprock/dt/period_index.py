@@ -0,0 +1,234 @@
+"""Static index of datetime periods answering containment and overlap queries.
+
+Periods are stored in a centered interval tree, see
+https://en.wikipedia.org/wiki/Interval_tree#Centered_interval_tree, built in
+O(n log n). Queries for periods containing a datetime take O(log n + k) for k
+results, as do queries for periods overlapping a period. Periods are closed, like in
+Period.__contains__.
+
+Examples
+--------
+>>> index = PeriodIndex([
+...     Period(datetime.datetime(2022, 1, 1), datetime.datetime(2022, 2, 1)),
+...     Period(datetime.datetime(2022, 1, 15), datetime.datetime(2022, 1, 20)),
+...     Period(datetime.datetime(2022, 2, 1), datetime.datetime(2022, 3, 1)),
+... ])
+>>> len(index.containing(datetime.datetime(2022, 1, 17)))
+2
+>>> sorted(
+...     period.start.month
+...     for period in index.containing(datetime.datetime(2022, 2, 1))
+... )
+[1, 2]
+>>> index.within(
+...     Period(datetime.datetime(2022, 1, 10), datetime.datetime(2022, 1, 31)),
+... )
+[Period(start=datetime.datetime(2022, 1, 15, 0, 0), \
+end=datetime.datetime(2022, 1, 20, 0, 0))]
+>>> len(index.overlapping(
+...     Period(datetime.datetime(2022, 1, 19), datetime.datetime(2022, 2, 1)),
+... ))
+3
+
+
+"""
+
+import bisect
+import collections.abc
+import dataclasses
+import datetime
+import operator
+import sys
+import typing
+
+from .period import Period
+
+if sys.version_info >= (3, 11):
+    from typing import Self  # pragma: no cover
+else:
+    from typing_extensions import Self  # pragma: no cover
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class _Node:
+    """Node of a centered interval tree, holding the periods containing center.
+
+    Periods are held as positions in the index, ordered by start and by end.
+    """
+
+    center: datetime.datetime
+    starts: list[datetime.datetime]
+    by_start: list[int]
+    ends: list[datetime.datetime]
+    by_end: list[int]
+    left: "_Node | None"
+    right: "_Node | None"
+
+
+class PeriodIndex(collections.abc.Sequence[Period]):
+    """Immutable sequence of periods ordered by start and end, indexed for queries.
+
+    Query results are lists of periods in no particular order.
+    """
+
+    __slots__ = ("_periods", "_root", "_starts")
+
+    def __init__(
+        self: Self,
+        periods: collections.abc.Iterable[Period] = (),
+        /,
+    ) -> None:
+        """Initialize index of periods, which must not end before they start."""
+        self._periods: list[Period] = sorted(
+            periods,
+            key=operator.attrgetter("start", "end"),
+        )
+        for period in self._periods:
+            if period.end < period.start:
+                msg: str = f"expected period ending after its start, got {period!r}"
+                raise ValueError(msg)
+
+        self._starts: list[datetime.datetime] = [
+            period.start for period in self._periods
+        ]
+        self._root: _Node | None = self._build(
+            list(range(len(self._periods))),
+            [period.end for period in self._periods],
+        )
+
+    def __repr__(self: Self) -> str:
+        """Return repr(self)."""
+        return f"{type(self).__name__}({self._periods!r})"
+
+    def __len__(self: Self) -> int:
+        """Return number of periods."""
+        return len(self._periods)
+
+    def __iter__(self: Self) -> collections.abc.Iterator[Period]:
+        """Return iterator over periods ordered by start and end."""
+        return iter(self._periods)
+
+    @typing.overload
+    def __getitem__(self: Self, index: int, /) -> Period: ...
+
+    @typing.overload
+    def __getitem__(self: Self, index: slice, /) -> list[Period]: ...
+
+    def __getitem__(self, index, /):
+        """Return period at index, or list of periods of slice."""
+        return self._periods[index]
+
+    def containing(self: Self, item: Period | datetime.datetime, /) -> list[Period]:
+        """Return periods containing item, see Period.__contains__.
+
+        Takes O(log n + k) for a datetime. For a period, periods containing its start
+        are filtered by end.
+        """
+        if isinstance(item, Period):
+            if item.end < item.start:
+                # by Period.__contains__, periods overlapping the reversed period
+                return self.overlapping(item)
+
+            return [
+                period
+                for period in map(self._periods.__getitem__, self._stab(item.start))
+                if item.end <= period.end
+            ]
+
+        return list(map(self._periods.__getitem__, self._stab(item)))
+
+    def overlapping(self: Self, item: Period | datetime.datetime, /) -> list[Period]:
+        """Return periods sharing at least one datetime with item in O(log n + k).
+
+        These are the periods containing the start of item or starting within item.
+        Periods ending before they start are reversed first, so that like in
+        containing, periods overlapping them are those containing their reversal.
+        """
+        if not isinstance(item, Period):
+            return self.containing(item)
+
+        if item.end < item.start:
+            item = dataclasses.replace(item, start=item.end, end=item.start)
+
+        positions = self._stab(item.start)
+        positions.extend(
+            range(
+                bisect.bisect_right(self._starts, item.start),
+                bisect.bisect_right(self._starts, item.end),
+            ),
+        )
+        return list(map(self._periods.__getitem__, positions))
+
+    def within(self: Self, period: Period, /) -> list[Period]:
+        """Return periods contained in period.
+
+        Periods starting within period are located by binary search and filtered by
+        end.
+        """
+        start = bisect.bisect_left(self._starts, period.start)
+        stop = bisect.bisect_right(self._starts, period.end)
+        return [
+            period_
+            for period_ in self._periods[start:stop]
+            if period_.end <= period.end
+        ]
+
+    def _build(
+        self: Self,
+        positions: list[int],
+        ends: list[datetime.datetime],
+        /,
+    ) -> _Node | None:
+        """Return tree of periods at positions, which are ordered by start."""
+        if not positions:
+            return None
+
+        starts = self._starts
+        # the median start splits the periods left and right of center in halves
+        center = starts[positions[len(positions) // 2]]
+        left: list[int] = []
+        middle: list[int] = []
+        right: list[int] = []
+        for position in positions:
+            if ends[position] < center:
+                left.append(position)
+            elif starts[position] > center:
+                right.append(position)
+            else:
+                middle.append(position)
+
+        by_end = sorted(middle, key=ends.__getitem__)
+        return _Node(
+            center=center,
+            starts=[starts[position] for position in middle],
+            by_start=middle,
+            ends=[ends[position] for position in by_end],
+            by_end=by_end,
+            left=self._build(left, ends),
+            right=self._build(right, ends),
+        )
+
+    def _stab(self: Self, moment: datetime.datetime, /) -> list[int]:
+        """Return positions of periods containing moment."""
+        positions: list[int] = []
+        node = self._root
+        while node is not None:
+            if moment < node.center:
+                # periods of node end at or after center, so contain moment if started
+                positions.extend(
+                    node.by_start[: bisect.bisect_right(node.starts, moment)],
+                )
+                node = node.left
+            elif moment > node.center:
+                positions.extend(node.by_end[bisect.bisect_left(node.ends, moment) :])
+                node = node.right
+            else:
+                positions.extend(node.by_start)
+                break
+
+        return positions
+
+
+__all__ = [
+    "PeriodIndex",
+]
@@ -0,0 +1,223 @@
+"""Compact series of datetime periods backed by NumPy.
+
+Requires the optional numpy dependency, e.g. `pip install peprock[numpy]`.
+
+Starts and ends are stored as int64 arrays of microseconds since the Unix epoch, 16
+bytes per period. Durations, midpoints, containment and sorting are computed on the
+arrays, and Period objects are only created on element access.
+
+Examples
+--------
+>>> start = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+>>> series = PeriodSeries.from_periods(
+...     Period(start, start + datetime.timedelta(hours=1)).split(
+...         datetime.timedelta(minutes=15),
+...     ),
+... )
+>>> len(series), series.duration
+(4, array([900000000, 900000000, 900000000, 900000000]))
+>>> series[-1]
+Period(start=datetime.datetime(2024, 1, 1, 0, 45, tzinfo=datetime.timezone.utc), \
+end=datetime.datetime(2024, 1, 1, 1, 0, tzinfo=datetime.timezone.utc))
+>>> series.contains(start + datetime.timedelta(minutes=20))
+array([False,  True, False, False])
+>>> [period.start.minute for period in series[::-1].sorted()]
+[0, 15, 30, 45]
+
+
+"""
+
+import collections.abc
+import dataclasses
+import datetime
+import operator
+import sys
+import typing
+
+import numpy as np
+
+from .awareness import ensure_aware, is_aware
+from .period import Period
+
+if typing.TYPE_CHECKING:
+    import numpy.typing as npt
+
+if sys.version_info >= (3, 11):
+    from typing import Self  # pragma: no cover
+else:
+    from typing_extensions import Self  # pragma: no cover
+
+_EPOCH: typing.Final[datetime.datetime] = datetime.datetime(
+    1970,
+    1,
+    1,
+    tzinfo=datetime.timezone.utc,
+)
+_MICROSECOND: typing.Final[datetime.timedelta] = datetime.timedelta(microseconds=1)
+
+
+@dataclasses.dataclass(frozen=True, eq=False)
+class PeriodSeries(collections.abc.Sequence[Period]):
+    """Sequence of periods stored as epoch microsecond arrays of starts and ends.
+
+    Periods are materialized as aware datetimes in tzinfo on access. Slices, index
+    arrays, masks and sequences of indices or booleans return series. Naive
+    datetimes only have a position on the epoch timeline in an assumed timezone,
+    so from_periods and contains raise EnsureAwareError for them unless assumed_tz
+    is given, and naive periods are never in a series.
+    """
+
+    starts: "npt.NDArray[np.int64]"
+    ends: "npt.NDArray[np.int64]"
+    tzinfo: datetime.tzinfo = datetime.timezone.utc
+
+    def __post_init__(self: Self) -> None:
+        """Store starts and ends as contiguous one-dimensional int64 arrays."""
+        starts = np.ascontiguousarray(self.starts, dtype=np.int64)
+        ends = np.ascontiguousarray(self.ends, dtype=np.int64)
+        if starts.ndim != 1 or starts.shape != ends.shape:
+            msg: str = (
+                "expected one-dimensional starts and ends of equal length, got "
+                f"{starts.shape=} and {ends.shape=}"
+            )
+            raise ValueError(msg)
+
+        object.__setattr__(self, "starts", starts)
+        object.__setattr__(self, "ends", ends)
+
+    @classmethod
+    def from_periods(
+        cls: type[Self],
+        periods: collections.abc.Iterable[Period],
+        /,
+        tzinfo: datetime.tzinfo = datetime.timezone.utc,
+        *,
+        assumed_tz: datetime.tzinfo | None = None,
+    ) -> Self:
+        """Create series from periods, materialized in tzinfo on access.
+
+        Naive datetimes are interpreted in assumed_tz, see ensure_aware.
+        """
+        bounds = np.array(
+            [
+                (
+                    _epoch_microseconds(period.start, assumed_tz),
+                    _epoch_microseconds(period.end, assumed_tz),
+                )
+                for period in periods
+            ],
+            dtype=np.int64,
+        ).reshape(-1, 2)
+        return cls(bounds[:, 0], bounds[:, 1], tzinfo)
+
+    def __len__(self: Self) -> int:
+        """Return number of periods."""
+        return len(self.starts)
+
+    @typing.overload
+    def __getitem__(self: Self, key: int, /) -> Period: ...
+
+    @typing.overload
+    def __getitem__(
+        self: Self,
+        key: "slice | npt.NDArray[np.integer[typing.Any] | np.bool_]",
+        /,
+    ) -> Self: ...
+
+    @typing.overload
+    def __getitem__(self: Self, key: collections.abc.Sequence[int], /) -> Self: ...
+
+    def __getitem__(self, key, /):
+        """Return period at key, or series of slice, index array or mask."""
+        if isinstance(key, collections.abc.Sequence):
+            key = np.asarray(key) if key else np.empty(0, dtype=np.intp)
+
+        if isinstance(key, slice | np.ndarray):
+            return dataclasses.replace(
+                self,
+                starts=self.starts[key],
+                ends=self.ends[key],
+            )
+
+        key = operator.index(key)
+        return Period(self._moment(self.starts[key]), self._moment(self.ends[key]))
+
+    def __iter__(self: Self) -> collections.abc.Iterator[Period]:
+        """Return iterator over periods."""
+        moment = self._moment
+        for start, end in zip(self.starts.tolist(), self.ends.tolist(), strict=True):
+            yield Period(moment(start), moment(end))
+
+    def __contains__(self: Self, item: object) -> bool:
+        """Return True if item is equal to one of the periods."""
+        if not (
+            isinstance(item, Period) and is_aware(item.start) and is_aware(item.end)
+        ):
+            return False
+
+        return bool(
+            (
+                (self.starts == _epoch_microseconds(item.start))
+                & (self.ends == _epoch_microseconds(item.end))
+            ).any(),
+        )
+
+    @property
+    def duration(self: Self) -> "npt.NDArray[np.int64]":
+        """Durations of periods in microseconds."""
+        return self.ends - self.starts
+
+    @property
+    def midpoint(self: Self) -> "npt.NDArray[np.int64]":
+        """Midpoints of periods in microseconds since the Unix epoch.
+
+        Half microseconds are rounded to even, like by Period.midpoint.
+        """
+        duration = self.duration
+        half = duration // 2
+        return self.starts + half + (duration & half & 1)
+
+    def contains(
+        self: Self,
+        item: Period | datetime.datetime,
+        /,
+        *,
+        assumed_tz: datetime.tzinfo | None = None,
+    ) -> "npt.NDArray[np.bool_]":
+        """Return mask of periods containing item, see Period.__contains__.
+
+        Naive datetimes are interpreted in assumed_tz, see ensure_aware.
+        """
+        if isinstance(item, Period):
+            start = _epoch_microseconds(item.start, assumed_tz)
+            end = _epoch_microseconds(item.end, assumed_tz)
+        else:
+            start = end = _epoch_microseconds(item, assumed_tz)
+
+        return (self.starts <= start) & (end <= self.ends)
+
+    def argsort(self: Self) -> "npt.NDArray[np.intp]":
+        """Return indices sorting periods by start and end, stable for equal ones."""
+        return np.lexsort((self.ends, self.starts))
+
+    def sorted(self: Self) -> Self:
+        """Return series of periods sorted by start and end."""
+        return self[self.argsort()]
+
+    def _moment(self: Self, microseconds: int, /) -> datetime.datetime:
+        return (_EPOCH + datetime.timedelta(microseconds=int(microseconds))).astimezone(
+            self.tzinfo,
+        )
+
+
+def _epoch_microseconds(
+    moment: datetime.datetime,
+    assumed_tz: datetime.tzinfo | None = None,
+    /,
+) -> int:
+    return (ensure_aware(moment, assumed_tz=assumed_tz) - _EPOCH) // _MICROSECOND
+
+
+__all__ = [
+    "PeriodSeries",
+]
@@ -0,0 +1,247 @@
+"""Set of datetime periods with union, intersection, difference and complement.
+
+Periods are coalesced into sorted, disjoint periods of positive duration, merging
+overlapping and adjacent ones in O(n log n). Set operations are linear-time sweeps
+over the periods of both operands.
+
+Periods are closed, like in Period.__contains__, but set operations disregard
+boundaries: differences and complements end and start at the boundaries of removed
+periods, and periods of zero duration are dropped.
+
+Examples
+--------
+>>> availability = PeriodSet([
+...     Period(datetime.datetime(2022, 1, 1, 8), datetime.datetime(2022, 1, 1, 12)),
+...     Period(datetime.datetime(2022, 1, 1, 10), datetime.datetime(2022, 1, 1, 14)),
+...     Period(datetime.datetime(2022, 1, 1, 16), datetime.datetime(2022, 1, 1, 18)),
+... ])
+>>> len(availability), availability.duration
+(2, datetime.timedelta(seconds=28800))
+>>> outages = PeriodSet([
+...     Period(datetime.datetime(2022, 1, 1, 9), datetime.datetime(2022, 1, 1, 17)),
+... ])
+>>> [(period.start.hour, period.end.hour) for period in availability - outages]
+[(8, 9), (17, 18)]
+>>> [(period.start.hour, period.end.hour) for period in availability & outages]
+[(9, 14), (16, 17)]
+>>> [(period.start.hour, period.end.hour) for period in availability.complement(
+...     Period(datetime.datetime(2022, 1, 1), datetime.datetime(2022, 1, 2)),
+... )]
+[(0, 8), (14, 16), (18, 0)]
+>>> datetime.datetime(2022, 1, 1, 14) in availability
+True
+
+
+"""
+
+import bisect
+import collections.abc
+import datetime
+import heapq
+import operator
+import sys
+import typing
+
+from .period import Period
+
+if sys.version_info >= (3, 11):
+    from typing import Self  # pragma: no cover
+else:
+    from typing_extensions import Self  # pragma: no cover
+
+_START: typing.Final = operator.attrgetter("start")
+
+
+class PeriodSet(collections.abc.Sequence[Period]):
+    """Immutable sequence of disjoint periods of positive duration, ordered by start.
+
+    Contains the datetimes and periods that one of its periods contains.
+    """
+
+    __slots__ = ("_periods", "_starts")
+
+    def __init__(
+        self: Self,
+        periods: collections.abc.Iterable[Period] = (),
+        /,
+    ) -> None:
+        """Initialize set of periods, which must not end before they start."""
+        periods = sorted(periods, key=_START)
+        for period in periods:
+            if period.end < period.start:
+                msg: str = f"expected period ending after its start, got {period!r}"
+                raise ValueError(msg)
+
+        self._periods: list[Period] = _coalesced(periods)
+        self._starts: list[datetime.datetime] = [
+            period.start for period in self._periods
+        ]
+
+    @classmethod
+    def _from_disjoint(cls: type[Self], periods: list[Period], /) -> Self:
+        """Return set of sorted, disjoint periods of positive duration as they are."""
+        period_set = cls.__new__(cls)
+        period_set._periods = periods  # noqa: SLF001
+        period_set._starts = [period.start for period in periods]  # noqa: SLF001
+        return period_set
+
+    def __repr__(self: Self) -> str:
+        """Return repr(self)."""
+        return f"{type(self).__name__}({self._periods!r})"
+
+    def __len__(self: Self) -> int:
+        """Return number of periods."""
+        return len(self._periods)
+
+    def __iter__(self: Self) -> collections.abc.Iterator[Period]:
+        """Return iterator over periods ordered by start."""
+        return iter(self._periods)
+
+    @typing.overload
+    def __getitem__(self: Self, index: int, /) -> Period: ...
+
+    @typing.overload
+    def __getitem__(self: Self, index: slice, /) -> list[Period]: ...
+
+    def __getitem__(self, index, /):
+        """Return period at index, or list of periods of slice."""
+        return self._periods[index]
+
+    def __contains__(self: Self, item: object) -> bool:
+        """Return True if item is in one of the periods, in O(log n)."""
+        match item:
+            case Period():
+                start = item.start
+            case datetime.datetime():
+                start = item
+            case _:
+                msg: str = (
+                    f"expected peprock.dt.Period | datetime.datetime, got {item!r}"
+                )
+                raise TypeError(msg)
+
+        index = bisect.bisect_right(self._starts, start)
+        return bool(index) and item in self._periods[index - 1]
+
+    def __eq__(self: Self, other: object) -> bool:
+        """Return self == other."""
+        if not isinstance(other, PeriodSet):
+            return NotImplemented
+
+        return self._periods == other._periods
+
+    def __hash__(self: Self) -> int:
+        """Return hash(self)."""
+        return hash(tuple(self._periods))
+
+    @property
+    def duration(self: Self) -> datetime.timedelta:
+        """Return total duration of periods."""
+        return sum(
+            (period.duration for period in self._periods),
+            datetime.timedelta(),
+        )
+
+    def union(self: Self, other: collections.abc.Iterable[Period], /) -> Self:
+        """Return set of periods in self or other."""
+        return self._from_disjoint(
+            _coalesced(heapq.merge(self._periods, _disjoint(other), key=_START)),
+        )
+
+    def intersection(self: Self, other: collections.abc.Iterable[Period], /) -> Self:
+        """Return set of periods in both self and other."""
+        periods = self._periods
+        others = _disjoint(other)
+        result: list[Period] = []
+        index = other_index = 0
+        while index < len(periods) and other_index < len(others):
+            period = periods[index]
+            other_period = others[other_index]
+            start = max(period.start, other_period.start)
+            end = min(period.end, other_period.end)
+            if start < end:
+                result.append(Period(start, end))
+
+            if period.end < other_period.end:
+                index += 1
+            else:
+                other_index += 1
+
+        return self._from_disjoint(result)
+
+    def difference(self: Self, other: collections.abc.Iterable[Period], /) -> Self:
+        """Return set of periods in self but not in other."""
+        others = _disjoint(other)
+        result: list[Period] = []
+        other_index = 0
+        for period in self._periods:
+            # skip other periods ending before period, which later periods start after
+            while other_index < len(others) and others[other_index].end <= period.start:
+                other_index += 1
+
+            start = period.start
+            index = other_index
+            while index < len(others) and others[index].start < period.end:
+                if start < others[index].start:
+                    result.append(Period(start, others[index].start))
+
+                start = max(start, others[index].end)
+                index += 1
+
+            if start < period.end:
+                result.append(
+                    period if start == period.start else Period(start, period.end),
+                )
+
+        return self._from_disjoint(result)
+
+    def complement(self: Self, bounds: Period, /) -> Self:
+        """Return set of periods within bounds not in self."""
+        return type(self)((bounds,)).difference(self)
+
+    def __or__(self: Self, other: object) -> Self:
+        """Return self | other."""
+        if not isinstance(other, PeriodSet):
+            return NotImplemented
+
+        return self.union(other)
+
+    def __and__(self: Self, other: object) -> Self:
+        """Return self & other."""
+        if not isinstance(other, PeriodSet):
+            return NotImplemented
+
+        return self.intersection(other)
+
+    def __sub__(self: Self, other: object) -> Self:
+        """Return self - other."""
+        if not isinstance(other, PeriodSet):
+            return NotImplemented
+
+        return self.difference(other)
+
+
+def _disjoint(periods: collections.abc.Iterable[Period], /) -> list[Period]:
+    """Return sorted, disjoint periods of positive duration, coalescing if needed."""
+    if isinstance(periods, PeriodSet):
+        return periods._periods  # noqa: SLF001
+
+    return PeriodSet(periods)._periods  # noqa: SLF001
+
+
+def _coalesced(periods: collections.abc.Iterable[Period], /) -> list[Period]:
+    """Return periods ordered by start coalesced, merging overlapping and adjacent."""
+    result: list[Period] = []
+    for period in periods:
+        if result and period.start <= result[-1].end:
+            if result[-1].end < period.end:
+                result[-1] = Period(result[-1].start, period.end)
+        elif period.start < period.end:
+            result.append(period)
+
+    return result
+
+
+__all__ = [
+    "PeriodSet",
+]
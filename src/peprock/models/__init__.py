@@ -1,16 +1,87 @@
-"""General purpose model classes."""
+"""General purpose model classes.
 
+MeasurementArray requires the optional numpy dependency, MeasurementDtype and its
+extension array and Arrow type the optional pandas dependency. They are imported lazily.
+"""
+
+import importlib
 import importlib.metadata
+import typing
 
-from .measurement import Measurement
+from .aggregation import (
+    MeasurementStatistics,
+    maximum,
+    mean,
+    minimum,
+    total,
+    weighted_mean,
+)
+from .codec import pack, pack_many, unpack, unpack_many
+from .conversion import conversion_plan, register_conversion
+from .expression import Expression, lazy
+from .integration import integrate, integrate_periods
+from .measurement import Measurement, decimal_context
+from .measurement_series import MeasurementSeries
 from .metric_prefix import MetricPrefix
-from .unit import Unit
+from .sorted_measurements import SortedMeasurements
+from .unit import CompoundUnit, Unit
+
+if typing.TYPE_CHECKING:
+    from .measurement_array import MeasurementArray
+    from .measurement_dtype import (
+        MeasurementArrowType,
+        MeasurementDtype,
+        MeasurementExtensionArray,
+    )
 
 __version__ = importlib.metadata.version("peprock")
 
+
+# attributes requiring optional dependencies, by module
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "MeasurementArray": ".measurement_array",
+    "MeasurementArrowType": ".measurement_dtype",
+    "MeasurementDtype": ".measurement_dtype",
+    "MeasurementExtensionArray": ".measurement_dtype",
+}
+
+
+def __getattr__(name: str) -> typing.Any:  # noqa: ANN401
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(_LAZY_ATTRIBUTES[name], __name__)
+        return getattr(module, name)
+
+    msg: str = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
 __all__ = [
+    "CompoundUnit",
+    "Expression",
     "Measurement",
+    "MeasurementArray",
+    "MeasurementArrowType",
+    "MeasurementDtype",
+    "MeasurementExtensionArray",
+    "MeasurementSeries",
+    "MeasurementStatistics",
     "MetricPrefix",
+    "SortedMeasurements",
     "Unit",
     "__version__",
+    "conversion_plan",
+    "decimal_context",
+    "integrate",
+    "integrate_periods",
+    "lazy",
+    "maximum",
+    "mean",
+    "minimum",
+    "pack",
+    "pack_many",
+    "register_conversion",
+    "total",
+    "unpack",
+    "unpack_many",
+    "weighted_mean",
 ]
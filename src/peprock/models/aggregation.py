@@ -0,0 +1,636 @@
+"""Aggregation functions and streaming statistics of measurements.
+
+Unlike the builtin sum, min and max, prefixes are aligned once per distinct prefix
+rather than once per measurement and no intermediate measurements are created.
+Magnitudes are accumulated exactly: float with math.fsum, decimal.Decimal in a single
+context of unlimited precision and rounded once in the current context, int and
+fractions.Fraction as they are.
+
+Examples
+--------
+>>> total([Measurement(0.1, unit=Unit.watt)] * 10)
+Measurement(magnitude=1.0, prefix=<MetricPrefix.NONE: 0>, unit=<Unit.watt: 'W'>)
+
+>>> mean([Measurement(1, MetricPrefix.kilo), Measurement(500)])
+Measurement(magnitude=750.0, prefix=<MetricPrefix.NONE: 0>, unit=None)
+
+>>> maximum([Measurement(1, MetricPrefix.kilo), Measurement(500)])
+Measurement(magnitude=1, prefix=<MetricPrefix.kilo: 3>, unit=None)
+
+>>> weighted_mean([Measurement(10), Measurement(40)], [3, 1])
+Measurement(magnitude=17.5, prefix=<MetricPrefix.NONE: 0>, unit=None)
+
+>>> statistics = MeasurementStatistics().update(
+...     Measurement(magnitude, MetricPrefix.kilo, Unit.watt) for magnitude in range(101)
+... )
+>>> statistics.mean
+Measurement(magnitude=50.0, prefix=<MetricPrefix.kilo: 3>, unit=<Unit.watt: 'W'>)
+
+>>> other = MeasurementStatistics().update([Measurement(1e6, unit=Unit.watt)])
+>>> statistics.merge(other).maximum
+Measurement(magnitude=1000.0, prefix=<MetricPrefix.kilo: 3>, unit=<Unit.watt: 'W'>)
+
+
+"""
+
+from __future__ import annotations
+
+import decimal
+import heapq
+import itertools
+import math
+import operator
+import typing
+
+from .conversion import conversion_plan
+from .measurement import Measurement
+from .metric_prefix import MetricPrefix
+from .unit import CompoundUnit, Unit  # noqa: TC001
+
+if typing.TYPE_CHECKING:
+    import collections.abc
+    import fractions
+    import sys
+
+    if sys.version_info >= (3, 11):
+        from typing import Self
+    else:
+        from typing_extensions import Self
+
+    _MagnitudeT = typing.TypeVar(
+        "_MagnitudeT",
+        int,
+        float,
+        decimal.Decimal,
+        fractions.Fraction,
+    )
+    _NumberT = typing.TypeVar(
+        "_NumberT",
+        float,
+        decimal.Decimal,
+        fractions.Fraction,
+    )
+
+_BASE: typing.Final[int] = 10
+
+# additions and multiplications of finite decimals are exact in this context
+_EXACT_CONTEXT: typing.Final[decimal.Context] = decimal.Context(
+    prec=decimal.MAX_PREC,
+    Emax=decimal.MAX_EMAX,
+    Emin=decimal.MIN_EMIN,
+)
+
+
+def total(
+    measurements: collections.abc.Iterable[Measurement[_MagnitudeT]],
+    /,
+) -> Measurement[_MagnitudeT]:
+    """Return sum of measurements in the smallest of their prefixes."""
+    context = decimal.getcontext()
+    with decimal.localcontext(_EXACT_CONTEXT):
+        magnitude, prefix, unit, _ = _aggregate(
+            zip(measurements, itertools.repeat(None)),
+        )
+
+    if isinstance(magnitude, decimal.Decimal):
+        magnitude = context.plus(magnitude)
+
+    return Measurement(magnitude, prefix, unit)
+
+
+@typing.overload
+def mean(
+    measurements: collections.abc.Iterable[Measurement[int]],
+    /,
+) -> Measurement[float]: ...
+
+
+@typing.overload
+def mean(
+    measurements: collections.abc.Iterable[Measurement[_NumberT]],
+    /,
+) -> Measurement[_NumberT]: ...
+
+
+def mean(measurements, /):
+    """Return arithmetic mean of measurements in the smallest of their prefixes."""
+    context = decimal.getcontext()
+    with decimal.localcontext(_EXACT_CONTEXT):
+        magnitude, prefix, unit, count = _aggregate(
+            zip(measurements, itertools.repeat(None)),
+        )
+
+    return Measurement(_divide(magnitude, count, context), prefix, unit)
+
+
+def weighted_mean(
+    measurements: collections.abc.Iterable[Measurement[typing.Any]],
+    weights: collections.abc.Iterable[
+        int | float | decimal.Decimal | fractions.Fraction
+    ],
+    /,
+) -> Measurement[typing.Any]:
+    """Return mean of measurements weighted by numbers of equal length."""
+    context = decimal.getcontext()
+    with decimal.localcontext(_EXACT_CONTEXT):
+        magnitude, prefix, unit, total_weight = _aggregate(
+            zip(measurements, weights, strict=True),
+        )
+
+    if not total_weight:
+        msg: str = f"expected nonzero total weight, got {total_weight!r}"
+        raise ValueError(msg)
+
+    return Measurement(_divide(magnitude, total_weight, context), prefix, unit)
+
+
+def minimum(
+    measurements: collections.abc.Iterable[Measurement[_MagnitudeT]],
+    /,
+) -> Measurement[_MagnitudeT]:
+    """Return smallest measurement, compared across prefixes."""
+    return _extremum(measurements, operator.lt)
+
+
+def maximum(
+    measurements: collections.abc.Iterable[Measurement[_MagnitudeT]],
+    /,
+) -> Measurement[_MagnitudeT]:
+    """Return largest measurement, compared across prefixes."""
+    return _extremum(measurements, operator.gt)
+
+
+class MeasurementStatistics:
+    """Streaming statistics of measurements in a single pass with bounded memory.
+
+    Measurements are converted to the prefix and unit of the first measurement added.
+    The sum is compensated (Neumaier), mean and variance are updated with Welford's
+    algorithm, and quantiles are estimated by a logarithmic sketch (DDSketch) with
+    bounded relative error, whose bins divide decades evenly so that changes of
+    prefix shift bins exactly. Statistics of partial streams, e.g. from other processes,
+    can be merged.
+    """
+
+    __slots__ = (
+        "_bins_per_decade",
+        "_compensation",
+        "_count",
+        "_max_bins",
+        "_maximum",
+        "_mean",
+        "_minimum",
+        "_multiplier",
+        "_negative_bins",
+        "_positive_bins",
+        "_prefix",
+        "_relative_accuracy",
+        "_squared_deviations",
+        "_sum",
+        "_unit",
+        "_zero_count",
+    )
+
+    def __init__(
+        self: MeasurementStatistics,
+        *,
+        relative_accuracy: float = 0.01,
+        max_bins: int = 2048,
+    ) -> None:
+        """Initialize empty statistics.
+
+        Quantiles are accurate to relative_accuracy as long as no more than max_bins
+        sketch bins are needed, after which the bins closest to zero are collapsed.
+        They are collapsed in batches of up to an eighth of max_bins, so that adding
+        measurements takes amortized logarithmic time.
+        """
+        if not 0 < relative_accuracy < 1:
+            msg: str = (
+                f"expected relative accuracy between 0 and 1, got {relative_accuracy!r}"
+            )
+            raise ValueError(msg)
+
+        if max_bins < 1:
+            msg = f"expected positive max bins, got {max_bins!r}"
+            raise ValueError(msg)
+
+        self._relative_accuracy: float = relative_accuracy
+        self._max_bins: int = max_bins
+        self._bins_per_decade: int = math.ceil(
+            math.log(_BASE)
+            / math.log((1 + relative_accuracy) / (1 - relative_accuracy)),
+        )
+        self._multiplier: float = self._bins_per_decade / math.log(_BASE)
+        self._prefix: MetricPrefix = MetricPrefix.NONE
+        self._unit: Unit | CompoundUnit | str | None = None
+        self._count: int = 0
+        self._sum: float = 0.0
+        self._compensation: float = 0.0
+        self._mean: float = 0.0
+        self._squared_deviations: float = 0.0
+        self._minimum: float = math.inf
+        self._maximum: float = -math.inf
+        self._positive_bins: dict[int, int] = {}
+        self._negative_bins: dict[int, int] = {}
+        self._zero_count: int = 0
+
+    def add(
+        self: MeasurementStatistics,
+        measurement: Measurement[typing.Any],
+        /,
+    ) -> None:
+        """Add measurement, converted to prefix and unit of the statistics."""
+        if not self._count:
+            value = float(measurement.magnitude)
+        elif measurement.unit == self._unit:
+            value = measurement.prefix.convert(
+                float(measurement.magnitude),
+                self._prefix,
+            )
+        else:
+            factor, offset = self._conversion_plan(measurement.unit, measurement.prefix)
+            value = float(measurement.magnitude) * factor + offset
+
+        if not math.isfinite(value):
+            msg: str = f"expected finite magnitude, got {measurement.magnitude!r}"
+            raise ValueError(msg)
+
+        if not self._count:
+            self._prefix = measurement.prefix
+            self._unit = measurement.unit
+
+        self._count += 1
+        self._add_to_sum(value)
+        delta = value - self._mean
+        self._mean += delta / self._count
+        self._squared_deviations += delta * (value - self._mean)
+        self._minimum = min(self._minimum, value)
+        self._maximum = max(self._maximum, value)
+        self._add_to_sketch(value, 1)
+
+    def update(
+        self: Self,
+        measurements: collections.abc.Iterable[Measurement[typing.Any]],
+        /,
+    ) -> Self:
+        """Add measurements, consuming the iterable once, and return self."""
+        add = self.add
+        for measurement in measurements:
+            add(measurement)
+
+        return self
+
+    def merge(self: Self, other: MeasurementStatistics, /) -> Self:
+        """Merge statistics of other into self and return self.
+
+        Other is converted to the prefix and unit of self. The sketch of other is
+        shifted exactly if only the prefix differs, else it is rebucketed, adding up
+        to the relative accuracy to its error.
+        """
+        if other._relative_accuracy != self._relative_accuracy:
+            msg: str = (
+                "expected statistics of equal relative accuracy, got "
+                f"{self._relative_accuracy!r} and {other._relative_accuracy!r}"
+            )
+            raise ValueError(msg)
+
+        if not other._count:
+            return self
+
+        if not self._count:
+            self._prefix = other._prefix
+            self._unit = other._unit
+            factor, offset = 1.0, 0.0
+        else:
+            factor, offset = self._conversion_plan(
+                other._unit,
+                other._prefix,
+            )
+
+        self._merge(other, factor, offset)
+        return self
+
+    @property
+    def count(self: MeasurementStatistics) -> int:
+        """Number of measurements added."""
+        return self._count
+
+    @property
+    def total(self: MeasurementStatistics) -> Measurement[float]:
+        """Sum of measurements."""
+        return self._measurement(self._sum + self._compensation)
+
+    @property
+    def mean(self: MeasurementStatistics) -> Measurement[float]:
+        """Arithmetic mean of measurements."""
+        return self._measurement(self._mean)
+
+    @property
+    def minimum(self: MeasurementStatistics) -> Measurement[float]:
+        """Smallest measurement."""
+        return self._measurement(self._minimum)
+
+    @property
+    def maximum(self: MeasurementStatistics) -> Measurement[float]:
+        """Largest measurement."""
+        return self._measurement(self._maximum)
+
+    @property
+    def variance(self: MeasurementStatistics) -> float:
+        """Population variance of magnitudes, in squared prefix and unit."""
+        self._check_count()
+        return self._squared_deviations / self._count
+
+    @property
+    def standard_deviation(self: MeasurementStatistics) -> Measurement[float]:
+        """Population standard deviation of measurements."""
+        return self._measurement(math.sqrt(self.variance))
+
+    def quantile(self: MeasurementStatistics, q: float, /) -> Measurement[float]:
+        """Return estimated q-quantile, accurate to the relative accuracy.
+
+        The quantiles 0 and 1 are the exact minimum and maximum.
+        """
+        if not 0 <= q <= 1:
+            msg: str = f"expected quantile between 0 and 1, got {q!r}"
+            raise ValueError(msg)
+
+        if q == 0:
+            return self.minimum
+
+        if q == 1:
+            return self.maximum
+
+        rank = q * (self._count - 1)
+        cumulative = 0
+        value = self._maximum
+        for value, count in self._sketch():  # noqa: B007
+            cumulative += count
+            if cumulative > rank:
+                break
+
+        return self._measurement(min(max(value, self._minimum), self._maximum))
+
+    def _measurement(
+        self: MeasurementStatistics,
+        value: float,
+        /,
+    ) -> Measurement[float]:
+        self._check_count()
+        return Measurement(value, self._prefix, self._unit)
+
+    def _check_count(self: MeasurementStatistics) -> None:
+        if not self._count:
+            msg: str = "expected at least one measurement"
+            raise ValueError(msg)
+
+    def _conversion_plan(
+        self: MeasurementStatistics,
+        unit: Unit | CompoundUnit | str | None,
+        prefix: MetricPrefix,
+        /,
+    ) -> tuple[float, float]:
+        plan = conversion_plan(
+            unit,
+            self._unit,
+            source_prefix=prefix,
+            target_prefix=self._prefix,
+        )
+        if plan is None:
+            msg: str = f"cannot convert {unit!r} to {self._unit!r}"
+            raise ValueError(msg)
+
+        return plan
+
+    def _merge(
+        self: MeasurementStatistics,
+        other: MeasurementStatistics,
+        factor: float,
+        offset: float,
+        /,
+    ) -> None:
+        # combine moments as described by Chan et al., after converting other
+        count = self._count + other._count
+        other_mean = other._mean * factor + offset
+        delta = other_mean - self._mean
+        self._squared_deviations += (
+            other._squared_deviations * factor * factor
+            + delta * delta * self._count * other._count / count
+        )
+        self._mean += delta * other._count / count
+        for value in (
+            other._sum * factor + other._count * offset,
+            other._compensation * factor,
+        ):
+            self._add_to_sum(value)
+
+        self._count = count
+        self._minimum = min(
+            self._minimum,
+            other._minimum * factor + offset,
+            other._maximum * factor + offset,
+        )
+        self._maximum = max(
+            self._maximum,
+            other._minimum * factor + offset,
+            other._maximum * factor + offset,
+        )
+        if other._unit == self._unit:
+            shift = (other._prefix - self._prefix) * self._bins_per_decade
+            for bins, other_bins in (
+                (self._positive_bins, other._positive_bins),
+                (self._negative_bins, other._negative_bins),
+            ):
+                for key, bin_count in other_bins.items():
+                    bins[key + shift] = bins.get(key + shift, 0) + bin_count
+
+                self._collapse(bins)
+
+            self._zero_count += other._zero_count
+        else:
+            for value, bin_count in other._sketch():
+                self._add_to_sketch(value * factor + offset, bin_count)
+
+    def _add_to_sum(self: MeasurementStatistics, value: float, /) -> None:
+        # Neumaier's compensated summation
+        total = self._sum + value
+        if abs(self._sum) >= abs(value):
+            self._compensation += (self._sum - total) + value
+        else:
+            self._compensation += (value - total) + self._sum
+
+        self._sum = total
+
+    def _add_to_sketch(
+        self: MeasurementStatistics,
+        value: float,
+        count: int,
+        /,
+    ) -> None:
+        if value > 0:
+            bins = self._positive_bins
+        elif value < 0:
+            bins = self._negative_bins
+            value = -value
+        else:
+            self._zero_count += count
+            return
+
+        key = math.ceil(math.log(value) * self._multiplier)
+        try:
+            bins[key] += count
+        except KeyError:
+            bins[key] = count
+            self._collapse(bins)
+
+    def _collapse(self: MeasurementStatistics, bins: dict[int, int], /) -> None:
+        # merge the bins closest to zero, keeping the tails accurate, leaving room
+        # for an eighth of max_bins new bins before collapsing again
+        if len(bins) <= self._max_bins:
+            return
+
+        excess = len(bins) - self._max_bins + self._max_bins // 8
+        *keys, key = heapq.nsmallest(excess + 1, bins)
+        bins[key] += sum(map(bins.pop, keys))
+
+    def _sketch(
+        self: MeasurementStatistics,
+    ) -> collections.abc.Iterator[tuple[float, int]]:
+        """Yield representative value and count of sketch bins in ascending order."""
+        gamma = _BASE ** (1 / self._bins_per_decade)
+        for key in sorted(self._negative_bins, reverse=True):
+            yield -2 * gamma**key / (gamma + 1), self._negative_bins[key]
+
+        if self._zero_count:
+            yield 0.0, self._zero_count
+
+        for key in sorted(self._positive_bins):
+            yield 2 * gamma**key / (gamma + 1), self._positive_bins[key]
+
+
+def _check_unit(
+    unit: Unit | CompoundUnit | str | None,
+    measurement: Measurement[typing.Any],
+    /,
+) -> None:
+    if measurement.unit != unit:
+        msg: str = (
+            f"expected measurements sharing a unit, got {unit!r} "
+            f"and {measurement.unit!r}"
+        )
+        raise ValueError(msg)
+
+
+def _sum(values: list[typing.Any], /) -> typing.Any:  # noqa: ANN401
+    types: set[type] = set(map(type, values))
+    if any(issubclass(type_, float) for type_ in types):
+        # math.fsum would silently round decimals, which arithmetic refuses to do
+        if any(issubclass(type_, decimal.Decimal) for type_ in types):
+            msg: str = "unsupported magnitude types: 'float' and 'decimal.Decimal'"
+            raise TypeError(msg)
+
+        return math.fsum(values)
+
+    return sum(values)
+
+
+def _aggregate(
+    pairs: collections.abc.Iterable[tuple[Measurement[typing.Any], typing.Any]],
+    /,
+) -> tuple[typing.Any, MetricPrefix, Unit | CompoundUnit | str | None, typing.Any]:
+    """Return sum of optionally weighted magnitudes, prefix, unit and denominator.
+
+    The denominator is the number of measurements if unweighted, else the sum of
+    weights. Must be called in an exact decimal context.
+    """
+    groups: dict[MetricPrefix, list[typing.Any]] = {}
+    weights: list[typing.Any] = []
+    unit: Unit | CompoundUnit | str | None = None
+    count = 0
+    for count, (measurement, weight) in enumerate(pairs, start=1):
+        if count == 1:
+            unit = measurement.unit
+        else:
+            _check_unit(unit, measurement)
+
+        try:
+            magnitudes = groups[measurement.prefix]
+        except KeyError:
+            magnitudes = groups[measurement.prefix] = []
+
+        if weight is None:
+            magnitudes.append(measurement.magnitude)
+        else:
+            magnitudes.append(weight * measurement.magnitude)
+            weights.append(weight)
+
+    if not count:
+        msg: str = "expected at least one measurement"
+        raise ValueError(msg)
+
+    prefix = min(groups)
+    sums = [
+        group_prefix.convert(_sum(magnitudes), prefix)
+        for group_prefix, magnitudes in groups.items()
+    ]
+    return (
+        sums[0] if len(sums) == 1 else _sum(sums),
+        prefix,
+        unit,
+        _sum(weights) if weights else count,
+    )
+
+
+def _divide(
+    numerator: typing.Any,  # noqa: ANN401
+    denominator: typing.Any,  # noqa: ANN401
+    context: decimal.Context,
+    /,
+) -> typing.Any:  # noqa: ANN401
+    if isinstance(numerator, decimal.Decimal) or isinstance(
+        denominator,
+        decimal.Decimal,
+    ):
+        return context.divide(numerator, denominator)
+
+    return numerator / denominator
+
+
+def _extremum(
+    measurements: collections.abc.Iterable[Measurement[_MagnitudeT]],
+    compare: collections.abc.Callable[[typing.Any, typing.Any], bool],
+    /,
+) -> Measurement[_MagnitudeT]:
+    # compare magnitudes within each prefix, and measurements across prefixes once
+    extrema: dict[MetricPrefix, Measurement[_MagnitudeT]] = {}
+    unit: Unit | CompoundUnit | str | None = None
+    for index, measurement in enumerate(measurements):
+        if not index:
+            unit = measurement.unit
+        else:
+            _check_unit(unit, measurement)
+
+        extremum = extrema.get(measurement.prefix)
+        if extremum is None or compare(measurement.magnitude, extremum.magnitude):
+            extrema[measurement.prefix] = measurement
+
+    if not extrema:
+        msg: str = "expected at least one measurement"
+        raise ValueError(msg)
+
+    others = iter(extrema.values())
+    result = next(others)
+    for other in others:
+        if compare(other, result):
+            result = other
+
+    return result
+
+
+__all__ = [
+    "MeasurementStatistics",
+    "maximum",
+    "mean",
+    "minimum",
+    "total",
+    "weighted_mean",
+]
@@ -0,0 +1,436 @@
+"""Compact binary codec for measurements.
+
+A measurement is packed as its prefix exponent (int8), a unit id (uint16) and a
+magnitude tag (uint8), followed by the magnitude: int64 or float64, or a variable
+length encoding of large ints, decimal.Decimal and fractions.Fraction. Compound and
+str units are appended to the header. All values are little-endian.
+
+Batches consist of runs of measurements sharing prefix, unit and magnitude type,
+each packed as one header, a count (uint32) and the magnitudes, so that int64 and
+float64 magnitudes are contiguous and unpacked from a memoryview without copying.
+
+Examples
+--------
+>>> data = pack(Measurement(1.5, MetricPrefix.kilo, Unit.watt))
+>>> len(data)
+12
+>>> unpack(data)
+Measurement(magnitude=1.5, prefix=<MetricPrefix.kilo: 3>, unit=<Unit.watt: 'W'>)
+
+>>> data = pack_many(Measurement(magnitude, unit=Unit.joule) for magnitude in range(3))
+>>> len(data)
+32
+>>> unpack_many(data)[-1]
+Measurement(magnitude=2, prefix=<MetricPrefix.NONE: 0>, unit=<Unit.joule: 'J'>)
+
+
+"""
+
+from __future__ import annotations
+
+import decimal
+import fractions
+import functools
+import itertools
+import struct
+import typing
+
+from .measurement import Measurement
+from .metric_prefix import MetricPrefix
+from .unit import CompoundUnit, Unit
+
+if typing.TYPE_CHECKING:
+    import collections.abc
+
+_Buffer: typing.TypeAlias = bytes | bytearray | memoryview
+
+# unit ids are positions in this tuple and part of the format: append new units,
+# never reorder or remove them
+_UNITS: typing.Final[tuple[Unit | None, ...]] = (
+    None,
+    Unit.one,
+    Unit.second,
+    Unit.metre,
+    Unit.gram,
+    Unit.ampere,
+    Unit.kelvin,
+    Unit.mole,
+    Unit.candela,
+    Unit.hertz,
+    Unit.radian,
+    Unit.steradian,
+    Unit.newton,
+    Unit.pascal,
+    Unit.joule,
+    Unit.watt,
+    Unit.coulomb,
+    Unit.volt,
+    Unit.weber,
+    Unit.tesla,
+    Unit.farad,
+    Unit.ohm,
+    Unit.siemens,
+    Unit.henry,
+    Unit.degree_celsius,
+    Unit.lumen,
+    Unit.lux,
+    Unit.becquerel,
+    Unit.gray,
+    Unit.sievert,
+    Unit.katal,
+    Unit.hour,
+    Unit.watt_hour,
+)
+_UNIT_IDS: typing.Final[dict[Unit | None, int]] = {
+    unit: unit_id for unit_id, unit in enumerate(_UNITS)
+}
+_COMPOUND_UNIT_ID: typing.Final[int] = 0xFFFE
+_STR_UNIT_ID: typing.Final[int] = 0xFFFF
+
+_PREFIXES: typing.Final[dict[int, MetricPrefix]] = {
+    int(prefix): prefix for prefix in MetricPrefix
+}
+
+# magnitude tags
+_INT64: typing.Final[int] = 0
+_FLOAT64: typing.Final[int] = 1
+_INT: typing.Final[int] = 2
+_DECIMAL: typing.Final[int] = 3
+_DECIMAL_SPECIAL: typing.Final[int] = 4
+_FRACTION: typing.Final[int] = 5
+
+_HEADER: typing.Final[struct.Struct] = struct.Struct("<bHB")
+_RUN_HEADER: typing.Final[struct.Struct] = struct.Struct("<bHBI")
+_COMPOUND_UNIT_FACTOR: typing.Final[struct.Struct] = struct.Struct("<Hb")
+_INT64_STRUCT: typing.Final[struct.Struct] = struct.Struct("<q")
+_FLOAT64_STRUCT: typing.Final[struct.Struct] = struct.Struct("<d")
+_DECIMAL_STRUCT: typing.Final[struct.Struct] = struct.Struct("<Bi")
+_UINT8: typing.Final[struct.Struct] = struct.Struct("<B")
+_UINT16: typing.Final[struct.Struct] = struct.Struct("<H")
+_UINT32: typing.Final[struct.Struct] = struct.Struct("<I")
+_FIXED_WIDTH_STRUCTS: typing.Final[dict[int, struct.Struct]] = {
+    _INT64: _INT64_STRUCT,
+    _FLOAT64: _FLOAT64_STRUCT,
+}
+
+_INT8_MIN: typing.Final[int] = -(2**7)
+_INT8_MAX: typing.Final[int] = 2**7 - 1
+_INT32_MIN: typing.Final[int] = -(2**31)
+_INT32_MAX: typing.Final[int] = 2**31 - 1
+_INT64_MIN: typing.Final[int] = -(2**63)
+_INT64_MAX: typing.Final[int] = 2**63 - 1
+
+_object_new = object.__new__
+_object_setattr = object.__setattr__
+
+
+def pack(measurement: Measurement[typing.Any], /) -> bytes:
+    """Return measurement packed as bytes."""
+    unit_id, unit_extension = _pack_unit(measurement.unit)
+    tag = _tag(measurement.magnitude)
+    return (
+        _HEADER.pack(measurement.prefix, unit_id, tag)
+        + unit_extension
+        + _pack_magnitude(measurement.magnitude, tag)
+    )
+
+
+def unpack(data: _Buffer, /) -> Measurement[typing.Any]:
+    """Return measurement unpacked from bytes, see pack."""
+    view = memoryview(data).cast("B")
+    try:
+        exponent, unit_id, tag = _HEADER.unpack_from(view)
+        unit, offset = _unpack_unit(view, _HEADER.size, unit_id)
+        magnitude, offset = _unpack_magnitude(view, offset, tag)
+    except struct.error as exception:
+        raise _truncated() from exception
+
+    if offset != len(view):
+        msg: str = f"unexpected {len(view) - offset} trailing bytes"
+        raise ValueError(msg)
+
+    return _measurement(magnitude, _prefix(exponent), unit)
+
+
+def pack_many(
+    measurements: collections.abc.Iterable[Measurement[typing.Any]],
+    /,
+) -> bytes:
+    """Return measurements packed as batch of runs sharing prefix, unit and tag."""
+    chunks: list[bytes] = []
+    for (prefix, unit, tag), run in itertools.groupby(measurements, key=_run_key):
+        magnitudes = [measurement.magnitude for measurement in run]
+        unit_id, unit_extension = _pack_unit(unit)
+        chunks.append(_RUN_HEADER.pack(prefix, unit_id, tag, len(magnitudes)))
+        chunks.append(unit_extension)
+        if (fixed_width_struct := _FIXED_WIDTH_STRUCTS.get(tag)) is not None:
+            chunks.append(
+                struct.pack(
+                    f"<{len(magnitudes)}{fixed_width_struct.format[-1]}",
+                    *magnitudes,
+                ),
+            )
+        else:
+            chunks.extend(_pack_magnitude(magnitude, tag) for magnitude in magnitudes)
+
+    return b"".join(chunks)
+
+
+def unpack_many(data: _Buffer, /) -> list[Measurement[typing.Any]]:
+    """Return measurements unpacked from batch, see pack_many.
+
+    Runs of int64 and float64 magnitudes are unpacked from a memoryview of data
+    without copying it.
+    """
+    view = memoryview(data).cast("B")
+    measurements: list[Measurement[typing.Any]] = []
+    offset = 0
+    try:
+        while offset < len(view):
+            exponent, unit_id, tag, count = _RUN_HEADER.unpack_from(view, offset)
+            prefix = _prefix(exponent)
+            unit, offset = _unpack_unit(view, offset + _RUN_HEADER.size, unit_id)
+            if (fixed_width_struct := _FIXED_WIDTH_STRUCTS.get(tag)) is not None:
+                stop = offset + count * fixed_width_struct.size
+                if stop > len(view):
+                    raise _truncated()
+
+                measurements.extend(
+                    _measurement(magnitude, prefix, unit)
+                    for (magnitude,) in fixed_width_struct.iter_unpack(
+                        view[offset:stop],
+                    )
+                )
+                offset = stop
+            else:
+                for _ in range(count):
+                    magnitude, offset = _unpack_magnitude(view, offset, tag)
+                    measurements.append(_measurement(magnitude, prefix, unit))
+    except struct.error as exception:
+        raise _truncated() from exception
+
+    return measurements
+
+
+def _measurement(
+    magnitude: typing.Any,  # noqa: ANN401
+    prefix: MetricPrefix,
+    unit: Unit | CompoundUnit | str | None,
+    /,
+) -> Measurement[typing.Any]:
+    """Return measurement, skipping __init__ like Measurement._derive."""
+    measurement = _object_new(Measurement)
+    _object_setattr(measurement, "magnitude", magnitude)
+    _object_setattr(measurement, "prefix", prefix)
+    _object_setattr(measurement, "unit", unit)
+    return measurement
+
+
+def _truncated() -> ValueError:
+    return ValueError("truncated measurement data")
+
+
+def _prefix(exponent: int, /) -> MetricPrefix:
+    try:
+        return _PREFIXES[exponent]
+    except KeyError:
+        msg: str = f"invalid prefix exponent {exponent}"
+        raise ValueError(msg) from None
+
+
+def _run_key(
+    measurement: Measurement[typing.Any],
+    /,
+) -> tuple[MetricPrefix, Unit | CompoundUnit | str | None, int]:
+    return measurement.prefix, measurement.unit, _tag(measurement.magnitude)
+
+
+def _tag(magnitude: object, /) -> int:
+    match magnitude:
+        case int():
+            return _INT64 if _INT64_MIN <= magnitude <= _INT64_MAX else _INT
+        case float():
+            return _FLOAT64
+        case decimal.Decimal():
+            return _DECIMAL if magnitude.is_finite() else _DECIMAL_SPECIAL
+        case fractions.Fraction():
+            return _FRACTION
+
+    msg: str = f"unsupported magnitude type {type(magnitude).__name__!r}"
+    raise TypeError(msg)
+
+
+# bounded, since str units are arbitrary
+@functools.lru_cache(maxsize=256)
+def _pack_unit(unit: Unit | CompoundUnit | str | None, /) -> tuple[int, bytes]:
+    """Return unit id and header extension of unit."""
+    if isinstance(unit, CompoundUnit):
+        try:
+            return _COMPOUND_UNIT_ID, _UINT8.pack(len(unit.factors)) + b"".join(
+                _COMPOUND_UNIT_FACTOR.pack(_UNIT_IDS[unit_], exponent)
+                for unit_, exponent in unit.factors
+            )
+        except struct.error:
+            msg: str = (
+                f"expected compound unit exponents between {_INT8_MIN} and "
+                f"{_INT8_MAX}, got {unit!r}"
+            )
+            raise ValueError(msg) from None
+
+    if isinstance(unit, str):
+        return _STR_UNIT_ID, _pack_str(unit, _UINT16)
+
+    return _UNIT_IDS[unit], b""
+
+
+def _unpack_unit(
+    view: memoryview,
+    offset: int,
+    unit_id: int,
+    /,
+) -> tuple[Unit | CompoundUnit | str | None, int]:
+    if unit_id < len(_UNITS):
+        return _UNITS[unit_id], offset
+
+    if unit_id == _COMPOUND_UNIT_ID:
+        (count,) = _UINT8.unpack_from(view, offset)
+        offset += _UINT8.size
+        stop = offset + count * _COMPOUND_UNIT_FACTOR.size
+        factors: list[tuple[Unit, int]] = []
+        for factor_unit_id, exponent in _COMPOUND_UNIT_FACTOR.iter_unpack(
+            view[offset:stop],
+        ):
+            if not 0 < factor_unit_id < len(_UNITS):
+                msg: str = f"invalid compound unit factor id {factor_unit_id}"
+                raise ValueError(msg)
+
+            factors.append((typing.cast("Unit", _UNITS[factor_unit_id]), exponent))
+
+        return CompoundUnit(factors), stop
+
+    if unit_id == _STR_UNIT_ID:
+        return _unpack_str(view, offset, _UINT16)
+
+    msg = f"invalid unit id {unit_id}"
+    raise ValueError(msg)
+
+
+def _pack_magnitude(magnitude: typing.Any, tag: int, /) -> bytes:  # noqa: ANN401
+    if tag == _INT64:
+        return _INT64_STRUCT.pack(magnitude)
+
+    if tag == _FLOAT64:
+        return _FLOAT64_STRUCT.pack(magnitude)
+
+    if tag == _INT:
+        return _pack_int(magnitude)
+
+    if tag == _DECIMAL:
+        sign, digits, exponent = magnitude.as_tuple()
+        try:
+            header = _DECIMAL_STRUCT.pack(sign, exponent)
+        except struct.error:
+            msg: str = (
+                f"expected decimal exponent between {_INT32_MIN} and {_INT32_MAX}, "
+                f"got {exponent}"
+            )
+            raise ValueError(msg) from None
+
+        return header + _pack_int(int("".join(map(str, digits))))
+
+    if tag == _DECIMAL_SPECIAL:
+        return _pack_str(str(magnitude), _UINT8)
+
+    return _pack_int(magnitude.numerator) + _pack_int(magnitude.denominator)
+
+
+def _unpack_magnitude(
+    view: memoryview,
+    offset: int,
+    tag: int,
+    /,
+) -> tuple[typing.Any, int]:
+    if tag == _INT64:
+        return _INT64_STRUCT.unpack_from(view, offset)[0], offset + _INT64_STRUCT.size
+
+    if tag == _FLOAT64:
+        return (
+            _FLOAT64_STRUCT.unpack_from(view, offset)[0],
+            offset + _FLOAT64_STRUCT.size,
+        )
+
+    if tag == _INT:
+        return _unpack_int(view, offset)
+
+    if tag == _DECIMAL:
+        sign, exponent = _DECIMAL_STRUCT.unpack_from(view, offset)
+        coefficient, offset = _unpack_int(view, offset + _DECIMAL_STRUCT.size)
+        # construct from str, exactly and independent of the current context
+        return decimal.Decimal(f"{'-' * sign}{coefficient}E{exponent}"), offset
+
+    if tag == _DECIMAL_SPECIAL:
+        string, offset = _unpack_str(view, offset, _UINT8)
+        return decimal.Decimal(string), offset
+
+    if tag == _FRACTION:
+        numerator, offset = _unpack_int(view, offset)
+        denominator, offset = _unpack_int(view, offset)
+        if not denominator:
+            msg: str = "invalid fraction denominator 0"
+            raise ValueError(msg)
+
+        return fractions.Fraction(numerator, denominator), offset
+
+    msg = f"invalid magnitude tag {tag}"
+    raise ValueError(msg)
+
+
+def _pack_int(value: int, /) -> bytes:
+    # one more bit than the magnitude for the sign
+    length = (value.bit_length() + 8) // 8
+    return _UINT32.pack(length) + value.to_bytes(length, "little", signed=True)
+
+
+def _unpack_int(view: memoryview, offset: int, /) -> tuple[int, int]:
+    (length,) = _UINT32.unpack_from(view, offset)
+    offset += _UINT32.size
+    stop = offset + length
+    if stop > len(view):
+        raise _truncated()
+
+    return int.from_bytes(view[offset:stop], "little", signed=True), stop
+
+
+def _pack_str(string: str, length_struct: struct.Struct, /) -> bytes:
+    encoded = string.encode()
+    try:
+        return length_struct.pack(len(encoded)) + encoded
+    except struct.error:
+        msg: str = (
+            f"expected string of at most {2 ** (8 * length_struct.size) - 1} "
+            f"encoded bytes, got {len(encoded)}"
+        )
+        raise ValueError(msg) from None
+
+
+def _unpack_str(
+    view: memoryview,
+    offset: int,
+    length_struct: struct.Struct,
+    /,
+) -> tuple[str, int]:
+    (length,) = length_struct.unpack_from(view, offset)
+    offset += length_struct.size
+    stop = offset + length
+    if stop > len(view):
+        raise _truncated()
+
+    return str(view[offset:stop], "utf-8"), stop
+
+
+__all__ = [
+    "pack",
+    "pack_many",
+    "unpack",
+    "unpack_many",
+]
@@ -0,0 +1,297 @@
+"""Unit conversion registry.
+
+Units are related to reference units by scale factor and offset, so that a value in
+unit equals value * factor + offset in reference. Units of equal dimension convert
+into each other through coherent SI units. Conversion plans are compiled once per
+source and target unit, metric prefix and magnitude type.
+
+Examples
+--------
+>>> conversion_plan(Unit.watt_hour, Unit.joule, source_prefix=MetricPrefix.kilo)
+(3600000.0, 0.0)
+
+>>> conversion_plan(Unit.degree_celsius, Unit.kelvin, number_type=fractions.Fraction)
+(Fraction(1, 1), Fraction(5463, 20))
+
+>>> register_conversion("°F", Unit.kelvin, factor=fractions.Fraction(5, 9),
+...                     offset=fractions.Fraction(45967, 180))
+>>> conversion_plan("°F", Unit.degree_celsius)
+(0.5555555555555556, -17.77777777777778)
+
+
+"""
+
+from __future__ import annotations
+
+import decimal
+import fractions
+import typing
+
+from .metric_prefix import MetricPrefix
+from .unit import _SI_DIMENSION_AXES, _UNIT_DIMENSIONS, CompoundUnit, Unit
+
+if typing.TYPE_CHECKING:
+    _NumberT = typing.TypeVar(
+        "_NumberT",
+        int,
+        float,
+        complex,
+        decimal.Decimal,
+        fractions.Fraction,
+    )
+
+_Reduction: typing.TypeAlias = tuple[
+    fractions.Fraction,
+    fractions.Fraction,
+    tuple[int, ...],
+]
+
+# units sharing their dimension with another unit but measuring a different kind of
+# quantity, e.g. becquerel and hertz, are only converted through registrations
+_DISTINCT_KIND_UNITS: typing.Final[frozenset[Unit]] = frozenset(
+    {Unit.becquerel, Unit.sievert},
+)
+
+_references: dict[
+    Unit | CompoundUnit | str,
+    tuple[Unit | CompoundUnit | str | None, fractions.Fraction, fractions.Fraction],
+] = {}
+_reductions: dict[Unit | CompoundUnit | str | None, _Reduction | None] = {}
+_hash_keys: dict[
+    Unit | CompoundUnit | str | None,
+    tuple[int, fractions.Fraction | None, fractions.Fraction],
+] = {}
+_plans: dict[
+    tuple[
+        Unit | CompoundUnit | str | None,
+        MetricPrefix,
+        Unit | CompoundUnit | str | None,
+        MetricPrefix,
+        type,
+    ],
+    tuple[typing.Any, typing.Any] | None,
+] = {}
+
+
+def register_conversion(
+    unit: Unit | CompoundUnit | str,
+    reference: Unit | CompoundUnit | str | None,
+    /,
+    *,
+    factor: float | decimal.Decimal | fractions.Fraction = 1,
+    offset: float | decimal.Decimal | fractions.Fraction = 0,
+) -> None:
+    """Register unit as equal to value * factor + offset in reference.
+
+    Factor and offset are stored exactly, floats by their binary value. Units that
+    can already be converted cannot be registered, which rules out cycles. As
+    measurements of units with conversion hash by their value in coherent SI units,
+    register before hashing measurements of unit.
+    """
+    entry = (reference, fractions.Fraction(factor), fractions.Fraction(offset))
+    if _references.get(unit) == entry:
+        return
+
+    if _reduce(unit) is not None:
+        msg: str = f"expected unit without conversion, got {unit!r}"
+        raise ValueError(msg)
+
+    if _reduce(reference) is None:
+        msg = f"expected reference with conversion, got {reference!r}"
+        raise ValueError(msg)
+
+    if not factor:
+        msg = f"expected nonzero factor, got {factor!r}"
+        raise ValueError(msg)
+
+    _references[unit] = entry
+    _reductions.clear()
+    _hash_keys.clear()
+    _plans.clear()
+
+
+def _reduce(unit: Unit | CompoundUnit | str | None, /) -> _Reduction | None:
+    """Return factor, offset and dimension converting unit to coherent SI units."""
+    try:
+        return _reductions[unit]
+    except KeyError:
+        pass
+
+    reduction: _Reduction | None = None
+    if unit in _references:
+        reference, factor, offset = _references[unit]
+        if (reference_reduction := _reduce(reference)) is not None:
+            reference_factor, reference_offset, dimension = reference_reduction
+            reduction = (
+                factor * reference_factor,
+                offset * reference_factor + reference_offset,
+                dimension,
+            )
+    elif unit is None:
+        reduction = _reduce(Unit.one)
+    elif isinstance(unit, Unit):
+        dimension, scale = _UNIT_DIMENSIONS[unit]
+        if unit not in _DISTINCT_KIND_UNITS and not any(
+            dimension[len(_SI_DIMENSION_AXES) :],
+        ):
+            reduction = (
+                fractions.Fraction(10) ** scale,
+                fractions.Fraction(0),
+                dimension[: len(_SI_DIMENSION_AXES)],
+            )
+    elif isinstance(unit, CompoundUnit):
+        reduction = _reduce_compound_unit(unit)
+
+    _reductions[unit] = reduction
+    return reduction
+
+
+def _reduce_compound_unit(unit: CompoundUnit, /) -> _Reduction | None:
+    factor = fractions.Fraction(1)
+    dimension: list[int] = [0] * len(_SI_DIMENSION_AXES)
+    for unit_, exponent in unit.factors:
+        reduction = _reduce(unit_)
+        # offsets do not apply to products, e.g. °C/s
+        if reduction is None or reduction[1]:
+            return None
+
+        factor *= reduction[0] ** exponent
+        for index, axis_exponent in enumerate(reduction[2]):
+            dimension[index] += axis_exponent * exponent
+
+    return factor, fractions.Fraction(0), tuple(dimension)
+
+
+def _hash_key(
+    unit: Unit | CompoundUnit | str | None,
+    /,
+) -> tuple[int, fractions.Fraction | None, fractions.Fraction]:
+    """Return hash key, factor and offset converting unit to coherent SI units.
+
+    The key is the hash of the dimension of units with conversion and of the unit
+    otherwise. The factor is None if values convert unchanged.
+    """
+    try:
+        return _hash_keys[unit]
+    except KeyError:
+        pass
+
+    reduction = _reduce(unit)
+    if reduction is None:
+        entry: tuple[int, fractions.Fraction | None, fractions.Fraction] = (
+            hash(unit),
+            None,
+            fractions.Fraction(0),
+        )
+    else:
+        factor, offset, dimension = reduction
+        entry = (
+            hash(dimension),
+            None if factor == 1 and not offset else factor,
+            offset,
+        )
+
+    _hash_keys[unit] = entry
+    return entry
+
+
+def _as_number_type(
+    value: fractions.Fraction,
+    number_type: type[int | _NumberT],
+    /,
+) -> int | fractions.Fraction | _NumberT:
+    if number_type is int:
+        return value.numerator if value.denominator == 1 else value
+
+    if number_type is fractions.Fraction:
+        return value
+
+    if number_type is decimal.Decimal:
+        return decimal.Decimal(value.numerator) / decimal.Decimal(value.denominator)
+
+    return number_type(float(value))
+
+
+@typing.overload
+def conversion_plan(
+    source: Unit | CompoundUnit | str | None,
+    target: Unit | CompoundUnit | str | None,
+    /,
+    *,
+    source_prefix: MetricPrefix = MetricPrefix.NONE,
+    target_prefix: MetricPrefix = MetricPrefix.NONE,
+    number_type: type[int],
+) -> tuple[int | fractions.Fraction, int | fractions.Fraction] | None: ...
+
+
+@typing.overload
+def conversion_plan(
+    source: Unit | CompoundUnit | str | None,
+    target: Unit | CompoundUnit | str | None,
+    /,
+    *,
+    source_prefix: MetricPrefix = MetricPrefix.NONE,
+    target_prefix: MetricPrefix = MetricPrefix.NONE,
+    number_type: type[_NumberT] = float,  # type: ignore[assignment]
+) -> tuple[_NumberT, _NumberT] | None: ...
+
+
+def conversion_plan(
+    source,
+    target,
+    /,
+    *,
+    source_prefix=MetricPrefix.NONE,
+    target_prefix=MetricPrefix.NONE,
+    number_type=float,
+):
+    """Return factor and offset converting values of number_type from source.
+
+    A value in source_prefix and source converts to value * factor + offset in
+    target_prefix and target. None is returned if the units cannot be converted.
+    Decimal plans are rounded in the context active when first compiled.
+    """
+    key = (source, source_prefix, target, target_prefix, number_type)
+    try:
+        return _plans[key]
+    except KeyError:
+        pass
+
+    plan = None
+    if (source_reduction := _reduce(source)) is not None and (
+        target_reduction := _reduce(target)
+    ) is not None:
+        source_factor, source_offset, source_dimension = source_reduction
+        target_factor, target_offset, target_dimension = target_reduction
+        if source_dimension == target_dimension:
+            target_factor *= fractions.Fraction(10) ** target_prefix
+            plan = (
+                _as_number_type(
+                    source_factor
+                    * fractions.Fraction(10) ** source_prefix
+                    / target_factor,
+                    number_type,
+                ),
+                _as_number_type(
+                    (source_offset - target_offset) / target_factor,
+                    number_type,
+                ),
+            )
+
+    _plans[key] = plan
+    return plan
+
+
+register_conversion(Unit.hour, Unit.second, factor=3600)
+register_conversion(Unit.watt_hour, Unit.joule, factor=3600)
+register_conversion(
+    Unit.degree_celsius,
+    Unit.kelvin,
+    offset=fractions.Fraction(27315, 100),
+)
+
+
+__all__ = [
+    "conversion_plan",
+    "register_conversion",
+]
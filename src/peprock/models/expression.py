@@ -0,0 +1,358 @@
+"""Lazy arithmetic expressions of measurements.
+
+Arithmetic on an expression, created by lazy, records an expression tree instead of
+computing intermediate measurements. On evaluate, sums, differences and scalar
+multiples are flattened into one linear combination, whose terms are aligned to a
+common prefix and unit once and then summed. Products and quotients of measurements
+are evaluated with the operators of Measurement and MeasurementArray.
+
+Results may differ from eager arithmetic by rounding, as scalar factors are
+distributed over the terms of sums.
+
+Examples
+--------
+>>> expression = (
+...     lazy(Measurement(1, MetricPrefix.mega, Unit.watt))
+...     + Measurement(250, MetricPrefix.kilo, Unit.watt)
+...     - Measurement(50000, unit=Unit.watt)
+... ) * 0.9 / 2
+>>> expression.evaluate()
+Measurement(magnitude=540000.0, prefix=<MetricPrefix.NONE: 0>, unit=<Unit.watt: 'W'>)
+
+>>> str((lazy(Measurement(2, MetricPrefix.kilo, Unit.watt))
+...      * Measurement(3, unit=Unit.second)).evaluate())
+'6 kJ'
+
+
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import decimal
+import fractions
+import operator
+import sys
+import typing
+
+from .conversion import conversion_plan
+from .measurement import Measurement
+from .metric_prefix import MetricPrefix  # noqa: TC001
+from .unit import CompoundUnit, Unit  # noqa: TC001
+
+if typing.TYPE_CHECKING:
+    import collections.abc
+
+_SCALAR_TYPES: typing.Final[tuple[type, ...]] = (
+    int,
+    float,
+    decimal.Decimal,
+    fractions.Fraction,
+)
+_EXACT_TYPES: typing.Final[frozenset[type]] = frozenset(
+    (decimal.Decimal, fractions.Fraction),
+)
+# identity of unit multipliers, divisors and factors, which are not applied
+_ONE: typing.Final[int] = 1
+# operators flattened into linear combinations
+_LINEAR_OPERATORS: typing.Final[
+    frozenset[collections.abc.Callable[..., typing.Any]]
+] = frozenset((operator.add, operator.sub, operator.neg, operator.pos))
+
+
+@dataclasses.dataclass(frozen=True, slots=True, eq=False)
+class Expression:
+    """Node of a lazy expression tree, applying operator to operands on evaluate.
+
+    Operands are expressions, measurements, measurement arrays or scalars.
+    """
+
+    operator: collections.abc.Callable[..., typing.Any]
+    operands: tuple[typing.Any, ...]
+
+    def evaluate(self: Expression) -> typing.Any:  # noqa: ANN401
+        """Return value of expression, aligning prefixes once per linear combination.
+
+        Linear combinations of measurements and measurement arrays evaluate to a
+        measurement array if any of their terms is one, else to a measurement.
+        """
+        if self.operator in _LINEAR_OPERATORS or (
+            self.operator in (operator.mul, operator.truediv)
+            and _is_scalar(self.operands[1])
+        ):
+            return _evaluate_linear(self)
+
+        return self.operator(*map(_evaluate, self.operands))
+
+    def __add__(self: Expression, other: object) -> Expression:
+        """Return lazy self + other."""
+        if _is_scalar(other):
+            return NotImplemented
+
+        return Expression(operator.add, (self, other))
+
+    def __radd__(self: Expression, other: object) -> Expression:
+        """Return lazy other + self, or self for 0, the start value of sum."""
+        if type(other) is int and other == 0:
+            return self
+
+        if _is_scalar(other):
+            return NotImplemented
+
+        return Expression(operator.add, (other, self))
+
+    def __sub__(self: Expression, other: object) -> Expression:
+        """Return lazy self - other."""
+        if _is_scalar(other):
+            return NotImplemented
+
+        return Expression(operator.sub, (self, other))
+
+    def __rsub__(self: Expression, other: object) -> Expression:
+        """Return lazy other - self."""
+        if _is_scalar(other):
+            return NotImplemented
+
+        return Expression(operator.sub, (other, self))
+
+    def __mul__(self: Expression, other: object) -> Expression:
+        """Return lazy self * other."""
+        return Expression(operator.mul, (self, other))
+
+    def __rmul__(self: Expression, other: object) -> Expression:
+        """Return lazy other * self."""
+        if _is_scalar(other):
+            return Expression(operator.mul, (self, other))
+
+        return Expression(operator.mul, (other, self))
+
+    def __truediv__(self: Expression, other: object) -> Expression:
+        """Return lazy self / other."""
+        return Expression(operator.truediv, (self, other))
+
+    def __rtruediv__(self: Expression, other: object) -> Expression:
+        """Return lazy other / self."""
+        return Expression(operator.truediv, (other, self))
+
+    def __neg__(self: Expression) -> Expression:
+        """Return lazy -self."""
+        return Expression(operator.neg, (self,))
+
+    def __pos__(self: Expression) -> Expression:
+        """Return lazy +self."""
+        return Expression(operator.pos, (self,))
+
+
+def lazy(operand: typing.Any, /) -> Expression:  # noqa: ANN401
+    """Return expression of measurement or measurement array, recording arithmetic."""
+    return Expression(operator.pos, (operand,))
+
+
+def _is_scalar(value: object, /) -> bool:
+    if isinstance(value, _SCALAR_TYPES):
+        return True
+
+    if isinstance(value, (Expression, Measurement)):
+        return False
+
+    # NumPy scalars and arrays multiply magnitudes elementwise, if numpy is in use
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(value, numpy.number | numpy.ndarray)
+
+
+def _evaluate(operand: object, /) -> typing.Any:  # noqa: ANN401
+    if isinstance(operand, Expression):
+        return operand.evaluate()
+
+    return operand
+
+
+def _evaluate_linear(expression: Expression, /) -> typing.Any:  # noqa: ANN401
+    """Evaluate sums, differences and scalar multiples of expression in one pass."""
+    # terms of values with multiplier and divisor, in order of the expression
+    terms: list[tuple[typing.Any, typing.Any, typing.Any]] = []
+    # iterative, as sums of many terms are deeply nested
+    stack: list[tuple[object, typing.Any, typing.Any]] = [(expression, _ONE, _ONE)]
+    while stack:
+        node, multiplier, divisor = stack.pop()
+        if not isinstance(node, Expression):
+            terms.append((node, multiplier, divisor))
+            continue
+
+        operands = _linear_operands(node, multiplier, divisor)
+        if operands is None:
+            terms.append((node.evaluate(), multiplier, divisor))
+        else:
+            stack.extend(reversed(operands))
+
+    if len(terms) == 1:
+        value, multiplier, divisor = terms[0]
+        if multiplier is not _ONE:
+            value *= multiplier
+
+        if divisor is not _ONE:
+            value /= divisor
+
+        return value
+
+    return _combine(terms)
+
+
+def _linear_operands(
+    expression: Expression,
+    multiplier: typing.Any,  # noqa: ANN401
+    divisor: typing.Any,  # noqa: ANN401
+    /,
+) -> list[tuple[object, typing.Any, typing.Any]] | None:
+    """Return operands of linear expression with multipliers and divisors, or None."""
+    operator_ = expression.operator
+    operands = expression.operands
+    if operator_ is operator.add or operator_ is operator.sub:
+        return [
+            (operands[0], multiplier, divisor),
+            (
+                operands[1],
+                -multiplier if operator_ is operator.sub else multiplier,
+                divisor,
+            ),
+        ]
+
+    if operator_ is operator.neg or operator_ is operator.pos:
+        return [
+            (
+                operands[0],
+                -multiplier if operator_ is operator.neg else multiplier,
+                divisor,
+            ),
+        ]
+
+    if operator_ is operator.mul and _is_scalar(operands[1]):
+        return [(operands[0], multiplier * operands[1], divisor)]
+
+    if operator_ is operator.truediv and _is_scalar(operands[1]):
+        return [(operands[0], multiplier, divisor * operands[1])]
+
+    return None
+
+
+def _combine(
+    terms: list[tuple[typing.Any, typing.Any, typing.Any]],
+    /,
+) -> typing.Any:  # noqa: ANN401
+    """Sum terms aligned to the smallest prefix and the unit of the first term."""
+    template: typing.Any = None
+    for value, _, _ in terms:
+        if isinstance(value, Measurement):
+            if template is None:
+                template = value
+        elif hasattr(value, "magnitudes"):
+            # measurement arrays take precedence, as their sum is an array
+            template = value
+            break
+        else:
+            msg: str = f"unsupported operand type {type(value).__name__!r} in sum"
+            raise TypeError(msg)
+
+    unit: Unit | CompoundUnit | str | None = terms[0][0].unit
+    prefix: MetricPrefix = min(value.prefix for value, _, _ in terms)
+    # conversion plans by prefix, unit and number type of terms
+    plans: dict[tuple[typing.Any, ...], typing.Any] = {}
+    aligned = (_aligned(term, prefix, unit, plans) for term in terms)
+    magnitudes = next(aligned) + next(aligned)
+    for magnitudes_ in aligned:
+        magnitudes = _accumulate(magnitudes, magnitudes_)
+    if isinstance(template, Measurement):
+        return template.replace(magnitude=magnitudes, prefix=prefix, unit=unit)
+
+    return dataclasses.replace(
+        template,
+        magnitudes=magnitudes,
+        prefix=prefix,
+        unit=unit,
+    )
+
+
+def _aligned(
+    term: tuple[typing.Any, typing.Any, typing.Any],
+    prefix: MetricPrefix,
+    unit: Unit | CompoundUnit | str | None,
+    plans: dict[tuple[typing.Any, ...], typing.Any],
+    /,
+) -> typing.Any:  # noqa: ANN401
+    """Return magnitudes of term in prefix and unit, times multiplier by divisor."""
+    value, multiplier, divisor = term
+    if isinstance(value, Measurement):
+        magnitudes: typing.Any = value.magnitude
+        number_type: type = type(magnitudes)
+    else:
+        magnitudes = value.magnitudes
+        # factors to smaller prefixes are int, see MeasurementArray.convert
+        number_type = int
+
+    if value.prefix is prefix and value.unit == unit:
+        factor: typing.Any = _ONE
+    else:
+        key = (value.prefix, value.unit, number_type)
+        try:
+            factor = plans[key]
+        except KeyError:
+            factor = plans[key] = _plan(value, number_type, prefix, unit)
+
+    if multiplier is _ONE and divisor is _ONE:
+        return magnitudes if factor is _ONE else magnitudes * factor
+
+    # fold multiplier and divisor into one factor, of number type unless float
+    if type(factor) is int and number_type in _EXACT_TYPES:
+        factor = number_type(factor)
+
+    return magnitudes * (factor * multiplier / divisor)
+
+
+def _accumulate(total: typing.Any, value: typing.Any, /) -> typing.Any:  # noqa: ANN401
+    """Return total + value, in place for arrays unless their dtype widens."""
+    try:
+        total += value
+    except TypeError:
+        return total + value
+
+    return total
+
+
+def _plan(
+    value: typing.Any,  # noqa: ANN401
+    number_type: type,
+    prefix: MetricPrefix,
+    unit: Unit | CompoundUnit | str | None,
+    /,
+) -> typing.Any:  # noqa: ANN401
+    """Return factor converting value to prefix and unit.
+
+    Sums of units converting with an offset, e.g. °C and K, are ambiguous between
+    temperatures and temperature differences and not supported, as for Measurement.
+    """
+    if value.unit == unit:
+        return value.prefix.to(prefix, number_type=number_type)
+
+    plan = conversion_plan(
+        value.unit,
+        unit,
+        source_prefix=value.prefix,
+        target_prefix=prefix,
+        number_type=float if number_type is int else number_type,
+    )
+    if plan is None:
+        msg: str = f"cannot convert {value.unit!r} to {unit!r}"
+        raise ValueError(msg)
+
+    factor, offset = plan
+    if offset:
+        msg = f"cannot sum {value.unit!r} and {unit!r}, which convert with an offset"
+        raise TypeError(msg)
+
+    return factor
+
+
+__all__ = [
+    "Expression",
+    "lazy",
+]
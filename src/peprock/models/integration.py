@@ -0,0 +1,257 @@
+"""Time integration of measurements, e.g. of power to energy.
+
+Measurements are integrated over time by the step rule, holding each measurement
+until the next timestamp, or by the trapezoidal rule, interpolating linearly between
+measurements sampled at timestamps. The result has the unit of measurement times
+second, e.g. J for W rather than Wh, and the smallest prefix of the measurements,
+unless converted to another unit keeping that prefix.
+
+Durations are exact integer microseconds, elapsed in UTC for aware timestamps.
+Measurements are accumulated exactly like by total, and int and float measurement
+arrays by a float dot product of their magnitudes and durations. Object arrays, e.g.
+of decimal.Decimal, are accumulated exactly. Extension arrays with missing
+measurements are rejected.
+
+Examples
+--------
+>>> start = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+>>> timestamps = [start + datetime.timedelta(minutes=15 * index) for index in range(5)]
+>>> power = [Measurement(magnitude, MetricPrefix.kilo, Unit.watt) for magnitude in
+...          (4, 2, 2, 0)]
+>>> integrate(power, timestamps)
+Measurement(magnitude=7200.0, prefix=<MetricPrefix.kilo: 3>, unit=<Unit.joule: 'J'>)
+
+>>> integrate([*power, Measurement(4, MetricPrefix.kilo, Unit.watt)], timestamps,
+...           rule="trapezoid", unit=Unit.watt_hour)
+Measurement(magnitude=2.0, prefix=<MetricPrefix.kilo: 3>, unit=<Unit.watt_hour: 'Wh'>)
+
+>>> integrate_periods([
+...     (Period(start, start + datetime.timedelta(hours=2)),
+...      Measurement(3, unit=Unit.watt)),
+... ])
+Measurement(magnitude=21600.0, prefix=<MetricPrefix.NONE: 0>, unit=<Unit.joule: 'J'>)
+
+
+"""
+
+from __future__ import annotations
+
+import datetime
+import decimal
+import itertools
+import typing
+
+from peprock.dt import Period
+
+from .aggregation import _EXACT_CONTEXT, _aggregate, _divide
+from .measurement import Measurement
+from .metric_prefix import MetricPrefix  # noqa: TC001
+from .unit import CompoundUnit, Unit
+
+if typing.TYPE_CHECKING:
+    import collections.abc
+
+    from .measurement_array import MeasurementArray
+
+_MICROSECOND: typing.Final[datetime.timedelta] = datetime.timedelta(microseconds=1)
+_MICROSECONDS_PER_SECOND: typing.Final[int] = 1_000_000
+_SECOND: typing.Final[Measurement[int]] = Measurement(1, unit=Unit.second)
+_RULES: typing.Final[dict[str, int]] = {
+    # divisor of the sum of durations times measurements
+    "step": 1,
+    "trapezoid": 2,
+}
+
+
+def integrate(
+    measurements: collections.abc.Iterable[Measurement[typing.Any]] | MeasurementArray,
+    timestamps: collections.abc.Sequence[datetime.datetime] | typing.Any,  # noqa: ANN401
+    /,
+    *,
+    rule: typing.Literal["step", "trapezoid"] = "step",
+    unit: Unit | CompoundUnit | str | None = None,
+) -> Measurement[typing.Any]:
+    """Return integral of measurements or measurement array over timestamps.
+
+    By the step rule, measurement i holds from timestamp i to timestamp i + 1, so that
+    there is one more timestamp than measurements. By the trapezoidal rule,
+    measurement i is sampled at timestamp i. Timestamps are datetimes or a NumPy
+    datetime64 array and must be non-decreasing. The integral is converted to unit
+    if given, see Measurement.to_unit.
+    """
+    if rule not in _RULES:
+        msg: str = f"expected rule 'step' or 'trapezoid', got {rule!r}"
+        raise ValueError(msg)
+
+    durations = _durations(timestamps)
+    magnitudes: typing.Any = getattr(measurements, "magnitudes", None)
+    if hasattr(magnitudes, "dot"):
+        # extension arrays mask missing measurements, see MeasurementDtype
+        if hasattr(measurements, "isna") and (missing := measurements.isna().sum()):
+            msg = f"expected no missing measurements, got {missing}"
+            raise ValueError(msg)
+
+        if magnitudes.dtype.kind in "iuf":
+            return _converted(
+                _integrate_array(
+                    typing.cast("MeasurementArray", measurements),
+                    durations,
+                    rule,
+                ),
+                unit,
+            )
+
+    if hasattr(durations, "tolist"):
+        durations = durations.tolist()
+
+    measurements = list(typing.cast("collections.abc.Iterable", measurements))
+    _check_count(len(measurements), len(durations), rule)
+    pairs: collections.abc.Iterable[tuple[Measurement[typing.Any], int]] = zip(
+        measurements[: len(durations)],
+        durations,
+        strict=True,
+    )
+    if rule == "trapezoid":
+        pairs = itertools.chain(
+            pairs,
+            zip(measurements[1:], durations, strict=True),
+        )
+
+    context = decimal.getcontext()
+    with decimal.localcontext(_EXACT_CONTEXT):
+        magnitude, prefix, unit_, _ = _aggregate(pairs)
+
+    return _converted(
+        _integral(magnitude, _RULES[rule], prefix, unit_, context),
+        unit,
+    )
+
+
+def integrate_periods(
+    items: collections.abc.Iterable[tuple[Period, Measurement[typing.Any]]],
+    /,
+    *,
+    unit: Unit | CompoundUnit | str | None = None,
+) -> Measurement[typing.Any]:
+    """Return integral of measurements holding over periods, by the step rule.
+
+    Periods may be non-contiguous and overlapping, but must not end before they start.
+    The integral is converted to unit if given, see Measurement.to_unit.
+    """
+    context = decimal.getcontext()
+    with decimal.localcontext(_EXACT_CONTEXT):
+        magnitude, prefix, unit_, _ = _aggregate(_weighted_by_duration(items))
+
+    return _converted(
+        _integral(magnitude, _RULES["step"], prefix, unit_, context),
+        unit,
+    )
+
+
+def _integrate_array(
+    measurements: MeasurementArray,
+    durations: typing.Any,  # noqa: ANN401
+    rule: str,
+    /,
+) -> Measurement[typing.Any]:
+    """Integrate int or float measurement array in one vectorized float pass."""
+    _check_count(len(measurements), len(durations), rule)
+    magnitudes = measurements.magnitudes.astype("float64")
+    magnitude = magnitudes[: len(durations)].dot(durations)
+    if rule == "trapezoid":
+        magnitude += magnitudes[1:].dot(durations)
+
+    return _integral(
+        float(magnitude),
+        _RULES[rule],
+        measurements.prefix,
+        measurements.unit,
+    )
+
+
+def _durations(
+    timestamps: collections.abc.Sequence[datetime.datetime] | typing.Any,  # noqa: ANN401
+    /,
+) -> typing.Any:  # noqa: ANN401
+    """Return durations between consecutive timestamps in microseconds."""
+    if hasattr(timestamps, "astype"):
+        microseconds = timestamps.astype("datetime64[us]").astype("int64")
+        durations: typing.Any = microseconds[1:] - microseconds[:-1]
+        decreasing = bool((durations < 0).any())
+    else:
+        durations = [
+            Period(start, end).duration // _MICROSECOND
+            for start, end in itertools.pairwise(timestamps)
+        ]
+        decreasing = any(duration < 0 for duration in durations)
+
+    if len(durations) == 0:
+        msg: str = "expected at least two timestamps"
+        raise ValueError(msg)
+
+    if decreasing:
+        msg = "expected non-decreasing timestamps"
+        raise ValueError(msg)
+
+    return durations
+
+
+def _converted(
+    integral: Measurement[typing.Any],
+    unit: Unit | CompoundUnit | str | None,
+    /,
+) -> Measurement[typing.Any]:
+    """Return integral converted to unit if given, keeping its prefix."""
+    if unit is None:
+        return integral
+
+    return integral.to_unit(unit, integral.prefix)
+
+
+def _check_count(count: int, intervals: int, rule: str, /) -> None:
+    expected = intervals if rule == "step" else intervals + 1
+    if count != expected:
+        msg: str = (
+            f"expected {expected} measurements for {intervals + 1} timestamps "
+            f"by the {rule} rule, got {count}"
+        )
+        raise ValueError(msg)
+
+
+def _weighted_by_duration(
+    items: collections.abc.Iterable[tuple[Period, Measurement[typing.Any]]],
+    /,
+) -> collections.abc.Iterator[tuple[Measurement[typing.Any], int]]:
+    for period, measurement in items:
+        duration = period.duration // _MICROSECOND
+        if duration < 0:
+            msg: str = f"expected period of non-negative duration, got {period!r}"
+            raise ValueError(msg)
+
+        yield measurement, duration
+
+
+def _integral(
+    magnitude: typing.Any,  # noqa: ANN401
+    divisor: int,
+    prefix: MetricPrefix,
+    unit: Unit | CompoundUnit | str | None,
+    context: decimal.Context | None = None,
+    /,
+) -> Measurement[typing.Any]:
+    """Return measurement of magnitude in microseconds times divisor, times second."""
+    magnitude = _divide(
+        magnitude,
+        divisor * _MICROSECONDS_PER_SECOND,
+        context or decimal.getcontext(),
+    )
+    return typing.cast(
+        "Measurement[typing.Any]",
+        Measurement(magnitude, prefix, unit) * _SECOND,
+    )
+
+
+__all__ = [
+    "integrate",
+    "integrate_periods",
+]
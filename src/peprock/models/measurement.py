@@ -13,20 +13,47 @@ Measurement(magnitude=4001.2, prefix=<MetricPrefix.NONE: 0>, unit=None)
 >>> int(Measurement(0.123456, MetricPrefix.kilo))
 123
 
+>>> Measurement(0.00042, MetricPrefix.mega, Unit.watt).normalize()
+Measurement(magnitude=420.0, prefix=<MetricPrefix.NONE: 0>, unit=<Unit.watt: 'W'>)
+
+>>> Measurement.format_many([Measurement(1.5), Measurement(2.5, unit=Unit.watt)], ".1f")
+['1.5', '2.5 W']
+
+>>> Measurement(25, MetricPrefix.milli).sort_key()
+Fraction(1, 40)
+
+>>> Measurement.parse("24.6 MW")
+Measurement(magnitude=24.6, prefix=<MetricPrefix.mega: 6>, unit=<Unit.watt: 'W'>)
+
+>>> Measurement(2, MetricPrefix.kilo, Unit.watt) * Measurement(3, unit=Unit.second)
+Measurement(magnitude=6, prefix=<MetricPrefix.kilo: 3>, unit=<Unit.joule: 'J'>)
+
+>>> with decimal_context(prec=3):
+...     str(Measurement(decimal.Decimal("1.234"), MetricPrefix.kilo, Unit.watt) * 3)
+'3.70 kW'
+
+>>> Measurement(1, MetricPrefix.kilo, Unit.watt_hour).to_unit(Unit.joule)
+Measurement(magnitude=3600000, prefix=<MetricPrefix.NONE: 0>, unit=<Unit.joule: 'J'>)
+
 
 """
 
 from __future__ import annotations
 
+import contextlib
+import contextvars
 import dataclasses
 import decimal
 import fractions
 import functools
+import math
 import operator
+import types
 import typing
 
+from .conversion import _hash_key, conversion_plan
 from .metric_prefix import MetricPrefix
-from .unit import Unit
+from .unit import CompoundUnit, Unit, _combine
 
 if typing.TYPE_CHECKING:
     import collections.abc
@@ -54,42 +81,322 @@ _MagnitudeS = typing.TypeVar(
     fractions.Fraction,
 )
 
+_object_new = object.__new__
+_object_setattr = object.__setattr__
+_prefix_from_exponent = MetricPrefix.from_exponent
+
+# powers of ten exactly representable as float, and the largest exact integer
+_MAX_EXACT_FLOAT_EXPONENT: typing.Final[int] = 22
+_MAX_EXACT_FLOAT_INTEGER: typing.Final[int] = 2**53
+_ZERO: typing.Final[fractions.Fraction] = fractions.Fraction(0)
+
+# operators of decimal.Context methods, rounding in the context
+_CONTEXT_METHODS: typing.Final[
+    types.MappingProxyType[collections.abc.Callable[..., typing.Any], str]
+] = types.MappingProxyType(
+    {
+        operator.add: "add",
+        operator.sub: "subtract",
+        operator.mul: "multiply",
+        operator.truediv: "divide",
+        operator.floordiv: "divide_int",
+        operator.mod: "remainder",
+        operator.neg: "minus",
+        operator.pos: "plus",
+        operator.abs: "abs",
+    },
+)
+# methods of the context of decimal_context by operator, None outside of it
+_DECIMAL_OPERATORS: contextvars.ContextVar[
+    dict[
+        collections.abc.Callable[..., typing.Any],
+        collections.abc.Callable[..., typing.Any],
+    ]
+    | None
+] = contextvars.ContextVar("decimal_operators", default=None)
+
+
+@contextlib.contextmanager
+def decimal_context(
+    context: decimal.Context | None = None,
+    /,
+    **attributes: typing.Any,
+) -> collections.abc.Iterator[decimal.Context]:
+    """Return context manager rounding measurement arithmetic in a decimal context.
+
+    Within the block, arithmetic of measurements with decimal.Decimal magnitudes
+    rounds in a copy of context, or of a default decimal.Context, updated by
+    attributes, e.g. prec or rounding, rather than in the context of the current
+    thread. The methods of the copy are looked up once. The copy is yielded, e.g. to
+    inspect its flags, and applies to the current thread or asyncio task only.
+    """
+    context = (decimal.Context() if context is None else context).copy()
+    for name, value in attributes.items():
+        setattr(context, name, value)
+
+    token = _DECIMAL_OPERATORS.set(
+        {
+            operator_: getattr(context, method)
+            for operator_, method in _CONTEXT_METHODS.items()
+        },
+    )
+    try:
+        yield context
+    finally:
+        _DECIMAL_OPERATORS.reset(token)
+
+
+def _rescale(
+    magnitude: typing.Any,  # noqa: ANN401
+    prefix: MetricPrefix,
+    to: MetricPrefix,
+    /,
+) -> typing.Any:  # noqa: ANN401
+    """Convert magnitude between prefixes, rounding finite floats once."""
+    if type(magnitude) is float:
+        # products and quotients of floats by exact powers of ten round once
+        shift: int = prefix - to
+        if 0 <= shift <= _MAX_EXACT_FLOAT_EXPONENT:
+            return magnitude * 10.0**shift
+
+        if -_MAX_EXACT_FLOAT_EXPONENT <= shift < 0:
+            return magnitude / 10.0**-shift
+
+        return float(
+            fractions.Fraction(magnitude)
+            * prefix.to(to, number_type=fractions.Fraction),
+        )
+
+    return prefix.convert(magnitude, to)
+
+
+def _exact_value(
+    magnitude: typing.Any,  # noqa: ANN401
+    prefix: MetricPrefix,
+    factor: fractions.Fraction | None = None,
+    offset: fractions.Fraction = _ZERO,
+    /,
+) -> fractions.Fraction | None:
+    """Return magnitude converted to no prefix exactly, or None if not rational.
+
+    The value is converted by factor and offset, if given.
+    """
+    try:
+        exact = fractions.Fraction(magnitude) * prefix.to(
+            MetricPrefix.NONE,
+            number_type=fractions.Fraction,
+        )
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+    if factor is not None:
+        exact = exact * factor + offset
+
+    return exact
+
+
+def _hash_value(
+    magnitude: typing.Any,  # noqa: ANN401
+    prefix: MetricPrefix,
+    factor: fractions.Fraction | None = None,
+    offset: fractions.Fraction = _ZERO,
+    /,
+) -> typing.Any:  # noqa: ANN401
+    """Return magnitude converted to no prefix and rounded to the nearest float.
+
+    The value is converted by factor and offset first, if given. Values beyond the
+    range of float are returned exactly.
+    """
+    if type(magnitude) is float and factor is None:
+        if not math.isfinite(magnitude):
+            return magnitude
+
+        # products and quotients of floats round the exact result once
+        if 0 <= prefix <= _MAX_EXACT_FLOAT_EXPONENT:
+            value = magnitude * 10.0**prefix
+            if math.isfinite(value):
+                return value
+        elif -_MAX_EXACT_FLOAT_EXPONENT <= prefix < 0:
+            return magnitude / 10.0**-prefix
+
+    exact = _exact_value(magnitude, prefix, factor, offset)
+    if exact is None:
+        # e.g. non-finite magnitudes or magnitudes of other number types
+        value = prefix.convert(magnitude)
+        return value if factor is None else value * float(factor) + float(offset)
+
+    try:
+        return float(exact)
+    except OverflowError:
+        return exact
+
+
+def _operate(
+    operator_: collections.abc.Callable[..., _T],
+    *operands: typing.Any,
+) -> _T:
+    """Apply operator to operands, in the context of decimal_context for decimals."""
+    if (
+        any(isinstance(operand, decimal.Decimal) for operand in operands)
+        and (operators := _DECIMAL_OPERATORS.get()) is not None
+        and operator_ in operators
+    ):
+        return operators[operator_](*operands)
+
+    return operator_(*operands)
+
+
+def _convert(
+    prefix: MetricPrefix,
+    value: typing.Any,  # noqa: ANN401
+    to: MetricPrefix,
+    /,
+) -> typing.Any:  # noqa: ANN401
+    """Convert value between prefixes, in the context of decimal_context if set."""
+    if (
+        isinstance(value, decimal.Decimal)
+        and (operators := _DECIMAL_OPERATORS.get()) is not None
+    ):
+        return operators[operator.mul](
+            value,
+            prefix.to(to, number_type=decimal.Decimal),
+        )
+
+    return prefix.convert(value, to)
+
+
+# alternative symbols accepted when parsing, e.g. the micro sign for micro
+_PREFIX_SYMBOL_ALIASES: typing.Final[types.MappingProxyType[str, str]] = (
+    types.MappingProxyType({"µ": "μ"})
+)
+
+
+def _int_log10(value: int, /) -> int:
+    """Return floor(log10(value)) for positive int value."""
+    # 1233 / 4096 approximates log10(2) from below
+    exponent: int = (value.bit_length() - 1) * 1233 >> 12
+    return exponent + 1 if value >= 10 ** (exponent + 1) else exponent
+
+
+def _ratio_log10(numerator: int, denominator: int, exponent: int, /) -> int:
+    """Return floor(log10(numerator / denominator)) from estimate off by at most one."""
+    if exponent >= 0:
+        denominator *= 10**exponent
+    else:
+        numerator *= 10**-exponent
+
+    if numerator < denominator:
+        return exponent - 1
+
+    return exponent + 1 if numerator >= 10 * denominator else exponent
+
+
+def _fraction_log10(value: fractions.Fraction, /) -> int:
+    """Return floor(log10(value)) for positive fractions.Fraction value."""
+    numerator, denominator = value.numerator, value.denominator
+    return _ratio_log10(
+        numerator,
+        denominator,
+        _int_log10(numerator) - _int_log10(denominator),
+    )
 
-@dataclasses.dataclass(frozen=True)
+
+def _decimal_exponent(magnitude: object, /) -> int | None:
+    """Return floor(log10(abs(magnitude))), None if zero or not finite."""
+    match magnitude:
+        case float():
+            if magnitude and math.isfinite(magnitude):
+                # log10 rounds, e.g. to 3.0 just below 1000, so check the estimate
+                return _ratio_log10(
+                    *abs(magnitude).as_integer_ratio(),
+                    math.floor(math.log10(abs(magnitude))),
+                )
+        case int():
+            if magnitude:
+                return _int_log10(abs(magnitude))
+        case decimal.Decimal():
+            if magnitude and magnitude.is_finite():
+                return magnitude.adjusted()
+        case fractions.Fraction():
+            if magnitude:
+                return _fraction_log10(abs(magnitude))
+
+    return None
+
+
+def _unit_symbol(unit: Unit | CompoundUnit | str | None, /) -> str:
+    match unit:
+        case None | Unit.one:
+            return ""
+        case Unit() | CompoundUnit():
+            return unit.symbol
+        case _:
+            return unit
+
+
+@functools.cache
+def _format_suffix(
+    prefix: MetricPrefix,
+    unit: Unit | CompoundUnit | str | None,
+    /,
+) -> str:
+    """Return suffix of formatted measurements, shared per prefix and unit."""
+    if suffix := f"{prefix.symbol}{_unit_symbol(unit)}":
+        return f" {suffix}"
+
+    return ""
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class Measurement(typing.Generic[_MagnitudeT]):
-    """Measurement model supporting conversion and arithmetic operations."""
+    """Measurement model supporting conversion and arithmetic operations.
+
+    Instances are slotted and carry no __dict__, keeping them memory-lean.
+    """
 
     magnitude: _MagnitudeT
     prefix: MetricPrefix = MetricPrefix.NONE
-    unit: Unit | str | None = None
+    unit: Unit | CompoundUnit | str | None = None
 
-    @functools.cached_property
+    @property
     def _unit_symbol(self: Self) -> str:
-        match self.unit:
-            case None | Unit.one:
-                return ""
-            case Unit():
-                return self.unit.symbol
-            case _:
-                return self.unit
+        return _unit_symbol(self.unit)
 
     def __format__(self: Self, format_spec: str) -> str:
         """Format measurement and return str."""
-        if self.prefix.symbol or (self.unit and self.unit is not Unit.one):
-            return (
-                f"{self.magnitude:{format_spec}} "
-                f"{self.prefix.symbol}{self._unit_symbol}"
-            )
-
-        return format(self.magnitude, format_spec)
+        return format(self.magnitude, format_spec) + _format_suffix(
+            self.prefix,
+            self.unit,
+        )
 
-    @functools.cached_property
-    def _str(self: Self) -> str:
-        return format(self)
+    @staticmethod
+    def format_many(
+        measurements: collections.abc.Iterable[Measurement[typing.Any]],
+        format_spec: str = "",
+        /,
+    ) -> list[str]:
+        """Format measurements, see __format__.
+
+        Suffixes are looked up once per run of measurements sharing prefix and unit.
+        """
+        strings: list[str] = []
+        append = strings.append
+        prefix: MetricPrefix | None = None
+        unit: Unit | CompoundUnit | str | None = None
+        suffix = ""
+        for measurement in measurements:
+            if measurement.prefix is not prefix or measurement.unit is not unit:
+                prefix = measurement.prefix
+                unit = measurement.unit
+                suffix = _format_suffix(prefix, unit)
+
+            append(format(measurement.magnitude, format_spec) + suffix)
+
+        return strings
 
     def __str__(self: Self) -> str:
         """Return str(self)."""
-        return self._str
+        return format(self)
 
     @classmethod
     @functools.cache
@@ -109,6 +416,218 @@ class Measurement(typing.Generic[_MagnitudeT]):
             },
         )
 
+    def _derive(
+        self: Self,
+        magnitude: typing.Any,  # noqa: ANN401
+        prefix: MetricPrefix | None = None,
+    ) -> Self:
+        """Return a new object with magnitude and prefix replaced, skipping __init__."""
+        if (cls := type(self)) is not Measurement:
+            # subclasses may define additional fields or __post_init__
+            return self.replace(
+                magnitude=magnitude,
+                prefix=self.prefix if prefix is None else prefix,
+            )
+
+        derived = _object_new(cls)
+        _object_setattr(derived, "magnitude", magnitude)
+        _object_setattr(derived, "prefix", self.prefix if prefix is None else prefix)
+        _object_setattr(derived, "unit", self.unit)
+        return derived
+
+    def normalize(self: Self, *, engineering: bool = True) -> Self:
+        """Return measurement rescaled to the metric prefix best fitting magnitude.
+
+        With engineering, only prefixes of powers of three are used, so that the
+        magnitude falls into [1, 1000). Zero and non-finite magnitudes are returned
+        unchanged. Int magnitudes stay int where the result is integral and become
+        fractions.Fraction otherwise.
+        """
+        if (exponent := _decimal_exponent(self.magnitude)) is None:
+            return self
+
+        prefix = _prefix_from_exponent(exponent + self.prefix, engineering=engineering)
+        if prefix is self.prefix:
+            return self
+
+        magnitude = _rescale(self.magnitude, self.prefix, prefix)
+        if type(magnitude) is float:
+            # rounding may carry to the next prefix, e.g. 1e-12 to 1000.0 femto
+            if (exponent := _decimal_exponent(magnitude)) is not None and (
+                corrected := _prefix_from_exponent(
+                    exponent + prefix,
+                    engineering=engineering,
+                )
+            ) is not prefix:
+                prefix = corrected
+                magnitude = _rescale(self.magnitude, self.prefix, prefix)
+        elif type(self.magnitude) is int and magnitude.denominator == 1:
+            magnitude = magnitude.numerator
+
+        return self._derive(magnitude, prefix)
+
+    def sort_key(self: Self) -> int | float | decimal.Decimal | fractions.Fraction:
+        """Return magnitude converted to no prefix, ordering measurements sharing unit.
+
+        Sorting by key converts each measurement once rather than once per
+        comparison, e.g. sorted(measurements, key=Measurement.sort_key).
+        """
+        if self.prefix is MetricPrefix.NONE:
+            return self.magnitude
+
+        return self.prefix.convert(self.magnitude)
+
+    def to_unit(
+        self: Self,
+        unit: Unit | CompoundUnit | str | None,
+        /,
+        prefix: MetricPrefix = MetricPrefix.NONE,
+    ) -> Self:
+        """Return measurement converted to unit and prefix, see conversion module."""
+        plan = conversion_plan(
+            self.unit,
+            unit,
+            source_prefix=self.prefix,
+            target_prefix=prefix,
+            number_type=type(self.magnitude),
+        )
+        if plan is None:
+            msg: str = f"cannot convert {self.unit!r} to {unit!r}"
+            raise ValueError(msg)
+
+        factor, offset = plan
+        return self.replace(
+            magnitude=self.magnitude * factor + offset,
+            prefix=prefix,
+            unit=unit,
+        )
+
+    @staticmethod
+    @functools.cache
+    def _suffixes() -> types.MappingProxyType[str, tuple[MetricPrefix, Unit | None]]:
+        """Map every suffix produced by __format__ to metric prefix and unit.
+
+        Ambiguous suffixes resolve to a unit without prefix before a prefix without
+        unit, e.g. m is metre rather than milli and T is tesla rather than tera.
+        """
+        prefixes: list[tuple[str, MetricPrefix]] = [
+            (prefix.symbol, prefix) for prefix in MetricPrefix
+        ]
+        prefixes.extend(
+            (alias, MetricPrefix.from_symbol(symbol))
+            for alias, symbol in _PREFIX_SYMBOL_ALIASES.items()
+        )
+
+        # insert in ascending precedence, later entries win
+        suffixes: dict[str, tuple[MetricPrefix, Unit | None]] = {
+            symbol: (prefix, None) for symbol, prefix in prefixes
+        }
+        for unit in Unit:
+            if unit is not Unit.one:
+                suffixes.update(
+                    (symbol + unit.symbol, (prefix, unit))
+                    for symbol, prefix in prefixes
+                    if prefix is not MetricPrefix.NONE
+                )
+        for unit in Unit:
+            if unit is not Unit.one:
+                suffixes[unit.symbol] = (MetricPrefix.NONE, unit)
+
+        return types.MappingProxyType(suffixes)
+
+    @typing.overload
+    @classmethod
+    def parse(
+        cls: type[Measurement],
+        string: str,
+        /,
+        *,
+        number_type: type[_MagnitudeS],
+    ) -> Measurement[_MagnitudeS]: ...
+
+    @typing.overload
+    @classmethod
+    def parse(
+        cls: type[Measurement],
+        string: str,
+        /,
+        *,
+        number_type: None = None,
+    ) -> Measurement[int] | Measurement[float] | Measurement[fractions.Fraction]: ...
+
+    @classmethod
+    def parse(cls, string, /, *, number_type=None):
+        """Parse str as produced by str(measurement) or format(measurement).
+
+        Without number_type, the magnitude is parsed as fractions.Fraction if it
+        contains a slash, as int if it consists of digits, otherwise as float. A
+        suffix that is not a known metric prefix and unit symbol combination is kept
+        as str unit.
+        """
+        return cls._parse(string, number_type, cls._suffixes())
+
+    @typing.overload
+    @classmethod
+    def parse_many(
+        cls: type[Measurement],
+        strings: collections.abc.Iterable[str],
+        /,
+        *,
+        number_type: type[_MagnitudeS],
+    ) -> list[Measurement[_MagnitudeS]]: ...
+
+    @typing.overload
+    @classmethod
+    def parse_many(
+        cls: type[Measurement],
+        strings: collections.abc.Iterable[str],
+        /,
+        *,
+        number_type: None = None,
+    ) -> list[
+        Measurement[int] | Measurement[float] | Measurement[fractions.Fraction]
+    ]: ...
+
+    @classmethod
+    def parse_many(cls, strings, /, *, number_type=None):
+        """Parse strs as produced by str(measurement), see parse."""
+        parse = cls._parse
+        suffixes = cls._suffixes()
+        return [parse(string, number_type, suffixes) for string in strings]
+
+    @classmethod
+    def _parse(
+        cls: type[Self],
+        string: str,
+        number_type: type[_MagnitudeS] | None,
+        suffixes: collections.abc.Mapping[str, tuple[MetricPrefix, Unit | None]],
+        /,
+    ) -> Self:
+        number, _, suffix = string.strip().partition(" ")
+        try:
+            if number_type is not None:
+                magnitude: typing.Any = number_type(number)
+            elif "/" in number:
+                magnitude = fractions.Fraction(number)
+            elif number.lstrip("+-").isdigit():
+                magnitude = int(number)
+            else:
+                magnitude = float(number)
+        except (ArithmeticError, ValueError) as exception:
+            msg: str = f"invalid measurement magnitude in {string!r}"
+            raise ValueError(msg) from exception
+
+        try:
+            prefix, unit = suffixes[suffix]
+        except KeyError:
+            if suffix != suffix.lstrip():
+                msg = f"invalid measurement suffix in {string!r}"
+                raise ValueError(msg) from None
+
+            return cls(magnitude, MetricPrefix.NONE, suffix)
+
+        return cls(magnitude, prefix, unit)
+
     @typing.overload
     def _apply_operator(
         self: Self,
@@ -154,6 +673,16 @@ class Measurement(typing.Generic[_MagnitudeT]):
         wrap_in_measurement=False,
     ):
         if isinstance(__other, Measurement) and self.unit == __other.unit:
+            if (
+                isinstance(self.magnitude, decimal.Decimal)
+                or isinstance(__other.magnitude, decimal.Decimal)
+            ) and _DECIMAL_OPERATORS.get() is not None:
+                return self._apply_decimal_operator(
+                    __other,
+                    __operator,
+                    wrap_in_measurement=wrap_in_measurement,
+                )
+
             if (diff := self.prefix - __other.prefix) == 0:
                 magnitude = __operator(
                     self.magnitude,
@@ -161,9 +690,7 @@ class Measurement(typing.Generic[_MagnitudeT]):
                 )
 
                 if wrap_in_measurement:
-                    return self.replace(
-                        magnitude=magnitude,
-                    )
+                    return self._derive(magnitude)
 
                 return magnitude
 
@@ -174,9 +701,7 @@ class Measurement(typing.Generic[_MagnitudeT]):
                 )
 
                 if wrap_in_measurement:
-                    return self.replace(
-                        magnitude=magnitude,
-                    )
+                    return self._derive(magnitude)
 
                 return magnitude
 
@@ -186,15 +711,166 @@ class Measurement(typing.Generic[_MagnitudeT]):
             )
 
             if wrap_in_measurement:
-                return self.replace(
-                    magnitude=magnitude,
-                    prefix=__other.prefix,
-                )
+                return self._derive(magnitude, __other.prefix)
 
             return magnitude
 
+        if isinstance(__other, Measurement):
+            return self._apply_converted_operator(
+                __other,
+                __operator,
+                wrap_in_measurement=wrap_in_measurement,
+            )
+
         return NotImplemented
 
+    def _apply_decimal_operator(
+        self: Self,
+        __other: Measurement,
+        __operator: collections.abc.Callable[[typing.Any, typing.Any], typing.Any],
+        /,
+        *,
+        wrap_in_measurement: bool,
+    ) -> typing.Any:  # noqa: ANN401
+        """Apply operator to measurements sharing unit, rounding per decimal_context."""
+        prefix = min(self.prefix, __other.prefix)
+        magnitude = _operate(
+            __operator,
+            self.magnitude
+            if self.prefix is prefix
+            else _convert(self.prefix, self.magnitude, prefix),
+            __other.magnitude
+            if __other.prefix is prefix
+            else _convert(__other.prefix, __other.magnitude, prefix),
+        )
+        if wrap_in_measurement:
+            return self._derive(magnitude, prefix)
+
+        return magnitude
+
+    def _apply_converted_operator(
+        self: Self,
+        __other: Measurement,
+        __operator: collections.abc.Callable[[typing.Any, typing.Any], typing.Any],
+        /,
+        *,
+        wrap_in_measurement: bool,
+    ) -> typing.Any:  # noqa: ANN401
+        """Apply operator to other converted to unit and prefix of self.
+
+        Sums, differences and remainders of units converting with an offset, e.g. °C
+        and K, are ambiguous between temperatures and temperature differences and
+        not supported.
+        """
+        # factors for int may be non-integral, use the magnitude type of self instead
+        number_type = type(__other.magnitude)
+        plan = conversion_plan(
+            __other.unit,
+            self.unit,
+            source_prefix=__other.prefix,
+            target_prefix=self.prefix,
+            number_type=type(self.magnitude) if number_type is int else number_type,
+        )
+        if plan is None:
+            return NotImplemented
+
+        factor, offset = plan
+        if offset and wrap_in_measurement:
+            return NotImplemented
+
+        magnitude = _operate(
+            __operator,
+            self.magnitude,
+            _operate(
+                operator.add,
+                _operate(operator.mul, __other.magnitude, factor),
+                offset,
+            ),
+        )
+        if wrap_in_measurement:
+            return self._derive(magnitude)
+
+        return magnitude
+
+    def _apply_unit_operator(
+        self: Self,
+        __other: Measurement,
+        __operator: collections.abc.Callable[[typing.Any, typing.Any], typing.Any],
+        /,
+    ) -> typing.Any:  # noqa: ANN401
+        """Multiply or divide measurements, deriving the unit of the result.
+
+        Dimensionless results are returned as bare numbers.
+        """
+        if isinstance(self.unit, str) or isinstance(__other.unit, str):
+            return NotImplemented
+
+        if __operator is operator.truediv:
+            unit, scale = _combine(self.unit, __other.unit, -1)
+            exponent: int = self.prefix - __other.prefix + scale
+        else:
+            unit, scale = _combine(self.unit, __other.unit, 1)
+            exponent = self.prefix + __other.prefix + scale
+
+        magnitude = _operate(__operator, self.magnitude, __other.magnitude)
+        if unit is None:
+            if exponent:
+                return _operate(
+                    operator.mul,
+                    magnitude,
+                    MetricPrefix.NONE.to(-exponent, number_type=type(magnitude)),
+                )
+
+            return magnitude
+
+        prefix = _prefix_from_exponent(exponent, engineering=False)
+        if prefix != exponent:
+            magnitude = _operate(
+                operator.mul,
+                magnitude,
+                MetricPrefix.NONE.to(prefix - exponent, number_type=type(magnitude)),
+            )
+
+        return self.replace(magnitude=magnitude, prefix=prefix, unit=unit)
+
+    def _equals(self: Self, __other: object, /) -> typing.Any:  # noqa: ANN401
+        """Return whether self equals other in coherent SI units without prefix.
+
+        Values compare exactly, or rounded to the nearest float as by __hash__ if
+        either magnitude is a float, so that equal measurements hash equal.
+        """
+        if not isinstance(__other, Measurement):
+            return NotImplemented
+
+        if self.unit == __other.unit:
+            if self.prefix is __other.prefix:
+                return self.magnitude == __other.magnitude
+        elif conversion_plan(__other.unit, self.unit) is None:
+            return NotImplemented
+
+        _, factor, offset = _hash_key(self.unit)
+        _, other_factor, other_offset = _hash_key(__other.unit)
+        if not isinstance(self.magnitude, float) and not isinstance(
+            __other.magnitude,
+            float,
+        ):
+            exact = _exact_value(self.magnitude, self.prefix, factor, offset)
+            other_exact = _exact_value(
+                __other.magnitude,
+                __other.prefix,
+                other_factor,
+                other_offset,
+            )
+            if exact is not None and other_exact is not None:
+                return exact == other_exact
+
+        return _hash_value(self.magnitude, self.prefix, factor, offset) == _hash_value(
+            __other.magnitude,
+            __other.prefix,
+            other_factor,
+            other_offset,
+        )
+
     def __lt__(self: Self, other: Measurement) -> bool:
         """Return self < other."""
         return self._apply_operator(other, operator.lt)
@@ -205,11 +881,26 @@ class Measurement(typing.Generic[_MagnitudeT]):
 
     def __eq__(self: Self, other: object) -> bool:
         """Return self == other."""
-        return self._apply_operator(other, operator.eq)
+        if (
+            isinstance(other, Measurement)
+            and self.prefix is other.prefix
+            and self.unit == other.unit
+        ):
+            return self.magnitude == other.magnitude
+
+        return self._equals(other)
 
     def __ne__(self: Self, other: object) -> bool:
         """Return self != other."""
-        return self._apply_operator(other, operator.ne)
+        if (
+            isinstance(other, Measurement)
+            and self.prefix is other.prefix
+            and self.unit == other.unit
+        ):
+            return self.magnitude != other.magnitude
+
+        equal = self._equals(other)
+        return equal if equal is NotImplemented else not equal
 
     def __gt__(self: Self, other: Measurement) -> bool:
         """Return self > other."""
@@ -219,19 +910,37 @@ class Measurement(typing.Generic[_MagnitudeT]):
         """Return self >= other."""
         return self._apply_operator(other, operator.ge)
 
-    @functools.cached_property
-    def _hash(self: Self) -> int:
-        return hash((self.prefix.convert(self.magnitude), self.unit))
-
     def __hash__(self: Self) -> int:
-        """Return hash(self)."""
-        return self._hash
+        """Return hash(self).
+
+        Equal to the hash of the value in coherent SI units without prefix, rounded
+        to the nearest float, and its dimension, or the unit for units without
+        conversion. Measurements of different prefixes or units compare equal by
+        this value if either magnitude is a float, so that equal measurements hash
+        equal.
+        """
+        magnitude = self.magnitude
+        key, factor, offset = _hash_key(self.unit)
+        if factor is not None:
+            return hash((_hash_value(magnitude, self.prefix, factor, offset), key))
+
+        if self.prefix is MetricPrefix.NONE and (
+            type(magnitude) is float
+            or (
+                type(magnitude) is int
+                and -_MAX_EXACT_FLOAT_INTEGER <= magnitude <= _MAX_EXACT_FLOAT_INTEGER
+            )
+        ):
+            return hash((magnitude, key))
+
+        return hash((_hash_value(magnitude, self.prefix), key))
 
     def __abs__(self: Self) -> Self:
         """Return abs(self)."""
-        return self.replace(
-            magnitude=abs(self.magnitude),
-        )
+        if not isinstance(self.magnitude, decimal.Decimal):
+            return self._derive(abs(self.magnitude))
+
+        return self._derive(_operate(operator.abs, self.magnitude))
 
     @typing.overload
     def __add__(
@@ -343,8 +1052,14 @@ class Measurement(typing.Generic[_MagnitudeT]):
         """Return self // other."""
         match other:
             case int() | float() | decimal.Decimal() | fractions.Fraction():
-                return self.replace(
-                    magnitude=self.magnitude // other,
+                if not (
+                    isinstance(self.magnitude, decimal.Decimal)
+                    or isinstance(other, decimal.Decimal)
+                ):
+                    return self._derive(self.magnitude // other)
+
+                return self._derive(
+                    _operate(operator.floordiv, self.magnitude, other),
                 )
 
         return self._apply_operator(other, operator.floordiv)
@@ -437,13 +1152,25 @@ class Measurement(typing.Generic[_MagnitudeT]):
         other: int | fractions.Fraction,
     ) -> Measurement[fractions.Fraction]: ...
 
+    @typing.overload
+    def __mul__(
+        self: Measurement,
+        other: Measurement,
+    ) -> Measurement | float | decimal.Decimal | fractions.Fraction: ...
+
     def __mul__(self, other):
         """Return self * other."""
         match other:
             case int() | float() | decimal.Decimal() | fractions.Fraction():
-                return self.replace(
-                    magnitude=self.magnitude * other,
-                )
+                if not (
+                    isinstance(self.magnitude, decimal.Decimal)
+                    or isinstance(other, decimal.Decimal)
+                ):
+                    return self._derive(self.magnitude * other)
+
+                return self._derive(_operate(operator.mul, self.magnitude, other))
+            case Measurement():
+                return self._apply_unit_operator(other, operator.mul)
 
         return NotImplemented
 
@@ -495,15 +1222,17 @@ class Measurement(typing.Generic[_MagnitudeT]):
 
     def __neg__(self: Self) -> Self:
         """Return -self."""
-        return self.replace(
-            magnitude=-self.magnitude,
-        )
+        if not isinstance(self.magnitude, decimal.Decimal):
+            return self._derive(-self.magnitude)
+
+        return self._derive(_operate(operator.neg, self.magnitude))
 
     def __pos__(self: Self) -> Self:
         """Return +self."""
-        return self.replace(
-            magnitude=+self.magnitude,
-        )
+        if not isinstance(self.magnitude, decimal.Decimal):
+            return self._derive(+self.magnitude)
+
+        return self._derive(_operate(operator.pos, self.magnitude))
 
     @typing.overload
     def __sub__(
@@ -597,53 +1326,63 @@ class Measurement(typing.Generic[_MagnitudeT]):
     def __truediv__(
         self: Measurement[int] | Measurement[float],
         other: Measurement[int] | Measurement[float],
-    ) -> float: ...
+    ) -> float | Measurement[float]: ...
 
     @typing.overload
     def __truediv__(
         self: Measurement[float],
         other: Measurement[fractions.Fraction],
-    ) -> float: ...
+    ) -> float | Measurement[float]: ...
 
     @typing.overload
     def __truediv__(
         self: Measurement[fractions.Fraction],
         other: Measurement[float],
-    ) -> float: ...
+    ) -> float | Measurement[float]: ...
 
     @typing.overload
     def __truediv__(
         self: Measurement[int] | Measurement[decimal.Decimal],
         other: Measurement[decimal.Decimal],
-    ) -> decimal.Decimal: ...
+    ) -> decimal.Decimal | Measurement[decimal.Decimal]: ...
 
     @typing.overload
     def __truediv__(
         self: Measurement[decimal.Decimal],
         other: Measurement[int] | Measurement[decimal.Decimal],
-    ) -> decimal.Decimal: ...
+    ) -> decimal.Decimal | Measurement[decimal.Decimal]: ...
 
     @typing.overload
     def __truediv__(
         self: Measurement[int] | Measurement[fractions.Fraction],
         other: Measurement[fractions.Fraction],
-    ) -> fractions.Fraction: ...
+    ) -> fractions.Fraction | Measurement[fractions.Fraction]: ...
 
     @typing.overload
     def __truediv__(
         self: Measurement[fractions.Fraction],
         other: Measurement[int] | Measurement[fractions.Fraction],
-    ) -> fractions.Fraction: ...
+    ) -> fractions.Fraction | Measurement[fractions.Fraction]: ...
 
     def __truediv__(self, other):
         """Return self / other."""
         match other:
             case int() | float() | decimal.Decimal() | fractions.Fraction():
-                return self.replace(
-                    magnitude=self.magnitude / other,
+                if not (
+                    isinstance(self.magnitude, decimal.Decimal)
+                    or isinstance(other, decimal.Decimal)
+                ):
+                    return self._derive(self.magnitude / other)
+
+                return self._derive(
+                    _operate(operator.truediv, self.magnitude, other),
                 )
 
-        return self._apply_operator(other, operator.truediv)
+        quotient = self._apply_operator(other, operator.truediv)
+        if quotient is NotImplemented and isinstance(other, Measurement):
+            return self._apply_unit_operator(other, operator.truediv)
+
+        return quotient
 
     def __bool__(self: Self) -> bool:
         """Return True if magnitude is nonzero; otherwise return False."""
@@ -677,11 +1416,27 @@ class Measurement(typing.Generic[_MagnitudeT]):
 
     def __round__(self, ndigits=None, /):
         """Return round(self)."""
-        return self.replace(
-            magnitude=round(self.magnitude, ndigits),
-        )
+        return self._derive(round(self.magnitude, ndigits))
+
+
+def _frozen_setattr(_self: Measurement, name: str, _value: object, /) -> None:
+    msg: str = f"cannot assign to field {name!r}"
+    raise dataclasses.FrozenInstanceError(msg)
+
+
+def _frozen_delattr(_self: Measurement, name: str, /) -> None:
+    msg: str = f"cannot delete field {name!r}"
+    raise dataclasses.FrozenInstanceError(msg)
+
+
+# The __setattr__ and __delattr__ generated for frozen slotted dataclasses refer to
+# the class before it was recreated with __slots__ and raise TypeError for names other
+# than fields, e.g. __orig_class__ as set by Measurement[int](...).
+Measurement.__setattr__ = _frozen_setattr  # type: ignore[method-assign,assignment]
+Measurement.__delattr__ = _frozen_delattr  # type: ignore[method-assign,assignment]
 
 
 __all__ = [
     "Measurement",
+    "decimal_context",
 ]
@@ -0,0 +1,493 @@
+"""Columnar measurement array model backed by NumPy.
+
+Requires the optional numpy dependency, e.g. `pip install peprock[numpy]`.
+
+Examples
+--------
+>>> array = MeasurementArray([1.5, 2.0, 3.25], MetricPrefix.kilo, Unit.watt)
+>>> array + MeasurementArray([500, 0, 750], unit=Unit.watt)
+MeasurementArray(magnitudes=array([2000., 2000., 4000.]), prefix=<MetricPrefix.NONE: 0>, unit=<Unit.watt: 'W'>)
+
+>>> array[0]
+Measurement(magnitude=1.5, prefix=<MetricPrefix.kilo: 3>, unit=<Unit.watt: 'W'>)
+
+>>> array > Measurement(1800, unit=Unit.watt)
+array([False,  True,  True])
+
+>>> MeasurementArray([0.0, 2500.0, -125.0], MetricPrefix.milli, Unit.watt).normalize()
+MeasurementArray(magnitudes=array([ 0.   ,  2.5  , -0.125]), prefix=<MetricPrefix.NONE: 0>, unit=<Unit.watt: 'W'>)
+
+
+"""  # noqa: E501
+
+from __future__ import annotations
+
+import dataclasses
+import numbers
+import operator
+import typing
+
+import numpy as np
+
+from .conversion import conversion_plan
+from .measurement import Measurement, _decimal_exponent
+from .metric_prefix import MetricPrefix
+from .unit import CompoundUnit, Unit  # noqa: TC001
+
+if typing.TYPE_CHECKING:
+    import collections.abc
+    import sys
+
+    import numpy.typing as npt
+
+    if sys.version_info >= (3, 11):
+        from typing import Self
+    else:
+        from typing_extensions import Self
+
+# least int64, exact as float, and negated its exclusive upper bound
+_INT64_MIN: typing.Final[float] = -(2.0**63)
+
+
+def _reflected(
+    operator_: collections.abc.Callable[[typing.Any, typing.Any], typing.Any],
+    /,
+) -> collections.abc.Callable[[typing.Any, typing.Any], typing.Any]:
+    def reflected(a: typing.Any, b: typing.Any, /) -> typing.Any:  # noqa: ANN401
+        return operator_(b, a)
+
+    return reflected
+
+
+_rsub = _reflected(operator.sub)
+_rmod = _reflected(operator.mod)
+_rfloordiv = _reflected(operator.floordiv)
+_rtruediv = _reflected(operator.truediv)
+
+
+@dataclasses.dataclass(frozen=True, eq=False)
+class MeasurementArray:
+    """Array of magnitudes sharing one metric prefix and unit.
+
+    Supports the operators of Measurement, applied to all elements at once. Prefix
+    alignment is done once per operation instead of once per element.
+    """
+
+    magnitudes: npt.NDArray[typing.Any]
+    prefix: MetricPrefix = MetricPrefix.NONE
+    unit: Unit | CompoundUnit | str | None = None
+
+    # defer reflected operations with NumPy operands to MeasurementArray
+    __array_ufunc__ = None
+
+    def __post_init__(self: Self) -> None:
+        """Store magnitudes as contiguous one-dimensional array."""
+        magnitudes = np.ascontiguousarray(self.magnitudes)
+        if magnitudes.ndim != 1:
+            msg: str = f"expected one-dimensional magnitudes, got {magnitudes.ndim=}"
+            raise ValueError(msg)
+
+        object.__setattr__(self, "magnitudes", magnitudes)
+
+    @classmethod
+    def from_measurements(
+        cls: type[Self],
+        measurements: collections.abc.Iterable[Measurement],
+        /,
+        *,
+        prefix: MetricPrefix | None = None,
+        unit: Unit | CompoundUnit | str | None = None,
+    ) -> Self:
+        """Create array from measurements sharing a unit, aligned to smallest prefix.
+
+        Magnitudes are converted to prefix and measurements must share unit, if
+        given. They also set prefix and unit of arrays of no measurements.
+        """
+        magnitudes: list[typing.Any] = []
+        prefixes: list[MetricPrefix] = []
+        units: set[Unit | CompoundUnit | str | None] = set()
+        for measurement in measurements:
+            magnitudes.append(measurement.magnitude)
+            prefixes.append(measurement.prefix)
+            units.add(measurement.unit)
+
+        if unit is not None:
+            units.add(unit)
+
+        if len(units) > 1:
+            msg: str = f"expected measurements sharing a unit, got {units!r}"
+            raise ValueError(msg)
+
+        unit = units.pop() if units else None
+        if not magnitudes:
+            return cls(np.empty(0), prefix or MetricPrefix.NONE, unit)
+
+        array = np.asarray(magnitudes)
+        smallest = min(prefixes)
+        if any(prefix_ is not smallest for prefix_ in prefixes):
+            prefix_array = np.asarray(prefixes)
+            for prefix_ in set(prefixes) - {smallest}:
+                mask = prefix_array == prefix_
+                array[mask] = array[mask] * prefix_.to(smallest)
+
+        measurement_array = cls(array, smallest, unit)
+        if prefix is None:
+            return measurement_array
+
+        return measurement_array.convert(prefix)
+
+    def convert(self: Self, to: MetricPrefix = MetricPrefix.NONE) -> Self:
+        """Return array with magnitudes converted from self.prefix to to."""
+        if self.prefix is to:
+            return self
+
+        if self.magnitudes.dtype == object:
+            # exact per element, e.g. decimal.Decimal in the current context
+            return dataclasses.replace(
+                self,
+                magnitudes=np.array(
+                    self.prefix.convert_all(self.magnitudes.tolist(), to),
+                    dtype=object,
+                ),
+                prefix=to,
+            )
+
+        if self.prefix > to:
+            factor: float = int(self.prefix.to(to))
+        else:
+            factor = self.prefix.to(to, number_type=float)
+
+        return dataclasses.replace(self, magnitudes=self.magnitudes * factor, prefix=to)
+
+    def normalize(self: Self, *, engineering: bool = True) -> Self:
+        """Return array rescaled to the metric prefix best fitting largest magnitude.
+
+        See Measurement.normalize, non-finite magnitudes are ignored. Object arrays,
+        e.g. of decimal.Decimal, are compared element by element.
+        """
+        if self.magnitudes.dtype == object:
+            maximum = max(
+                (
+                    abs(magnitude)
+                    for magnitude in self.magnitudes.tolist()
+                    if _decimal_exponent(magnitude) is not None
+                ),
+                default=0,
+            )
+        else:
+            magnitudes = np.abs(self.magnitudes[np.isfinite(self.magnitudes)])
+            maximum = magnitudes.max().item() if magnitudes.size else 0
+
+        return self.convert(
+            Measurement(maximum, self.prefix).normalize(engineering=engineering).prefix,
+        )
+
+    def __len__(self: Self) -> int:
+        """Return len(self)."""
+        return len(self.magnitudes)
+
+    @typing.overload
+    def __getitem__(self: Self, key: typing.SupportsIndex, /) -> Measurement: ...
+
+    @typing.overload
+    def __getitem__(self: Self, key: slice, /) -> Self: ...
+
+    def __getitem__(self, key, /):
+        """Return self[key]."""
+        if isinstance(key, slice):
+            return dataclasses.replace(self, magnitudes=self.magnitudes[key])
+
+        return Measurement(self.magnitudes[key].item(), self.prefix, self.unit)
+
+    def __iter__(self: Self) -> collections.abc.Iterator[Measurement]:
+        """Return iter(self)."""
+        prefix, unit = self.prefix, self.unit
+        for magnitude in self.magnitudes.tolist():
+            yield Measurement(magnitude, prefix, unit)
+
+    @typing.overload
+    def _apply_operator(
+        self: Self,
+        __other: object,
+        __operator: collections.abc.Callable[[typing.Any, typing.Any], typing.Any],
+        /,
+        *,
+        wrap_in_measurement_array: typing.Literal[False] = False,
+    ) -> npt.NDArray[typing.Any]: ...
+
+    @typing.overload
+    def _apply_operator(
+        self: Self,
+        __other: object,
+        __operator: collections.abc.Callable[[typing.Any, typing.Any], typing.Any],
+        /,
+        *,
+        wrap_in_measurement_array: typing.Literal[True],
+    ) -> Self: ...
+
+    def _apply_operator(
+        self,
+        __other,
+        __operator,
+        /,
+        *,
+        wrap_in_measurement_array=False,
+    ):
+        match __other:
+            case MeasurementArray():
+                other_magnitudes = __other.magnitudes
+            case Measurement():
+                other_magnitudes = __other.magnitude
+            case _:
+                return NotImplemented
+
+        if self.unit != __other.unit:
+            return self._apply_converted_operator(
+                __other,
+                other_magnitudes,
+                __operator,
+                wrap_in_measurement_array=wrap_in_measurement_array,
+            )
+
+        prefix = self.prefix
+        if (diff := self.prefix - __other.prefix) == 0:
+            magnitudes = __operator(self.magnitudes, other_magnitudes)
+        elif diff < 0:
+            magnitudes = __operator(
+                self.magnitudes,
+                other_magnitudes * __other.prefix.to(self.prefix),
+            )
+        else:
+            prefix = __other.prefix
+            magnitudes = __operator(
+                self.magnitudes * self.prefix.to(__other.prefix),
+                other_magnitudes,
+            )
+
+        if wrap_in_measurement_array:
+            return type(self)(magnitudes, prefix, self.unit)
+
+        return magnitudes
+
+    def _apply_converted_operator(
+        self: Self,
+        __other: MeasurementArray | Measurement,
+        __other_magnitudes: typing.Any,  # noqa: ANN401
+        __operator: collections.abc.Callable[[typing.Any, typing.Any], typing.Any],
+        /,
+        *,
+        wrap_in_measurement_array: bool,
+    ) -> typing.Any:  # noqa: ANN401
+        """Apply operator after converting other to prefix and unit of self.
+
+        Sums, differences and remainders of offset units such as °C and K are
+        ambiguous and unsupported, like for Measurement.
+        """
+        plan = conversion_plan(
+            __other.unit,
+            self.unit,
+            source_prefix=__other.prefix,
+            target_prefix=self.prefix,
+        )
+        if plan is None:
+            return NotImplemented
+
+        factor, offset = plan
+        if offset and wrap_in_measurement_array:
+            return NotImplemented
+
+        magnitudes = __operator(self.magnitudes, __other_magnitudes * factor + offset)
+        if wrap_in_measurement_array:
+            return type(self)(magnitudes, self.prefix, self.unit)
+
+        return magnitudes
+
+    def _apply_scalar_operator(
+        self: Self,
+        __other: object,
+        __operator: collections.abc.Callable[[typing.Any, typing.Any], typing.Any],
+        /,
+    ) -> Self:
+        match __other:
+            case int() | float() | complex() | np.number() | np.ndarray():
+                return dataclasses.replace(
+                    self,
+                    magnitudes=__operator(self.magnitudes, __other),
+                )
+            case numbers.Number():
+                # e.g. Decimal or Fraction, applied elementwise as for Measurement
+                return dataclasses.replace(
+                    self,
+                    magnitudes=__operator(self.magnitudes.astype(object), __other),
+                )
+
+        return NotImplemented
+
+    def __lt__(self: Self, other: object) -> npt.NDArray[np.bool_]:
+        """Return self < other."""
+        return self._apply_operator(other, operator.lt)
+
+    def __le__(self: Self, other: object) -> npt.NDArray[np.bool_]:
+        """Return self <= other."""
+        return self._apply_operator(other, operator.le)
+
+    def __eq__(self: Self, other: object) -> npt.NDArray[np.bool_]:  # type: ignore[override]
+        """Return self == other."""
+        return self._apply_operator(other, operator.eq)
+
+    def __ne__(self: Self, other: object) -> npt.NDArray[np.bool_]:  # type: ignore[override]
+        """Return self != other."""
+        return self._apply_operator(other, operator.ne)
+
+    def __gt__(self: Self, other: object) -> npt.NDArray[np.bool_]:
+        """Return self > other."""
+        return self._apply_operator(other, operator.gt)
+
+    def __ge__(self: Self, other: object) -> npt.NDArray[np.bool_]:
+        """Return self >= other."""
+        return self._apply_operator(other, operator.ge)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __abs__(self: Self) -> Self:
+        """Return abs(self)."""
+        return dataclasses.replace(self, magnitudes=np.abs(self.magnitudes))
+
+    def __add__(self: Self, other: MeasurementArray | Measurement) -> Self:
+        """Return self + other."""
+        return self._apply_operator(
+            other,
+            operator.add,
+            wrap_in_measurement_array=True,
+        )
+
+    def __radd__(self: Self, other: Measurement) -> Self:
+        """Return other + self."""
+        return self._apply_operator(
+            other,
+            operator.add,
+            wrap_in_measurement_array=True,
+        )
+
+    @typing.overload
+    def __floordiv__(
+        self: Self,
+        other: MeasurementArray | Measurement,
+    ) -> npt.NDArray[typing.Any]: ...
+
+    @typing.overload
+    def __floordiv__(
+        self: Self,
+        other: float | np.number | npt.NDArray[typing.Any],
+    ) -> Self: ...
+
+    def __floordiv__(self, other):
+        """Return self // other."""
+        match other:
+            case MeasurementArray() | Measurement():
+                return self._apply_operator(other, operator.floordiv)
+
+        return self._apply_scalar_operator(other, operator.floordiv)
+
+    def __rfloordiv__(self: Self, other: Measurement) -> npt.NDArray[typing.Any]:
+        """Return other // self."""
+        return self._apply_operator(other, _rfloordiv)
+
+    def __mod__(self: Self, other: MeasurementArray | Measurement) -> Self:
+        """Return self % other."""
+        return self._apply_operator(
+            other,
+            operator.mod,
+            wrap_in_measurement_array=True,
+        )
+
+    def __rmod__(self: Self, other: Measurement) -> Self:
+        """Return other % self."""
+        return self._apply_operator(other, _rmod, wrap_in_measurement_array=True)
+
+    def __mul__(
+        self: Self,
+        other: float | np.number | npt.NDArray[typing.Any],
+    ) -> Self:
+        """Return self * other."""
+        return self._apply_scalar_operator(other, operator.mul)
+
+    def __rmul__(
+        self: Self,
+        other: float | np.number | npt.NDArray[typing.Any],
+    ) -> Self:
+        """Return other * self."""
+        return self._apply_scalar_operator(other, operator.mul)
+
+    def __neg__(self: Self) -> Self:
+        """Return -self."""
+        return dataclasses.replace(self, magnitudes=-self.magnitudes)
+
+    def __pos__(self: Self) -> Self:
+        """Return +self."""
+        return dataclasses.replace(self, magnitudes=+self.magnitudes)
+
+    def __sub__(self: Self, other: MeasurementArray | Measurement) -> Self:
+        """Return self - other."""
+        return self._apply_operator(
+            other,
+            operator.sub,
+            wrap_in_measurement_array=True,
+        )
+
+    def __rsub__(self: Self, other: Measurement) -> Self:
+        """Return other - self."""
+        return self._apply_operator(other, _rsub, wrap_in_measurement_array=True)
+
+    @typing.overload
+    def __truediv__(
+        self: Self,
+        other: MeasurementArray | Measurement,
+    ) -> npt.NDArray[typing.Any]: ...
+
+    @typing.overload
+    def __truediv__(
+        self: Self,
+        other: float | np.number | npt.NDArray[typing.Any],
+    ) -> Self: ...
+
+    def __truediv__(self, other):
+        """Return self / other."""
+        match other:
+            case MeasurementArray() | Measurement():
+                return self._apply_operator(other, operator.truediv)
+
+        return self._apply_scalar_operator(other, operator.truediv)
+
+    def __rtruediv__(self: Self, other: Measurement) -> npt.NDArray[typing.Any]:
+        """Return other / self."""
+        return self._apply_operator(other, _rtruediv)
+
+    def __round__(self: Self, ndigits: int | None = None, /) -> Self:
+        """Return round(self).
+
+        Magnitudes round to int64 if ndigits is None, raising ValueError for NaN and
+        OverflowError for magnitudes out of range, as round does for float.
+        """
+        if ndigits is None:
+            magnitudes = np.rint(self.magnitudes)
+            if magnitudes.dtype.kind == "f":
+                if np.isnan(magnitudes).any():
+                    msg: str = "cannot convert float NaN to integer"
+                    raise ValueError(msg)
+
+                if not ((magnitudes >= _INT64_MIN) & (magnitudes < -_INT64_MIN)).all():
+                    msg = "cannot convert magnitudes out of range to int64"
+                    raise OverflowError(msg)
+
+            return dataclasses.replace(self, magnitudes=magnitudes.astype(np.int64))
+
+        return dataclasses.replace(
+            self,
+            magnitudes=np.round(self.magnitudes, ndigits),
+        )
+
+
+__all__ = [
+    "MeasurementArray",
+]
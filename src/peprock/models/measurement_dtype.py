@@ -0,0 +1,869 @@
+"""Pandas extension dtype and Arrow extension type for measurement columns.
+
+Requires the optional pandas dependency, e.g. `pip install peprock[pandas]`, which
+includes numpy and pyarrow. The dtype is registered with pandas and Arrow once this
+module is imported, e.g. by accessing peprock.models.MeasurementDtype.
+
+Magnitudes are stored as int64 or float64 array with a mask of missing values, prefix
+and unit are dtype metadata. Arithmetic and comparisons follow MeasurementArray and
+thereby Measurement. Conversion to and from Arrow shares the magnitude buffer.
+
+Examples
+--------
+>>> series = pd.Series(
+...     [Measurement(1.5, MetricPrefix.kilo, Unit.watt), None],
+...     dtype=MeasurementDtype(MetricPrefix.kilo, Unit.watt),
+... )
+>>> series.dtype
+MeasurementDtype(prefix=<MetricPrefix.kilo: 3>, unit=<Unit.watt: 'W'>, magnitude_dtype=dtype('float64'))
+
+>>> (series + Measurement(500, unit=Unit.watt)).tolist()
+[Measurement(magnitude=2000.0, prefix=<MetricPrefix.NONE: 0>, unit=<Unit.watt: 'W'>), <NA>]
+
+>>> table = pa.table({"power": series})
+>>> table.schema.field("power").type
+MeasurementArrowType(prefix=<MetricPrefix.kilo: 3>, unit=<Unit.watt: 'W'>, storage_type=DataType(double))
+>>> table.to_pandas()["power"].dtype == series.dtype
+True
+
+
+"""  # noqa: E501
+
+from __future__ import annotations
+
+import contextlib
+import numbers
+import re
+import struct
+import typing
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from .codec import _pack_unit, _prefix, _unpack_unit
+from .measurement import Measurement, _format_suffix
+from .measurement_array import MeasurementArray
+from .metric_prefix import MetricPrefix
+from .unit import CompoundUnit, Unit  # noqa: TC001
+
+if typing.TYPE_CHECKING:
+    import builtins
+    import collections.abc
+    import sys
+
+    import numpy.typing as npt
+
+    if sys.version_info >= (3, 11):
+        from typing import Self
+    else:
+        from typing_extensions import Self
+
+_NAME: typing.Final[str] = "measurement"
+_NAME_PATTERN: typing.Final[re.Pattern[str]] = re.compile(
+    rf"{_NAME}\[(?P<magnitude_dtype>int64|float64)(?:, (?P<suffix>.+))?\]",
+)
+_MAGNITUDE_DTYPES: typing.Final[dict[str, np.dtype[typing.Any]]] = {
+    "b": np.dtype(np.int64),
+    "i": np.dtype(np.int64),
+    "u": np.dtype(np.int64),
+    "f": np.dtype(np.float64),
+}
+
+_ARROW_EXTENSION_NAME: typing.Final[str] = "peprock.measurement"
+# prefix exponent and unit id, followed by the unit extension of the codec
+_ARROW_METADATA: typing.Final[struct.Struct] = struct.Struct("<bH")
+
+
+@pd.api.extensions.register_extension_dtype
+class MeasurementDtype(pd.api.extensions.ExtensionDtype):
+    """Pandas dtype of measurements sharing metric prefix and unit.
+
+    The name is measurement[<magnitude dtype>, <suffix>], e.g. measurement[int64, kW],
+    and parsed like the suffix of Measurement.parse, so compound units are parsed as
+    str units.
+    """
+
+    _metadata = ("prefix", "unit", "magnitude_dtype")
+
+    type = Measurement
+    na_value = pd.NA
+
+    def __init__(
+        self: MeasurementDtype,
+        prefix: MetricPrefix = MetricPrefix.NONE,
+        unit: Unit | CompoundUnit | str | None = None,
+        magnitude_dtype: npt.DTypeLike = np.float64,
+    ) -> None:
+        """Initialize dtype of int64 or float64 magnitudes in prefix and unit."""
+        magnitude_dtype = np.dtype(magnitude_dtype)
+        if magnitude_dtype not in _MAGNITUDE_DTYPES.values():
+            msg: str = f"expected int64 or float64 magnitudes, got {magnitude_dtype}"
+            raise TypeError(msg)
+
+        self.prefix: MetricPrefix = prefix
+        self.unit: Unit | CompoundUnit | str | None = unit
+        self.magnitude_dtype: np.dtype[typing.Any] = magnitude_dtype
+
+    def __repr__(self: MeasurementDtype) -> str:
+        """Return repr(self)."""
+        return (
+            f"{type(self).__name__}(prefix={self.prefix!r}, unit={self.unit!r}, "
+            f"magnitude_dtype={self.magnitude_dtype!r})"
+        )
+
+    @property
+    def name(self: MeasurementDtype) -> str:
+        """Name of dtype, e.g. measurement[float64, kW]."""
+        if suffix := _format_suffix(self.prefix, self.unit):
+            return f"{_NAME}[{self.magnitude_dtype},{suffix}]"
+
+        return f"{_NAME}[{self.magnitude_dtype}]"
+
+    @property
+    def _is_numeric(self: MeasurementDtype) -> bool:
+        return True
+
+    @classmethod
+    def construct_array_type(
+        cls: builtins.type[MeasurementDtype],
+    ) -> builtins.type[MeasurementExtensionArray]:
+        """Return MeasurementExtensionArray."""
+        return MeasurementExtensionArray
+
+    @classmethod
+    def construct_from_string(cls: builtins.type[Self], string: object) -> Self:
+        """Return dtype of name, e.g. measurement[int64, kW] or measurement."""
+        if not isinstance(string, str):
+            msg: str = f"expected str, got {type(string).__name__}"
+            raise TypeError(msg)
+
+        if string == _NAME:
+            return cls()
+
+        if (match := _NAME_PATTERN.fullmatch(string)) is None:
+            msg = f"cannot construct a {cls.__name__!r} from {string!r}"
+            raise TypeError(msg)
+
+        if (suffix := match["suffix"]) is None:
+            return cls(magnitude_dtype=match["magnitude_dtype"])
+
+        measurement = Measurement.parse(f"0 {suffix}")
+        return cls(measurement.prefix, measurement.unit, match["magnitude_dtype"])
+
+    def __from_arrow__(
+        self: MeasurementDtype,
+        array: pa.Array | pa.ChunkedArray,
+    ) -> MeasurementExtensionArray:
+        """Return array of Arrow array, sharing the magnitude buffer of one chunk."""
+        chunks = array.chunks if isinstance(array, pa.ChunkedArray) else [array]
+        columns = [_from_arrow_chunk(chunk, self.magnitude_dtype) for chunk in chunks]
+        if len(columns) == 1:
+            ((magnitudes, mask),) = columns
+        else:
+            magnitudes = np.concatenate(
+                [magnitudes for magnitudes, _ in columns]
+                or [np.empty(0, self.magnitude_dtype)],
+            )
+            mask = np.concatenate(
+                [mask for _, mask in columns] or [np.empty(0, np.bool_)],
+            )
+
+        return MeasurementExtensionArray(magnitudes, mask, self.prefix, self.unit)
+
+
+class MeasurementExtensionArray(pd.api.extensions.ExtensionArray):
+    """Pandas extension array of measurements sharing metric prefix and unit.
+
+    Magnitudes are stored as int64 or float64 array, missing values in a mask.
+    """
+
+    __array_priority__ = 1000
+
+    def __init__(
+        self: MeasurementExtensionArray,
+        magnitudes: npt.ArrayLike,
+        mask: npt.ArrayLike | None = None,
+        prefix: MetricPrefix = MetricPrefix.NONE,
+        unit: Unit | CompoundUnit | str | None = None,
+    ) -> None:
+        """Initialize array of int or float magnitudes, masking missing values."""
+        magnitudes = np.asarray(magnitudes)
+        try:
+            magnitude_dtype = _MAGNITUDE_DTYPES[magnitudes.dtype.kind]
+        except KeyError:
+            msg: str = f"expected int or float magnitudes, got {magnitudes.dtype}"
+            raise TypeError(msg) from None
+
+        magnitudes = magnitudes.astype(magnitude_dtype, copy=False)
+        if magnitudes.ndim != 1:
+            msg = f"expected one-dimensional magnitudes, got {magnitudes.ndim=}"
+            raise ValueError(msg)
+
+        if mask is None:
+            mask = np.zeros(len(magnitudes), dtype=np.bool_)
+        else:
+            mask = np.asarray(mask, dtype=np.bool_)
+            if mask.shape != magnitudes.shape:
+                msg = f"expected mask of shape {magnitudes.shape}, got {mask.shape}"
+                raise ValueError(msg)
+
+        self._magnitudes: npt.NDArray[typing.Any] = magnitudes
+        self._mask: npt.NDArray[np.bool_] = mask
+        self._dtype: MeasurementDtype = MeasurementDtype(prefix, unit, magnitude_dtype)
+
+    @classmethod
+    def _from_sequence(
+        cls: type[Self],
+        scalars: collections.abc.Iterable[typing.Any],
+        *,
+        dtype: MeasurementDtype | str | None = None,
+        copy: bool = False,
+    ) -> Self:
+        if isinstance(dtype, str):
+            dtype = MeasurementDtype.construct_from_string(dtype)
+
+        if isinstance(scalars, MeasurementExtensionArray):
+            array = scalars.copy() if copy else scalars
+            return array if dtype is None else array.astype(dtype, copy=False)
+
+        if isinstance(scalars, np.ndarray) and scalars.dtype.kind in _MAGNITUDE_DTYPES:
+            # magnitudes in prefix and unit of dtype, e.g. on astype
+            dtype = dtype or MeasurementDtype()
+            return cls(
+                scalars.astype(dtype.magnitude_dtype, copy=copy),
+                None,
+                dtype.prefix,
+                dtype.unit,
+            )
+
+        scalars = list(scalars)
+        if any(isinstance(scalar, str) for scalar in scalars):
+            # e.g. on astype of strings
+            return cls._from_sequence_of_strings(scalars, dtype=dtype)
+
+        return cls._from_measurements(scalars, dtype)
+
+    @classmethod
+    def _from_measurements(
+        cls: type[Self],
+        scalars: collections.abc.Iterable[typing.Any],
+        dtype: MeasurementDtype | None,
+        /,
+    ) -> Self:
+        measurements: list[Measurement[typing.Any] | None] = []
+        units: set[Unit | CompoundUnit | str | None] = set()
+        for scalar in scalars:
+            if isinstance(scalar, Measurement):
+                measurements.append(scalar)
+                units.add(scalar.unit)
+            elif pd.isna(scalar):
+                measurements.append(None)
+            elif dtype is not None and isinstance(scalar, numbers.Real):
+                # magnitude in prefix and unit of dtype
+                measurements.append(Measurement(scalar, dtype.prefix, dtype.unit))
+                units.add(dtype.unit)
+            else:
+                msg: str = f"expected measurement, got {scalar!r}"
+                raise TypeError(msg)
+
+        if dtype is not None:
+            units.add(dtype.unit)
+
+        if len(units) > 1:
+            msg = f"expected measurements sharing a unit, got {units!r}"
+            raise ValueError(msg)
+
+        if dtype is None:
+            prefix = min(
+                (
+                    measurement.prefix
+                    for measurement in measurements
+                    if measurement is not None
+                ),
+                default=MetricPrefix.NONE,
+            )
+        else:
+            prefix = dtype.prefix
+
+        magnitudes, mask = _magnitudes(measurements, prefix)
+        if dtype is not None and magnitudes.dtype != dtype.magnitude_dtype:
+            with np.errstate(invalid="ignore"):
+                converted = magnitudes.astype(dtype.magnitude_dtype)
+            if (converted != magnitudes)[~mask].any():
+                msg = f"cannot store magnitudes as {dtype.magnitude_dtype} exactly"
+                raise TypeError(msg)
+
+            magnitudes = converted
+
+        return cls(magnitudes, mask, prefix, units.pop() if units else None)
+
+    @classmethod
+    def _from_sequence_of_strings(
+        cls: type[Self],
+        strings: collections.abc.Iterable[str],
+        *,
+        dtype: MeasurementDtype | str | None = None,
+        copy: bool = False,  # noqa: ARG003
+    ) -> Self:
+        if isinstance(dtype, str):
+            dtype = MeasurementDtype.construct_from_string(dtype)
+
+        return cls._from_measurements(
+            (
+                None if pd.isna(string) else Measurement.parse(string)
+                for string in strings
+            ),
+            dtype,
+        )
+
+    @classmethod
+    def _from_factorized(
+        cls: type[Self],
+        values: npt.NDArray[typing.Any],
+        original: MeasurementExtensionArray,
+    ) -> Self:
+        return cls._from_sequence(values, dtype=original.dtype)
+
+    @classmethod
+    def _concat_same_type(
+        cls: type[Self],
+        to_concat: collections.abc.Sequence[MeasurementExtensionArray],
+    ) -> Self:
+        units = {array.unit for array in to_concat}
+        if len(units) > 1:
+            msg: str = f"expected measurements sharing a unit, got {units!r}"
+            raise ValueError(msg)
+
+        prefix = min((array.prefix for array in to_concat), default=MetricPrefix.NONE)
+        return cls(
+            np.concatenate(
+                [
+                    array.to_measurement_array().convert(prefix).magnitudes
+                    for array in to_concat
+                ]
+                or [np.empty(0)],
+            ),
+            np.concatenate(
+                [array._mask for array in to_concat]  # noqa: SLF001
+                or [np.empty(0, np.bool_)],
+            ),
+            prefix,
+            units.pop() if units else None,
+        )
+
+    @property
+    def dtype(self: MeasurementExtensionArray) -> MeasurementDtype:
+        """Dtype of array."""
+        return self._dtype
+
+    @property
+    def prefix(self: MeasurementExtensionArray) -> MetricPrefix:
+        """Metric prefix of magnitudes."""
+        return self._dtype.prefix
+
+    @property
+    def unit(self: MeasurementExtensionArray) -> Unit | CompoundUnit | str | None:
+        """Unit of magnitudes."""
+        return self._dtype.unit
+
+    @property
+    def magnitudes(self: MeasurementExtensionArray) -> npt.NDArray[typing.Any]:
+        """Magnitudes, undefined where masked."""
+        return self._magnitudes
+
+    @property
+    def nbytes(self: MeasurementExtensionArray) -> int:
+        """Number of bytes of magnitudes and mask."""
+        return self._magnitudes.nbytes + self._mask.nbytes
+
+    def to_measurement_array(self: MeasurementExtensionArray) -> MeasurementArray:
+        """Return MeasurementArray sharing magnitudes, regardless of mask."""
+        return MeasurementArray(self._magnitudes, self.prefix, self.unit)
+
+    def __len__(self: MeasurementExtensionArray) -> int:
+        """Return len(self)."""
+        return len(self._magnitudes)
+
+    def __iter__(
+        self: MeasurementExtensionArray,
+    ) -> collections.abc.Iterator[typing.Any]:
+        """Return iterator over measurements, or pd.NA where missing."""
+        prefix, unit = self.prefix, self.unit
+        for magnitude, missing in zip(
+            self._magnitudes.tolist(),
+            self._mask.tolist(),
+            strict=True,
+        ):
+            yield pd.NA if missing else Measurement(magnitude, prefix, unit)
+
+    def __getitem__(
+        self: MeasurementExtensionArray,
+        item: typing.Any,  # noqa: ANN401
+    ) -> typing.Any:  # noqa: ANN401
+        """Return self[item]."""
+        if isinstance(item, (int, np.integer)):
+            if self._mask[item]:
+                return pd.NA
+
+            return Measurement(self._magnitudes[item].item(), self.prefix, self.unit)
+
+        item = pd.api.indexers.check_array_indexer(self, item)
+        return type(self)(
+            self._magnitudes[item],
+            self._mask[item],
+            self.prefix,
+            self.unit,
+        )
+
+    def __setitem__(
+        self: MeasurementExtensionArray,
+        key: typing.Any,  # noqa: ANN401
+        value: typing.Any,  # noqa: ANN401
+    ) -> None:
+        """Set self[key] to measurements in unit of self, or to missing values."""
+        key = pd.api.indexers.check_array_indexer(self, key)
+        if isinstance(value, Measurement) or pd.api.types.is_scalar(value):
+            value = [value]
+
+        array = self._from_sequence(value, dtype=self.dtype)
+        if not self._magnitudes.flags.writeable:
+            # magnitudes shared with an Arrow buffer are copied on write
+            self._magnitudes = self._magnitudes.copy()
+
+        if len(array) == 1:
+            self._magnitudes[key] = array.magnitudes[0]
+            self._mask[key] = array.isna()[0]
+        else:
+            self._magnitudes[key] = array.magnitudes
+            self._mask[key] = array.isna()
+
+    def __array__(
+        self: MeasurementExtensionArray,
+        dtype: npt.DTypeLike | None = None,
+        copy: bool | None = None,  # noqa: FBT001
+    ) -> npt.NDArray[typing.Any]:
+        """Return object array of measurements, or pd.NA where missing."""
+        array = np.empty(len(self), dtype=object)
+        array[:] = list(self)
+        return array if dtype is None else array.astype(dtype)
+
+    def __arrow_array__(
+        self: MeasurementExtensionArray,
+        type: pa.DataType | None = None,  # noqa: A002
+    ) -> pa.ExtensionArray:
+        """Return Arrow extension array sharing the magnitude buffer."""
+        storage = pa.array(
+            self._magnitudes,
+            mask=self._mask if self._mask.any() else None,
+        )
+        return pa.ExtensionArray.from_storage(
+            MeasurementArrowType(self.prefix, self.unit, storage.type),
+            storage,
+        )
+
+    def _formatter(
+        self: MeasurementExtensionArray,
+        boxed: bool = False,  # noqa: ARG002, FBT001, FBT002
+    ) -> collections.abc.Callable[[typing.Any], str]:
+        return str
+
+    def isna(self: MeasurementExtensionArray) -> npt.NDArray[np.bool_]:
+        """Return mask of missing values."""
+        return self._mask.copy()
+
+    def copy(self: Self) -> Self:
+        """Return copy of array."""
+        return type(self)(
+            self._magnitudes.copy(),
+            self._mask.copy(),
+            self.prefix,
+            self.unit,
+        )
+
+    def take(
+        self: Self,
+        indices: collections.abc.Sequence[int] | npt.NDArray[np.intp],
+        *,
+        allow_fill: bool = False,
+        fill_value: Measurement[typing.Any] | None = None,
+    ) -> Self:
+        """Return array of measurements at indices, see ExtensionArray.take."""
+        if allow_fill and fill_value is not None and not pd.isna(fill_value):
+            (magnitude,) = self._from_sequence(
+                [fill_value],
+                dtype=self.dtype,
+            ).magnitudes
+            fill_missing = False
+        else:
+            magnitude = 0
+            fill_missing = True
+
+        take = pd.api.extensions.take
+        return type(self)(
+            take(
+                self._magnitudes,
+                indices,
+                allow_fill=allow_fill,
+                fill_value=magnitude,
+            ),
+            take(self._mask, indices, allow_fill=allow_fill, fill_value=fill_missing),
+            self.prefix,
+            self.unit,
+        )
+
+    def astype(
+        self: MeasurementExtensionArray,
+        dtype: typing.Any,  # noqa: ANN401
+        copy: bool = True,  # noqa: FBT001, FBT002
+    ) -> typing.Any:  # noqa: ANN401
+        """Return array cast to dtype, converting magnitudes to prefix of dtype."""
+        dtype = pd.api.types.pandas_dtype(dtype)
+        if not isinstance(dtype, MeasurementDtype):
+            return super().astype(dtype, copy=copy)
+
+        if dtype.unit != self.unit:
+            msg: str = f"cannot convert {self.unit!r} to {dtype.unit!r}"
+            raise ValueError(msg)
+
+        if dtype == self.dtype:
+            return self.copy() if copy else self
+
+        return type(self)(
+            self.to_measurement_array()
+            .convert(dtype.prefix)
+            .magnitudes.astype(dtype.magnitude_dtype, copy=False),
+            self._mask.copy() if copy else self._mask,
+            dtype.prefix,
+            dtype.unit,
+        )
+
+    def factorize(
+        self: MeasurementExtensionArray,
+        use_na_sentinel: bool = True,  # noqa: FBT001, FBT002
+    ) -> tuple[npt.NDArray[np.intp], MeasurementExtensionArray]:
+        """Return codes and unique measurements, factorizing magnitudes."""
+        valid = ~self._mask
+        codes = np.full(len(self), -1, dtype=np.intp)
+        codes[valid], uniques = pd.factorize(self._magnitudes[valid])
+        mask = np.zeros(len(uniques), dtype=np.bool_)
+        if not use_na_sentinel and not valid.all():
+            codes[~valid] = len(uniques)
+            uniques = np.append(uniques, self._magnitudes.dtype.type(0))
+            mask = np.append(mask, True)
+
+        return codes, type(self)(uniques, mask, self.prefix, self.unit)
+
+    def value_counts(
+        self: MeasurementExtensionArray,
+        dropna: bool = True,  # noqa: FBT001, FBT002
+    ) -> pd.Series:
+        """Return series of counts indexed by unique measurements."""
+        codes, uniques = self.factorize(use_na_sentinel=dropna)
+        return pd.Series(
+            np.bincount(codes[codes >= 0], minlength=len(uniques)),
+            index=pd.Index(uniques),
+            name="count",
+        )
+
+    def _values_for_argsort(
+        self: MeasurementExtensionArray,
+    ) -> npt.NDArray[typing.Any]:
+        return self._magnitudes
+
+    def _reduce(
+        self: MeasurementExtensionArray,
+        name: str,
+        *,
+        skipna: bool = True,
+        keepdims: bool = False,
+        **kwargs: typing.Any,  # noqa: ARG002
+    ) -> typing.Any:  # noqa: ANN401
+        if name not in {"sum", "min", "max", "mean", "median"}:
+            msg: str = f"cannot perform {name!r} with type {self.dtype}"
+            raise TypeError(msg)
+
+        magnitudes = self._magnitudes[~self._mask]
+        if (not skipna and self._mask.any()) or (not magnitudes.size and name != "sum"):
+            result: typing.Any = pd.NA
+        else:
+            result = Measurement(
+                getattr(np, name)(magnitudes).item(),
+                self.prefix,
+                self.unit,
+            )
+
+        if keepdims:
+            return self._from_sequence([result], dtype=self.dtype)
+
+        return result
+
+    def _apply_operator(
+        self: MeasurementExtensionArray,
+        other: object,
+        method: collections.abc.Callable[[MeasurementArray, typing.Any], typing.Any],
+        /,
+    ) -> typing.Any:  # noqa: ANN401
+        """Apply method of MeasurementArray to self and other, merging masks."""
+        if isinstance(other, pd.DataFrame | pd.Series | pd.Index):
+            # defer to pandas, which unpacks other and calls the operator again
+            return NotImplemented
+
+        mask = self._mask
+        if isinstance(other, MeasurementExtensionArray):
+            mask = mask | other._mask  # noqa: SLF001
+            other = other.to_measurement_array()
+
+        # undefined magnitudes of missing values may divide by zero
+        with np.errstate(all="ignore"):
+            result = method(self.to_measurement_array(), other)
+
+        if result is NotImplemented:
+            return NotImplemented
+
+        if isinstance(result, MeasurementArray):
+            return type(self)(
+                result.magnitudes,
+                mask.copy(),
+                result.prefix,
+                result.unit,
+            )
+
+        if result.dtype.kind == "b":
+            return pd.arrays.BooleanArray(result, mask.copy())
+
+        if result.dtype.kind == "f":
+            return pd.arrays.FloatingArray(result, mask.copy())
+
+        return pd.arrays.IntegerArray(result, mask.copy())
+
+    def _apply_unary_operator(
+        self: Self,
+        operator_: collections.abc.Callable[[typing.Any], typing.Any],
+        /,
+    ) -> Self:
+        return type(self)(
+            operator_(self._magnitudes),
+            self._mask.copy(),
+            self.prefix,
+            self.unit,
+        )
+
+    def __eq__(self: MeasurementExtensionArray, other: object) -> typing.Any:  # noqa: ANN401
+        """Return self == other."""
+        return self._apply_operator(other, MeasurementArray.__eq__)
+
+    def __ne__(self: MeasurementExtensionArray, other: object) -> typing.Any:  # noqa: ANN401
+        """Return self != other."""
+        return self._apply_operator(other, MeasurementArray.__ne__)
+
+    def __lt__(self: MeasurementExtensionArray, other: object) -> typing.Any:  # noqa: ANN401
+        """Return self < other."""
+        return self._apply_operator(other, MeasurementArray.__lt__)
+
+    def __le__(self: MeasurementExtensionArray, other: object) -> typing.Any:  # noqa: ANN401
+        """Return self <= other."""
+        return self._apply_operator(other, MeasurementArray.__le__)
+
+    def __gt__(self: MeasurementExtensionArray, other: object) -> typing.Any:  # noqa: ANN401
+        """Return self > other."""
+        return self._apply_operator(other, MeasurementArray.__gt__)
+
+    def __ge__(self: MeasurementExtensionArray, other: object) -> typing.Any:  # noqa: ANN401
+        """Return self >= other."""
+        return self._apply_operator(other, MeasurementArray.__ge__)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __abs__(self: Self) -> Self:
+        """Return abs(self)."""
+        return self._apply_unary_operator(np.abs)
+
+    def __neg__(self: Self) -> Self:
+        """Return -self."""
+        return self._apply_unary_operator(np.negative)
+
+    def __pos__(self: Self) -> Self:
+        """Return +self."""
+        return self._apply_unary_operator(np.positive)
+
+    def __add__(self: MeasurementExtensionArray, other: object) -> typing.Any:  # noqa: ANN401
+        """Return self + other."""
+        return self._apply_operator(other, MeasurementArray.__add__)
+
+    def __radd__(self: MeasurementExtensionArray, other: object) -> typing.Any:  # noqa: ANN401
+        """Return other + self."""
+        return self._apply_operator(other, MeasurementArray.__radd__)
+
+    def __floordiv__(self: MeasurementExtensionArray, other: object) -> typing.Any:  # noqa: ANN401
+        """Return self // other."""
+        return self._apply_operator(other, MeasurementArray.__floordiv__)
+
+    def __rfloordiv__(self: MeasurementExtensionArray, other: object) -> typing.Any:  # noqa: ANN401
+        """Return other // self."""
+        return self._apply_operator(other, MeasurementArray.__rfloordiv__)
+
+    def __mod__(self: MeasurementExtensionArray, other: object) -> typing.Any:  # noqa: ANN401
+        """Return self % other."""
+        return self._apply_operator(other, MeasurementArray.__mod__)
+
+    def __rmod__(self: MeasurementExtensionArray, other: object) -> typing.Any:  # noqa: ANN401
+        """Return other % self."""
+        return self._apply_operator(other, MeasurementArray.__rmod__)
+
+    def __mul__(self: MeasurementExtensionArray, other: object) -> typing.Any:  # noqa: ANN401
+        """Return self * other."""
+        return self._apply_operator(other, MeasurementArray.__mul__)
+
+    def __rmul__(self: MeasurementExtensionArray, other: object) -> typing.Any:  # noqa: ANN401
+        """Return other * self."""
+        return self._apply_operator(other, MeasurementArray.__rmul__)
+
+    def __sub__(self: MeasurementExtensionArray, other: object) -> typing.Any:  # noqa: ANN401
+        """Return self - other."""
+        return self._apply_operator(other, MeasurementArray.__sub__)
+
+    def __rsub__(self: MeasurementExtensionArray, other: object) -> typing.Any:  # noqa: ANN401
+        """Return other - self."""
+        return self._apply_operator(other, MeasurementArray.__rsub__)
+
+    def __truediv__(self: MeasurementExtensionArray, other: object) -> typing.Any:  # noqa: ANN401
+        """Return self / other."""
+        return self._apply_operator(other, MeasurementArray.__truediv__)
+
+    def __rtruediv__(self: MeasurementExtensionArray, other: object) -> typing.Any:  # noqa: ANN401
+        """Return other / self."""
+        return self._apply_operator(other, MeasurementArray.__rtruediv__)
+
+
+class MeasurementArrowType(pa.ExtensionType):
+    """Arrow extension type of measurements sharing metric prefix and unit.
+
+    Stored as int64 or float64 array, with prefix and unit serialized as metadata.
+    """
+
+    def __init__(
+        self: MeasurementArrowType,
+        prefix: MetricPrefix = MetricPrefix.NONE,
+        unit: Unit | CompoundUnit | str | None = None,
+        storage_type: pa.DataType | None = None,
+    ) -> None:
+        """Initialize type of float64 storage, unless storage_type is int64."""
+        if storage_type is None:
+            storage_type = pa.float64()
+
+        if storage_type not in (pa.int64(), pa.float64()):
+            msg: str = f"expected int64 or float64 storage, got {storage_type}"
+            raise TypeError(msg)
+
+        self.prefix: MetricPrefix = prefix
+        self.unit: Unit | CompoundUnit | str | None = unit
+        super().__init__(storage_type, _ARROW_EXTENSION_NAME)
+
+    def __repr__(self: MeasurementArrowType) -> str:
+        """Return repr(self)."""
+        return (
+            f"{type(self).__name__}(prefix={self.prefix!r}, unit={self.unit!r}, "
+            f"storage_type={self.storage_type!r})"
+        )
+
+    def __arrow_ext_serialize__(self: MeasurementArrowType) -> bytes:
+        """Return prefix and unit, packed like the header of the codec."""
+        unit_id, unit_extension = _pack_unit(self.unit)
+        return _ARROW_METADATA.pack(self.prefix, unit_id) + unit_extension
+
+    @classmethod
+    def __arrow_ext_deserialize__(
+        cls: type[Self],
+        storage_type: pa.DataType,
+        serialized: bytes,
+    ) -> Self:
+        """Return type of storage type and serialized prefix and unit."""
+        view = memoryview(serialized)
+        try:
+            exponent, unit_id = _ARROW_METADATA.unpack_from(view)
+            unit, _ = _unpack_unit(view, _ARROW_METADATA.size, unit_id)
+        except struct.error as exception:
+            msg: str = "truncated measurement type metadata"
+            raise ValueError(msg) from exception
+
+        return cls(_prefix(exponent), unit, storage_type)
+
+    def to_pandas_dtype(self: MeasurementArrowType) -> MeasurementDtype:
+        """Return pandas dtype of type."""
+        return MeasurementDtype(
+            self.prefix,
+            self.unit,
+            self.storage_type.to_pandas_dtype(),
+        )
+
+
+def _magnitudes(
+    measurements: collections.abc.Iterable[Measurement[typing.Any] | None],
+    prefix: MetricPrefix,
+    /,
+) -> tuple[npt.NDArray[typing.Any], npt.NDArray[np.bool_]]:
+    """Return int64 or float64 magnitudes in prefix and mask of missing values."""
+    magnitudes: list[typing.Any] = []
+    mask: list[bool] = []
+    for measurement in measurements:
+        if measurement is None:
+            magnitudes.append(0)
+            mask.append(True)
+        elif measurement.prefix is prefix:
+            magnitudes.append(measurement.magnitude)
+            mask.append(False)
+        else:
+            magnitudes.append(measurement.prefix.convert(measurement.magnitude, prefix))
+            mask.append(False)
+
+    if all(type(magnitude) is int for magnitude in magnitudes):
+        return np.asarray(magnitudes, dtype=np.int64), np.asarray(mask, dtype=np.bool_)
+
+    return (
+        np.asarray(list(map(float, magnitudes)), dtype=np.float64),
+        np.asarray(mask, dtype=np.bool_),
+    )
+
+
+def _from_arrow_chunk(
+    chunk: pa.Array,
+    magnitude_dtype: np.dtype[typing.Any],
+    /,
+) -> tuple[npt.NDArray[typing.Any], npt.NDArray[np.bool_]]:
+    """Return magnitudes sharing the data buffer of chunk and mask of missing values."""
+    if isinstance(chunk, pa.ExtensionArray):
+        chunk = chunk.storage
+
+    storage_type = pa.from_numpy_dtype(magnitude_dtype)
+    if chunk.type != storage_type:
+        chunk = chunk.cast(storage_type)
+
+    if not len(chunk):
+        return np.empty(0, magnitude_dtype), np.empty(0, np.bool_)
+
+    magnitudes = np.frombuffer(
+        chunk.buffers()[1],
+        dtype=magnitude_dtype,
+        count=len(chunk),
+        offset=chunk.offset * magnitude_dtype.itemsize,
+    )
+    # Arrow buffers are immutable, magnitudes are copied on write
+    magnitudes.flags.writeable = False
+    if chunk.null_count:
+        return magnitudes, chunk.is_null().to_numpy(zero_copy_only=False)
+
+    return magnitudes, np.zeros(len(chunk), dtype=np.bool_)
+
+
+with contextlib.suppress(pa.ArrowKeyError):
+    # replace types registered before, if this module is reloaded
+    pa.unregister_extension_type(_ARROW_EXTENSION_NAME)
+pa.register_extension_type(MeasurementArrowType())
+
+
+__all__ = [
+    "MeasurementArrowType",
+    "MeasurementDtype",
+    "MeasurementExtensionArray",
+]
@@ -0,0 +1,333 @@
+"""Memory-mapped measurement time series.
+
+Series are stored in a columnar file: a header with prefix, unit and magnitude type,
+followed by a column of int64 timestamps in microseconds since the Unix epoch and a
+column of int64 or float64 magnitudes, all little-endian. Opened series are backed
+by mmap, so that measurements are only read when accessed.
+
+Examples
+--------
+>>> import tempfile
+>>> path = pathlib.Path(tempfile.mkdtemp()) / "series.pep"
+>>> start = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+>>> MeasurementSeries.write(
+...     path,
+...     (
+...         (start + datetime.timedelta(minutes=15 * index),
+...          Measurement(index, MetricPrefix.kilo, Unit.watt))
+...         for index in range(96)
+...     ),
+... )
+>>> with MeasurementSeries.open(path) as series:
+...     hour = series.between(
+...         Period(start, start + datetime.timedelta(hours=1)),
+...     )
+...     len(hour), hour[-1]
+(5, Measurement(magnitude=4, prefix=<MetricPrefix.kilo: 3>, unit=<Unit.watt: 'W'>))
+
+
+"""
+
+from __future__ import annotations
+
+import bisect
+import collections.abc
+import datetime
+import mmap
+import pathlib
+import struct
+import sys
+import typing
+
+from peprock.dt import Period, ensure_aware
+
+from .codec import (
+    _FLOAT64,
+    _INT64,
+    _measurement,
+    _pack_unit,
+    _prefix,
+    _unpack_unit,
+)
+from .measurement import Measurement
+from .metric_prefix import MetricPrefix
+from .unit import CompoundUnit, Unit  # noqa: TC001
+
+if typing.TYPE_CHECKING:
+    import os
+    import types
+
+    if sys.version_info >= (3, 11):
+        from typing import Self
+    else:
+        from typing_extensions import Self
+
+_MAGIC: typing.Final[bytes] = b"PEPMTS"
+_VERSION: typing.Final[int] = 1
+# magic, version, prefix exponent, magnitude tag, count and unit id
+_HEADER: typing.Final[struct.Struct] = struct.Struct("<6sHbBQH")
+_COLUMN_ALIGNMENT: typing.Final[int] = 8
+_COLUMN_ITEM_SIZE: typing.Final[int] = 8
+_COLUMN_FORMATS: typing.Final[dict[int, typing.Literal["q", "d"]]] = {
+    _INT64: "q",
+    _FLOAT64: "d",
+}
+
+_EPOCH: typing.Final[datetime.datetime] = datetime.datetime(
+    1970,
+    1,
+    1,
+    tzinfo=datetime.timezone.utc,
+)
+_MICROSECOND: typing.Final[datetime.timedelta] = datetime.timedelta(microseconds=1)
+
+
+class MeasurementSeries(collections.abc.Sequence[Measurement[typing.Any]]):
+    """Read-only sequence of timestamped measurements backed by a memory map.
+
+    Measurements share prefix and unit and are materialized on access. Slices and
+    range queries return series sharing the memory map, which is closed once the
+    series and all series derived from it are closed or garbage collected.
+    """
+
+    __slots__ = ("_magnitudes", "_timestamps", "prefix", "unit")
+
+    prefix: MetricPrefix
+    unit: Unit | CompoundUnit | str | None
+
+    def __init__(
+        self: MeasurementSeries,
+        timestamps: memoryview[int],
+        magnitudes: memoryview[typing.Any],
+        prefix: MetricPrefix = MetricPrefix.NONE,
+        unit: Unit | CompoundUnit | str | None = None,
+    ) -> None:
+        """Initialize series of int64 timestamp and magnitude memoryviews."""
+        if len(timestamps) != len(magnitudes):
+            msg: str = (
+                f"expected columns of equal length, got {len(timestamps)} "
+                f"and {len(magnitudes)}"
+            )
+            raise ValueError(msg)
+
+        self._timestamps: memoryview[int] = timestamps
+        self._magnitudes: memoryview[typing.Any] = magnitudes
+        self.prefix = prefix
+        self.unit = unit
+
+    @classmethod
+    def write(
+        cls: type[MeasurementSeries],
+        path: str | os.PathLike[str],
+        items: collections.abc.Iterable[
+            tuple[datetime.datetime, Measurement[typing.Any]]
+        ],
+        /,
+    ) -> None:
+        """Write timestamped measurements sharing a unit to a series file.
+
+        Timestamps must be timezone aware and non-decreasing. Magnitudes are aligned
+        to the smallest prefix and stored as int64 if all are int, else as float64.
+        """
+        timestamps: list[int] = []
+        magnitudes: list[typing.Any] = []
+        prefixes: list[MetricPrefix] = []
+        units: set[Unit | CompoundUnit | str | None] = set()
+        for timestamp, measurement in items:
+            timestamps.append(_epoch_microseconds(timestamp))
+            magnitudes.append(measurement.magnitude)
+            prefixes.append(measurement.prefix)
+            units.add(measurement.unit)
+
+        if len(units) > 1:
+            msg: str = f"expected measurements sharing a unit, got {units!r}"
+            raise ValueError(msg)
+
+        if any(map(int.__gt__, timestamps, timestamps[1:])):
+            msg = "expected non-decreasing timestamps"
+            raise ValueError(msg)
+
+        prefix = min(prefixes, default=MetricPrefix.NONE)
+        if any(prefix_ is not prefix for prefix_ in prefixes):
+            magnitudes = [
+                prefix_.convert(magnitude, prefix)
+                for prefix_, magnitude in zip(prefixes, magnitudes, strict=True)
+            ]
+
+        if all(type(magnitude) is int for magnitude in magnitudes):
+            tag = _INT64
+        else:
+            tag = _FLOAT64
+            magnitudes = list(map(float, magnitudes))
+
+        unit_id, unit_extension = _pack_unit(units.pop() if units else None)
+        header = (
+            _HEADER.pack(_MAGIC, _VERSION, prefix, tag, len(magnitudes), unit_id)
+            + unit_extension
+        )
+        with pathlib.Path(path).open("wb") as file:
+            file.write(header.ljust(_aligned(len(header)), b"\0"))
+            file.write(struct.pack(f"<{len(timestamps)}q", *timestamps))
+            file.write(
+                struct.pack(f"<{len(magnitudes)}{_COLUMN_FORMATS[tag]}", *magnitudes),
+            )
+
+    @classmethod
+    def open(cls: type[Self], path: str | os.PathLike[str], /) -> Self:
+        """Open series file as memory map, reading only its header."""
+        if sys.byteorder != "little":  # pragma: no cover
+            msg: str = "expected little-endian platform"
+            raise OSError(msg)
+
+        with pathlib.Path(path).open("rb") as file:
+            mmap_ = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        # columns keep the memory map alive after the view is released
+        with memoryview(mmap_) as view:
+            return cls._from_view(view)
+
+    @classmethod
+    def _from_view(cls: type[Self], view: memoryview, /) -> Self:
+        try:
+            magic, version, exponent, tag, count, unit_id = _HEADER.unpack_from(view)
+            unit, offset = _unpack_unit(view, _HEADER.size, unit_id)
+        except struct.error as exception:
+            msg: str = "truncated measurement series header"
+            raise ValueError(msg) from exception
+
+        if magic != _MAGIC or version != _VERSION:
+            msg = f"expected measurement series version {_VERSION}, got {magic!r}"
+            raise ValueError(msg)
+
+        if tag not in _COLUMN_FORMATS:
+            msg = f"invalid magnitude tag {tag}"
+            raise ValueError(msg)
+
+        timestamps_offset = _aligned(offset)
+        magnitudes_offset = timestamps_offset + _COLUMN_ITEM_SIZE * count
+        if len(view) != magnitudes_offset + _COLUMN_ITEM_SIZE * count:
+            msg = f"expected {count} measurements, got {len(view)} bytes"
+            raise ValueError(msg)
+
+        return cls(
+            view[timestamps_offset:magnitudes_offset].cast("q"),
+            view[magnitudes_offset:].cast(_COLUMN_FORMATS[tag]),
+            _prefix(exponent),
+            unit,
+        )
+
+    def close(self: MeasurementSeries) -> None:
+        """Release columns, closing the memory map unless derived series are alive."""
+        self._timestamps.release()
+        self._magnitudes.release()
+
+    def __enter__(self: Self) -> Self:
+        """Return self."""
+        return self
+
+    def __exit__(
+        self: MeasurementSeries,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: types.TracebackType | None,
+    ) -> None:
+        """Close series."""
+        self.close()
+
+    def __repr__(self: MeasurementSeries) -> str:
+        """Return repr(self)."""
+        return (
+            f"<{type(self).__name__}: {len(self)} measurements, "
+            f"prefix={self.prefix!r}, unit={self.unit!r}>"
+        )
+
+    def __len__(self: MeasurementSeries) -> int:
+        """Return number of measurements."""
+        return len(self._magnitudes)
+
+    @typing.overload
+    def __getitem__(
+        self: MeasurementSeries,
+        index: int,
+        /,
+    ) -> Measurement[typing.Any]: ...
+
+    @typing.overload
+    def __getitem__(self: Self, index: slice, /) -> Self: ...
+
+    def __getitem__(self, index, /):
+        """Return measurement at index, or series of slice sharing the memory map."""
+        if isinstance(index, slice):
+            return self._slice(index)
+
+        return _measurement(self._magnitudes[index], self.prefix, self.unit)
+
+    def __iter__(self: MeasurementSeries) -> collections.abc.Iterator[Measurement]:
+        """Return iterator over measurements."""
+        prefix = self.prefix
+        unit = self.unit
+        for magnitude in self._magnitudes:
+            yield _measurement(magnitude, prefix, unit)
+
+    @property
+    def timestamps(self: MeasurementSeries) -> memoryview[int]:
+        """Timestamps in microseconds since the Unix epoch, as int64 memoryview."""
+        return self._timestamps
+
+    @property
+    def magnitudes(self: MeasurementSeries) -> memoryview[typing.Any]:
+        """Magnitudes as int64 or float64 memoryview."""
+        return self._magnitudes
+
+    def timestamp(self: MeasurementSeries, index: int, /) -> datetime.datetime:
+        """Return timestamp at index as UTC datetime."""
+        return _EPOCH + datetime.timedelta(microseconds=self._timestamps[index])
+
+    def items(
+        self: MeasurementSeries,
+    ) -> collections.abc.Iterator[tuple[datetime.datetime, Measurement]]:
+        """Return iterator over UTC timestamps and measurements."""
+        prefix = self.prefix
+        unit = self.unit
+        for timestamp, magnitude in zip(
+            self._timestamps,
+            self._magnitudes,
+            strict=True,
+        ):
+            yield (
+                _EPOCH + datetime.timedelta(microseconds=timestamp),
+                _measurement(magnitude, prefix, unit),
+            )
+
+    def between(self: Self, period: Period, /) -> Self:
+        """Return series of measurements timestamped within period, including ends.
+
+        Located by binary search over the timestamp column.
+        """
+        return self._slice(
+            slice(
+                bisect.bisect_left(self._timestamps, _epoch_microseconds(period.start)),
+                bisect.bisect_right(self._timestamps, _epoch_microseconds(period.end)),
+            ),
+        )
+
+    def _slice(self: Self, index: slice, /) -> Self:
+        series = type(self).__new__(type(self))
+        series._timestamps = self._timestamps[index]  # noqa: SLF001
+        series._magnitudes = self._magnitudes[index]  # noqa: SLF001
+        series.prefix = self.prefix
+        series.unit = self.unit
+        return series
+
+
+def _aligned(offset: int, /) -> int:
+    return -(-offset // _COLUMN_ALIGNMENT) * _COLUMN_ALIGNMENT
+
+
+def _epoch_microseconds(timestamp: datetime.datetime, /) -> int:
+    return (ensure_aware(timestamp) - _EPOCH) // _MICROSECOND
+
+
+__all__ = [
+    "MeasurementSeries",
+]
@@ -10,19 +10,35 @@ Examples
 >>> MetricPrefix.centi.convert(0.7, to=MetricPrefix.milli)
 7.0
 
+>>> MetricPrefix.kilo.convert_all([1.5, 2.0, 3.25], to=MetricPrefix.NONE)
+[1500.0, 2000.0, 3250.0]
+
+>>> MetricPrefix.kilo.to(MetricPrefix.mega)
+Fraction(1, 1000)
+
+>>> MetricPrefix.from_exponent(-5)
+<MetricPrefix.micro: -6>
+
 
 """
 
 from __future__ import annotations
 
+import array
+import decimal
 import enum
+import fractions
 import functools
+import itertools
+import operator
+import sys
 import types
 import typing
 
 if typing.TYPE_CHECKING:
-    import decimal
-    import fractions
+    import collections.abc
+
+    import numpy.typing as npt
 
     ComplexT = typing.TypeVar(
         "ComplexT",
@@ -85,7 +101,7 @@ class MetricPrefix(enum.IntEnum):
         /,
         *,
         number_type: type[int] = int,
-    ) -> int | float: ...
+    ) -> int | fractions.Fraction: ...
 
     @typing.overload
     def to(
@@ -102,9 +118,18 @@ class MetricPrefix(enum.IntEnum):
         /,
         *,
         number_type: type[int | ComplexT] = int,
-    ) -> int | ComplexT:
-        """Calculate conversion factor between self and other."""
-        return number_type(_BASE) ** (self - __other)
+    ) -> int | fractions.Fraction | ComplexT:
+        """Calculate conversion factor between self and other.
+
+        Factors for int, float, decimal.Decimal and fractions.Fraction are looked up
+        from a precomputed table. Factors smaller than one are returned as
+        fractions.Fraction for int.
+        """
+        exponent: int = self - __other
+        try:
+            return _CONVERSION_FACTORS[number_type, exponent]
+        except KeyError:
+            return _conversion_factor(exponent, number_type)
 
     @typing.overload
     def convert(
@@ -112,7 +137,7 @@ class MetricPrefix(enum.IntEnum):
         __value: int,
         /,
         to: MetricPrefix = NONE,  # type: ignore[assignment]
-    ) -> int | float: ...
+    ) -> int | fractions.Fraction: ...
 
     @typing.overload
     def convert(
@@ -132,7 +157,98 @@ class MetricPrefix(enum.IntEnum):
         if self is to:
             return __value
 
-        return __value * self.to(to, number_type=type(__value))
+        try:
+            return __value * _CONVERSION_FACTORS[type(__value), self - to]
+        except KeyError:
+            return __value * _conversion_factor(self - to, type(__value))
+
+    @typing.overload
+    def convert_all(
+        self: MetricPrefix,
+        __values: list[typing.Any],
+        /,
+        to: MetricPrefix = NONE,  # type: ignore[assignment]
+    ) -> list[typing.Any]: ...
+
+    @typing.overload
+    def convert_all(
+        self: MetricPrefix,
+        __values: array.array[typing.Any],
+        /,
+        to: MetricPrefix = NONE,  # type: ignore[assignment]
+    ) -> array.array[typing.Any]: ...
+
+    @typing.overload
+    def convert_all(
+        self: MetricPrefix,
+        __values: memoryview,
+        /,
+        to: MetricPrefix = NONE,  # type: ignore[assignment]
+    ) -> memoryview | array.array[typing.Any]: ...
+
+    @typing.overload
+    def convert_all(
+        self: MetricPrefix,
+        __values: npt.NDArray[typing.Any],
+        /,
+        to: MetricPrefix = NONE,  # type: ignore[assignment]
+    ) -> npt.NDArray[typing.Any]: ...
+
+    def convert_all(
+        self,
+        __values,
+        /,
+        to=NONE,
+    ):
+        """Convert all values from metric prefix self to to in one pass.
+
+        Lists, array.array and memoryview objects of numbers and NumPy arrays are
+        converted in place and returned. Read-only memoryview objects are converted
+        to a new array.array, NumPy arrays that cannot hold the results to a new
+        array, e.g. integer arrays to float for a larger prefix or to object, of
+        exact Python ints, where the results overflow. Integer array.array and
+        memoryview objects cannot be converted to a larger prefix. decimal.Decimal
+        values are rounded in the current context.
+        """
+        exponent = self - to
+        if isinstance(__values, list):
+            if exponent:
+                __values[:] = _converted(__values, exponent)
+
+            return __values
+
+        if isinstance(__values, array.array | memoryview):
+            return _convert_buffer(__values, exponent)
+
+        numpy = sys.modules.get("numpy")
+        if numpy is not None and isinstance(__values, numpy.ndarray):
+            return _convert_ndarray(__values, exponent)
+
+        msg = f"unsupported values type {type(__values).__name__!r}"
+        raise TypeError(msg)
+
+    @classmethod
+    def from_exponent(
+        cls: type[MetricPrefix],
+        exponent: int,
+        /,
+        *,
+        engineering: bool = True,
+    ) -> MetricPrefix:
+        """Return largest metric prefix not exceeding the decimal exponent.
+
+        With engineering, only prefixes of powers of three are considered, skipping
+        hecto, deca, deci and centi. Exponents out of range are clamped.
+        """
+        if exponent < _MIN_EXPONENT:
+            exponent = _MIN_EXPONENT
+        elif exponent > _MAX_EXPONENT:
+            exponent = _MAX_EXPONENT
+
+        if engineering:
+            return _ENGINEERING_PREFIX_BY_EXPONENT[exponent - _MIN_EXPONENT]
+
+        return _PREFIX_BY_EXPONENT[exponent - _MIN_EXPONENT]
 
     @staticmethod
     @functools.cache
@@ -177,6 +293,164 @@ class MetricPrefix(enum.IntEnum):
         )
 
 
+def _conversion_factor(
+    exponent: int,
+    number_type: type[int | ComplexT],
+    /,
+) -> int | fractions.Fraction | ComplexT:
+    if number_type is int:
+        if exponent < 0:
+            return fractions.Fraction(1, _BASE**-exponent)
+
+        return _BASE**exponent
+
+    if number_type is decimal.Decimal:
+        # construct exactly, independent of the precision of the current context
+        if exponent < 0:
+            return decimal.Decimal((0, (1,), exponent))
+
+        return decimal.Decimal(_BASE**exponent)
+
+    return number_type(_BASE) ** exponent
+
+
+def _factor(exponent: int, number_type: type, /) -> typing.Any:  # noqa: ANN401
+    try:
+        return _CONVERSION_FACTORS[number_type, exponent]
+    except KeyError:
+        return _conversion_factor(exponent, number_type)
+
+
+def _converted(
+    values: collections.abc.Iterable[typing.Any],
+    exponent: int,
+    /,
+) -> list[typing.Any]:
+    """Return list of values multiplied by the conversion factor of their type."""
+    value_types: set[type] = set(map(type, values))
+    if len(value_types) != 1:
+        factors: dict[type, typing.Any] = {
+            value_type: _factor(exponent, value_type) for value_type in value_types
+        }
+        return [value * factors[type(value)] for value in values]
+
+    return list(
+        map(
+            operator.mul,
+            values,
+            itertools.repeat(_factor(exponent, value_types.pop())),
+        ),
+    )
+
+
+def _convert_buffer(
+    values: array.array[typing.Any] | memoryview,
+    exponent: int,
+    /,
+) -> array.array[typing.Any] | memoryview:
+    if isinstance(values, array.array):
+        typecode: str = values.typecode
+    else:
+        # native single item formats coincide with array typecodes
+        typecode = values.format.removeprefix("@")
+        if values.ndim != 1:
+            msg: str = f"expected one-dimensional memoryview, got {values.ndim}"
+            raise TypeError(msg)
+
+    if typecode in _FLOAT_TYPECODES:
+        factor: float | int = _factor(exponent, float)
+    elif typecode in _INT_TYPECODES:
+        if exponent < 0:
+            msg = f"cannot convert integer typecode {typecode!r} to a larger prefix"
+            raise TypeError(msg)
+
+        factor = _factor(exponent, int)
+    else:
+        msg = f"unsupported typecode {typecode!r}"
+        raise TypeError(msg)
+
+    if not exponent:
+        return values
+
+    converted = array.array(
+        typecode,
+        map(operator.mul, values, itertools.repeat(factor)),
+    )
+    if isinstance(values, memoryview) and values.readonly:
+        return converted
+
+    values[:] = converted
+    return values
+
+
+def _convert_ndarray(
+    values: npt.NDArray[typing.Any],
+    exponent: int,
+    /,
+) -> npt.NDArray[typing.Any]:
+    if not exponent:
+        return values
+
+    kind: str = values.dtype.kind
+    if kind == "f":
+        factor: typing.Any = _factor(exponent, float)
+    elif kind in "iu" and exponent > 0:
+        factor = _factor(exponent, int)
+        info = sys.modules["numpy"].iinfo(values.dtype)
+        if values.size and (
+            values.min() < -(-info.min // factor) or values.max() > info.max // factor
+        ):
+            # results overflow the dtype, so convert to exact Python ints
+            return values.astype(object) * factor
+
+        if factor > info.max:
+            # all values are zero
+            return values
+    elif kind in "iu":
+        return values * _factor(exponent, float)
+    else:
+        msg: str = f"unsupported dtype {values.dtype}"
+        raise TypeError(msg)
+
+    if values.flags.writeable:
+        values *= factor
+        return values
+
+    return values * factor
+
+
+_MIN_EXPONENT: typing.Final[int] = int(min(MetricPrefix))
+_MAX_EXPONENT: typing.Final[int] = int(max(MetricPrefix))
+_TABULATED_NUMBER_TYPES: typing.Final[tuple[type[typing.Any], ...]] = (
+    int,
+    float,
+    decimal.Decimal,
+    fractions.Fraction,
+)
+
+# conversion factors by number type and exponent, covering all pairs of prefixes
+_CONVERSION_FACTORS: typing.Final[dict[tuple[type, int], typing.Any]] = {
+    (number_type, exponent): _conversion_factor(exponent, number_type)
+    for number_type in _TABULATED_NUMBER_TYPES
+    for exponent in range(
+        _MIN_EXPONENT - _MAX_EXPONENT,
+        _MAX_EXPONENT - _MIN_EXPONENT + 1,
+    )
+}
+
+_FLOAT_TYPECODES: typing.Final[frozenset[str]] = frozenset("fd")
+_INT_TYPECODES: typing.Final[frozenset[str]] = frozenset("bBhHiIlLqQ")
+
+_PREFIX_BY_EXPONENT: typing.Final[tuple[MetricPrefix, ...]] = tuple(
+    max(prefix for prefix in MetricPrefix if prefix <= exponent)
+    for exponent in range(_MIN_EXPONENT, _MAX_EXPONENT + 1)
+)
+_ENGINEERING_PREFIX_BY_EXPONENT: typing.Final[tuple[MetricPrefix, ...]] = tuple(
+    max(prefix for prefix in MetricPrefix if prefix <= exponent and not prefix % 3)
+    for exponent in range(_MIN_EXPONENT, _MAX_EXPONENT + 1)
+)
+
+
 __all__ = [
     "MetricPrefix",
 ]
@@ -0,0 +1,481 @@
+"""Sorted container of measurements.
+
+Measurements are ordered by Measurement.sort_key, computed once on insertion rather
+than converting prefixes in every comparison. They are kept in buckets of bounded
+size, and a Fenwick tree over bucket lengths maps indices to buckets, so that
+positional access and searches take logarithmic time plus the size of a bucket.
+Insertion and removal additionally shift a bucket, and occasionally the list of
+buckets when one is split or merged.
+
+Examples
+--------
+>>> from peprock.models import MetricPrefix
+>>> measurements = SortedMeasurements(
+...     [Measurement(2, MetricPrefix.kilo), Measurement(500), Measurement(1)],
+... )
+>>> measurements.add(Measurement(1500))
+>>> measurements[-1]
+Measurement(magnitude=2, prefix=<MetricPrefix.kilo: 3>, unit=None)
+
+>>> measurements.bisect_left(Measurement(1, MetricPrefix.kilo))
+2
+
+>>> list(measurements.between(Measurement(0.5, MetricPrefix.kilo), Measurement(1500)))
+[Measurement(magnitude=500, prefix=<MetricPrefix.NONE: 0>, unit=None), \
+Measurement(magnitude=1500, prefix=<MetricPrefix.NONE: 0>, unit=None)]
+
+
+"""
+
+from __future__ import annotations
+
+import bisect
+import collections.abc
+import itertools
+import operator
+import typing
+
+from .measurement import Measurement
+
+if typing.TYPE_CHECKING:
+    import sys
+
+    if sys.version_info >= (3, 11):
+        from typing import Self
+    else:
+        from typing_extensions import Self
+
+
+class SortedMeasurements(collections.abc.Sequence[Measurement[typing.Any]]):
+    """Sorted sequence of measurements sharing a unit.
+
+    Measurements with equal sort keys keep their insertion order. Buckets hold at
+    most two times load measurements, and are merged into a neighbour when
+    removals shrink them below half of load.
+    """
+
+    __slots__ = ("_bucket_keys", "_buckets", "_index", "_len", "_load", "_maxes")
+
+    def __init__(
+        self: SortedMeasurements,
+        measurements: collections.abc.Iterable[Measurement[typing.Any]] = (),
+        /,
+        *,
+        load: int = 1000,
+    ) -> None:
+        """Initialize sorted measurements of iterable."""
+        if load < 1:
+            msg: str = f"expected positive load, got {load}"
+            raise ValueError(msg)
+
+        self._load: int = load
+        self._buckets: list[list[Measurement[typing.Any]]] = []
+        self._bucket_keys: list[list[typing.Any]] = []
+        # largest key per bucket
+        self._maxes: list[typing.Any] = []
+        # Fenwick tree of bucket lengths, one-based, rebuilt lazily if empty
+        self._index: list[int] = []
+        self._len: int = 0
+        self.update(measurements)
+
+    def __repr__(self: SortedMeasurements) -> str:
+        """Return repr(self)."""
+        return f"{type(self).__name__}({list(self)!r})"
+
+    def __len__(self: SortedMeasurements) -> int:
+        """Return number of measurements."""
+        return self._len
+
+    def __iter__(
+        self: SortedMeasurements,
+    ) -> collections.abc.Iterator[Measurement[typing.Any]]:
+        """Return iterator over measurements in ascending order."""
+        return itertools.chain.from_iterable(self._buckets)
+
+    def __reversed__(
+        self: SortedMeasurements,
+    ) -> collections.abc.Iterator[Measurement[typing.Any]]:
+        """Return iterator over measurements in descending order."""
+        return itertools.chain.from_iterable(map(reversed, reversed(self._buckets)))
+
+    def __contains__(self: SortedMeasurements, value: object) -> bool:
+        """Return value in self."""
+        if not isinstance(value, Measurement) or not self._shares_unit(value):
+            return False
+
+        return any(True for _ in self._equal(value))
+
+    @typing.overload
+    def __getitem__(
+        self: SortedMeasurements,
+        index: int,
+        /,
+    ) -> Measurement[typing.Any]: ...
+
+    @typing.overload
+    def __getitem__(
+        self: SortedMeasurements,
+        index: slice,
+        /,
+    ) -> list[Measurement[typing.Any]]: ...
+
+    def __getitem__(self, index, /):
+        """Return measurement at index, or list of measurements of slice."""
+        if isinstance(index, slice):
+            return list(self)[index]
+
+        bucket_index, position = self._locate(index)
+        return self._buckets[bucket_index][position]
+
+    def __delitem__(self: SortedMeasurements, index: int, /) -> None:
+        """Delete measurement at index."""
+        self._delete(*self._locate(index))
+
+    def add(self: SortedMeasurements, measurement: Measurement[typing.Any], /) -> None:
+        """Insert measurement, after measurements of equal sort key."""
+        self._check_unit(measurement)
+        key = measurement.sort_key()
+        if not self._maxes:
+            self._buckets.append([measurement])
+            self._bucket_keys.append([key])
+            self._maxes.append(key)
+            self._index = []
+            self._len = 1
+            return
+
+        bucket_index = bisect.bisect_right(self._maxes, key)
+        if bucket_index == len(self._maxes):
+            bucket_index -= 1
+            self._buckets[bucket_index].append(measurement)
+            self._bucket_keys[bucket_index].append(key)
+            self._maxes[bucket_index] = key
+        else:
+            keys = self._bucket_keys[bucket_index]
+            position = bisect.bisect_right(keys, key)
+            self._buckets[bucket_index].insert(position, measurement)
+            keys.insert(position, key)
+
+        self._len += 1
+        if len(self._buckets[bucket_index]) > 2 * self._load:
+            self._split(bucket_index)
+        else:
+            self._resize(bucket_index, 1)
+
+    def update(
+        self: Self,
+        measurements: collections.abc.Iterable[Measurement[typing.Any]],
+        /,
+    ) -> Self:
+        """Insert measurements of iterable, sorting once, and return self."""
+        added = list(measurements)
+        if not added:
+            return self
+
+        unit = self._buckets[0][0].unit if self._buckets else added[0].unit
+        for measurement in added:
+            if measurement.unit != unit:
+                msg: str = (
+                    f"expected measurements sharing a unit, got {measurement.unit!r} "
+                    f"and {unit!r}"
+                )
+                raise ValueError(msg)
+
+        # stable sort keeps present measurements before added ones of equal key
+        pairs = sorted(
+            itertools.chain(
+                zip(
+                    itertools.chain.from_iterable(self._bucket_keys),
+                    self,
+                    strict=True,
+                ),
+                zip(map(Measurement.sort_key, added), added, strict=True),
+            ),
+            key=operator.itemgetter(0),
+        )
+        load = self._load
+        self._bucket_keys = [
+            [key for key, _ in pairs[start : start + load]]
+            for start in range(0, len(pairs), load)
+        ]
+        self._buckets = [
+            [measurement for _, measurement in pairs[start : start + load]]
+            for start in range(0, len(pairs), load)
+        ]
+        self._maxes = [keys[-1] for keys in self._bucket_keys]
+        self._index = []
+        self._len = len(pairs)
+        return self
+
+    def remove(
+        self: SortedMeasurements,
+        measurement: Measurement[typing.Any],
+        /,
+    ) -> None:
+        """Remove first measurement equal to measurement, raise ValueError if absent."""
+        for bucket_index, position in self._equal(measurement):
+            self._delete(bucket_index, position)
+            return
+
+        msg: str = f"{measurement!r} not in {type(self).__name__}"
+        raise ValueError(msg)
+
+    def discard(
+        self: SortedMeasurements,
+        measurement: Measurement[typing.Any],
+        /,
+    ) -> None:
+        """Remove first measurement equal to measurement if present."""
+        if measurement in self:
+            self.remove(measurement)
+
+    def index(
+        self: SortedMeasurements,
+        value: typing.Any,  # noqa: ANN401
+        start: int = 0,
+        stop: int | None = None,
+    ) -> int:
+        """Return first index of value, raise ValueError if absent."""
+        start, stop, _ = slice(start, stop).indices(self._len)
+        if isinstance(value, Measurement) and self._shares_unit(value):
+            for bucket_index, position in self._equal(value):
+                index = self._offset(bucket_index) + position
+                if index >= stop:
+                    break
+
+                if index >= start:
+                    return index
+
+        msg: str = f"{value!r} not in {type(self).__name__}"
+        raise ValueError(msg)
+
+    def count(self: SortedMeasurements, value: object) -> int:
+        """Return number of occurrences of value."""
+        if not isinstance(value, Measurement) or not self._shares_unit(value):
+            return 0
+
+        return sum(1 for _ in self._equal(value))
+
+    def bisect_left(
+        self: SortedMeasurements,
+        measurement: Measurement[typing.Any],
+        /,
+    ) -> int:
+        """Return insertion index of measurement before measurements of equal key."""
+        self._check_unit(measurement)
+        key = measurement.sort_key()
+        bucket_index = bisect.bisect_left(self._maxes, key)
+        if bucket_index == len(self._maxes):
+            return self._len
+
+        return self._offset(bucket_index) + bisect.bisect_left(
+            self._bucket_keys[bucket_index],
+            key,
+        )
+
+    def bisect_right(
+        self: SortedMeasurements,
+        measurement: Measurement[typing.Any],
+        /,
+    ) -> int:
+        """Return insertion index of measurement after measurements of equal key."""
+        self._check_unit(measurement)
+        key = measurement.sort_key()
+        bucket_index = bisect.bisect_right(self._maxes, key)
+        if bucket_index == len(self._maxes):
+            return self._len
+
+        return self._offset(bucket_index) + bisect.bisect_right(
+            self._bucket_keys[bucket_index],
+            key,
+        )
+
+    def between(
+        self: SortedMeasurements,
+        minimum: Measurement[typing.Any] | None = None,
+        maximum: Measurement[typing.Any] | None = None,
+        /,
+    ) -> collections.abc.Iterator[Measurement[typing.Any]]:
+        """Return iterator over measurements between minimum and maximum, inclusive.
+
+        Omitted bounds are unbounded.
+        """
+        if minimum is None:
+            bucket_index, position = 0, 0
+        else:
+            self._check_unit(minimum)
+            key = minimum.sort_key()
+            bucket_index = bisect.bisect_left(self._maxes, key)
+            position = (
+                bisect.bisect_left(self._bucket_keys[bucket_index], key)
+                if bucket_index < len(self._maxes)
+                else 0
+            )
+
+        if maximum is None:
+            for bucket in self._buckets[bucket_index:]:
+                yield from bucket[position:]
+                position = 0
+            return
+
+        self._check_unit(maximum)
+        key = maximum.sort_key()
+        for keys, bucket in zip(
+            self._bucket_keys[bucket_index:],
+            self._buckets[bucket_index:],
+            strict=True,
+        ):
+            if keys[-1] <= key:
+                yield from bucket[position:]
+            else:
+                yield from bucket[position : bisect.bisect_right(keys, key)]
+                return
+
+            position = 0
+
+    def _shares_unit(
+        self: SortedMeasurements,
+        measurement: Measurement[typing.Any],
+        /,
+    ) -> bool:
+        return not self._buckets or measurement.unit == self._buckets[0][0].unit
+
+    def _check_unit(
+        self: SortedMeasurements,
+        measurement: Measurement[typing.Any],
+        /,
+    ) -> None:
+        if not self._shares_unit(measurement):
+            msg: str = (
+                f"expected measurements sharing a unit, got {measurement.unit!r} "
+                f"and {self._buckets[0][0].unit!r}"
+            )
+            raise ValueError(msg)
+
+    def _equal(
+        self: SortedMeasurements,
+        measurement: Measurement[typing.Any],
+        /,
+    ) -> collections.abc.Iterator[tuple[int, int]]:
+        """Return iterator over bucket indices and positions of equal measurements."""
+        key = measurement.sort_key()
+        bucket_index = bisect.bisect_left(self._maxes, key)
+        position = (
+            bisect.bisect_left(self._bucket_keys[bucket_index], key)
+            if bucket_index < len(self._maxes)
+            else 0
+        )
+        for keys, bucket in zip(
+            self._bucket_keys[bucket_index:],
+            self._buckets[bucket_index:],
+            strict=True,
+        ):
+            for position_ in range(position, len(keys)):
+                if keys[position_] != key:
+                    return
+
+                if bucket[position_] == measurement:
+                    yield bucket_index, position_
+
+            bucket_index += 1
+            position = 0
+
+    def _tree(self: SortedMeasurements) -> list[int]:
+        """Return Fenwick tree of bucket lengths, building it in linear time."""
+        if not self._index:
+            tree = [0, *map(len, self._buckets)]
+            size = len(tree)
+            for node in range(1, size):
+                if (parent := node + (node & -node)) < size:
+                    tree[parent] += tree[node]
+
+            self._index = tree
+
+        return self._index
+
+    def _resize(self: SortedMeasurements, bucket_index: int, delta: int, /) -> None:
+        """Add delta to the length of bucket in the Fenwick tree, if built."""
+        if not (tree := self._index):
+            return
+
+        node, size = bucket_index + 1, len(tree)
+        while node < size:
+            tree[node] += delta
+            node += node & -node
+
+    def _offset(self: SortedMeasurements, bucket_index: int, /) -> int:
+        """Return index of first measurement of bucket."""
+        tree = self._tree()
+        offset = 0
+        while bucket_index:
+            offset += tree[bucket_index]
+            bucket_index &= bucket_index - 1
+
+        return offset
+
+    def _locate(self: SortedMeasurements, index: int, /) -> tuple[int, int]:
+        """Return bucket index and position of index."""
+        if index < 0:
+            index += self._len
+
+        if not 0 <= index < self._len:
+            msg: str = f"{type(self).__name__} index out of range"
+            raise IndexError(msg)
+
+        # descend the Fenwick tree to the last bucket starting at or before index
+        tree = self._tree()
+        bucket_index, size = 0, len(tree)
+        step = 1 << (size - 1).bit_length()
+        while step:
+            node = bucket_index + step
+            if node < size and tree[node] <= index:
+                index -= tree[node]
+                bucket_index = node
+
+            step >>= 1
+
+        return bucket_index, index
+
+    def _delete(self: SortedMeasurements, bucket_index: int, position: int, /) -> None:
+        bucket = self._buckets[bucket_index]
+        keys = self._bucket_keys[bucket_index]
+        del bucket[position]
+        del keys[position]
+        self._len -= 1
+        if not bucket:
+            del self._buckets[bucket_index]
+            del self._bucket_keys[bucket_index]
+            del self._maxes[bucket_index]
+            self._index = []
+            return
+
+        self._maxes[bucket_index] = keys[-1]
+        if len(bucket) >= self._load // 2 or len(self._buckets) == 1:
+            self._resize(bucket_index, -1)
+            return
+
+        # merge into a neighbour, splitting again if it grows too large
+        self._index = []
+        if bucket_index == len(self._buckets) - 1:
+            bucket_index -= 1
+
+        self._buckets[bucket_index] += self._buckets.pop(bucket_index + 1)
+        self._bucket_keys[bucket_index] += self._bucket_keys.pop(bucket_index + 1)
+        self._maxes.pop(bucket_index)
+        if len(self._buckets[bucket_index]) > 2 * self._load:
+            self._split(bucket_index)
+
+    def _split(self: SortedMeasurements, bucket_index: int, /) -> None:
+        bucket = self._buckets[bucket_index]
+        keys = self._bucket_keys[bucket_index]
+        load = self._load
+        self._buckets[bucket_index + 1 : bucket_index + 1] = [bucket[load:]]
+        self._bucket_keys[bucket_index + 1 : bucket_index + 1] = [keys[load:]]
+        self._maxes.insert(bucket_index, keys[load - 1])
+        self._index = []
+        del bucket[load:]
+        del keys[load:]
+
+
+__all__ = [
+    "SortedMeasurements",
+]
@@ -10,6 +10,15 @@ Examples
 >>> Unit("W")
 <Unit.watt: 'W'>
 
+>>> Unit.watt * Unit.second
+<Unit.joule: 'J'>
+
+>>> Unit.watt / Unit.metre**2
+<CompoundUnit: 'W/m²'>
+
+>>> Unit.watt * Unit.hour
+<Unit.watt_hour: 'Wh'>
+
 
 """
 
@@ -17,6 +26,11 @@ from __future__ import annotations
 
 import enum
 import functools
+import types
+import typing
+
+if typing.TYPE_CHECKING:
+    import collections.abc
 
 
 class Unit(enum.Enum):
@@ -46,7 +60,7 @@ class Unit(enum.Enum):
     ohm = "Ω"  # equal to one volt per ampere
     siemens = "S"  # equal to one ampere per volt
     henry = "H"  # equal to one volt-second per ampere
-    # degree Celsius (°C) is equal to one kelvin
+    degree_celsius = "°C"  # equal to one kelvin, offset by 273.15
     lumen = "lm"  # equal to one candela-steradian
     lux = "lx"  # equal to one lumen per square metre
     becquerel = "Bq"  # equal to one reciprocal second
@@ -54,12 +68,335 @@ class Unit(enum.Enum):
     sievert = "Sv"  # equal to one joule per kilogram
     katal = "kat"  # equal to one mole per second
 
+    # non-SI units, see peprock.models.conversion for conversion to SI units
+    hour = "hr"  # equal to 3600 seconds, h is the symbol of hecto
+    watt_hour = "Wh"  # equal to 3600 joules
+
     @functools.cached_property
     def symbol(self: Unit) -> str:
         """Get the unit symbol."""
         return self.value
 
+    @functools.cached_property
+    def factors(self: Unit) -> tuple[tuple[Unit, int], ...]:
+        """Get the unit as product of powers of units, empty for one."""
+        return () if self is Unit.one else ((self, 1),)
+
+    def __mul__(self: Unit, other: Unit | CompoundUnit) -> Unit | CompoundUnit:
+        """Return self * other."""
+        if isinstance(other, Unit | CompoundUnit):
+            return _resolve(_multiply(self.factors, other.factors))
+
+        return NotImplemented
+
+    def __truediv__(self: Unit, other: Unit | CompoundUnit) -> Unit | CompoundUnit:
+        """Return self / other."""
+        if isinstance(other, Unit | CompoundUnit):
+            return _resolve(_multiply(self.factors, _power(other.factors, -1)))
+
+        return NotImplemented
+
+    def __pow__(self: Unit, exponent: int) -> Unit | CompoundUnit:
+        """Return self ** exponent."""
+        if isinstance(exponent, int):
+            return _resolve(_power(self.factors, exponent))
+
+        return NotImplemented
+
+
+@typing.final
+class CompoundUnit:
+    """Product of integer powers of units, e.g. W/m².
+
+    Instances are interned: equal compound units are identical, so comparison and
+    hashing are by identity.
+    """
+
+    __slots__ = ("dimension", "factors", "scale", "symbol")
+
+    dimension: tuple[int, ...]
+    factors: tuple[tuple[Unit, int], ...]
+    scale: int
+    symbol: str
+
+    def __new__(
+        cls: type[CompoundUnit],
+        factors: collections.abc.Iterable[tuple[Unit, int]],
+        /,
+    ) -> CompoundUnit:
+        """Return interned compound unit of factors."""
+        factors = _multiply((), tuple(factors))
+        try:
+            return _compound_units[factors]
+        except KeyError:
+            pass
+
+        compound_unit = super().__new__(cls)
+        dimension, scale = _dimension_and_scale(factors)
+        object.__setattr__(compound_unit, "dimension", dimension)
+        object.__setattr__(compound_unit, "factors", factors)
+        object.__setattr__(compound_unit, "scale", scale)
+        object.__setattr__(compound_unit, "symbol", _compound_symbol(factors))
+        return _compound_units.setdefault(factors, compound_unit)
+
+    def __setattr__(self: CompoundUnit, name: str, value: object) -> None:
+        """Raise AttributeError, compound units are immutable."""
+        msg: str = f"cannot assign to attribute {name!r}"
+        raise AttributeError(msg)
+
+    def __reduce__(self: CompoundUnit) -> tuple[type[CompoundUnit], tuple[object]]:
+        """Support pickling, unpickled instances are interned."""
+        return CompoundUnit, (self.factors,)
+
+    def __repr__(self: CompoundUnit) -> str:
+        """Return repr(self)."""
+        return f"<{type(self).__name__}: {self.symbol!r}>"
+
+    def __str__(self: CompoundUnit) -> str:
+        """Return symbol."""
+        return self.symbol
+
+    def __mul__(
+        self: CompoundUnit,
+        other: Unit | CompoundUnit,
+    ) -> Unit | CompoundUnit:
+        """Return self * other."""
+        if isinstance(other, Unit | CompoundUnit):
+            return _resolve(_multiply(self.factors, other.factors))
+
+        return NotImplemented
+
+    def __truediv__(
+        self: CompoundUnit,
+        other: Unit | CompoundUnit,
+    ) -> Unit | CompoundUnit:
+        """Return self / other."""
+        if isinstance(other, Unit | CompoundUnit):
+            return _resolve(_multiply(self.factors, _power(other.factors, -1)))
+
+        return NotImplemented
+
+    def __pow__(self: CompoundUnit, exponent: int) -> Unit | CompoundUnit:
+        """Return self ** exponent."""
+        if isinstance(exponent, int):
+            return _resolve(_power(self.factors, exponent))
+
+        return NotImplemented
+
+
+_compound_units: dict[tuple[tuple[Unit, int], ...], CompoundUnit] = {}
+
+# dimension vectors are exponents of s, m, kg, A, K, mol, cd, rad and sr; radian and
+# steradian are kept apart from one to tell angles from plain ratios
+_SI_DIMENSION_AXES: typing.Final[tuple[str, ...]] = (
+    "s",
+    "m",
+    "kg",
+    "A",
+    "K",
+    "mol",
+    "cd",
+    "rad",
+    "sr",
+)
+# units that are no decimal multiple of a coherent SI unit get an axis of their own
+_DIMENSION_AXES: typing.Final[tuple[str, ...]] = (*_SI_DIMENSION_AXES, "°C", "h")
+_dimensions: dict[tuple[int, ...], tuple[int, ...]] = {}
+
+
+def _intern_dimension(dimension: tuple[int, ...], /) -> tuple[int, ...]:
+    return _dimensions.setdefault(dimension, dimension)
+
+
+def _dimension(**exponents: int) -> tuple[int, ...]:
+    return _intern_dimension(tuple(exponents.get(axis, 0) for axis in _DIMENSION_AXES))
+
+
+# dimension vector and decimal exponent of each unit relative to coherent SI units
+_UNIT_DIMENSIONS: typing.Final[
+    types.MappingProxyType[Unit, tuple[tuple[int, ...], int]]
+] = types.MappingProxyType(
+    {
+        Unit.one: (_dimension(), 0),
+        Unit.second: (_dimension(s=1), 0),
+        Unit.metre: (_dimension(m=1), 0),
+        Unit.gram: (_dimension(kg=1), -3),
+        Unit.ampere: (_dimension(A=1), 0),
+        Unit.kelvin: (_dimension(K=1), 0),
+        Unit.mole: (_dimension(mol=1), 0),
+        Unit.candela: (_dimension(cd=1), 0),
+        Unit.hertz: (_dimension(s=-1), 0),
+        Unit.radian: (_dimension(rad=1), 0),
+        Unit.steradian: (_dimension(sr=1), 0),
+        Unit.newton: (_dimension(kg=1, m=1, s=-2), 0),
+        Unit.pascal: (_dimension(kg=1, m=-1, s=-2), 0),
+        Unit.joule: (_dimension(kg=1, m=2, s=-2), 0),
+        Unit.watt: (_dimension(kg=1, m=2, s=-3), 0),
+        Unit.coulomb: (_dimension(A=1, s=1), 0),
+        Unit.volt: (_dimension(kg=1, m=2, s=-3, A=-1), 0),
+        Unit.weber: (_dimension(kg=1, m=2, s=-2, A=-1), 0),
+        Unit.tesla: (_dimension(kg=1, s=-2, A=-1), 0),
+        Unit.farad: (_dimension(kg=-1, m=-2, s=4, A=2), 0),
+        Unit.ohm: (_dimension(kg=1, m=2, s=-3, A=-2), 0),
+        Unit.siemens: (_dimension(kg=-1, m=-2, s=3, A=2), 0),
+        Unit.henry: (_dimension(kg=1, m=2, s=-2, A=-2), 0),
+        Unit.degree_celsius: (_dimension(**{"°C": 1}), 0),
+        Unit.lumen: (_dimension(cd=1, sr=1), 0),
+        Unit.lux: (_dimension(cd=1, sr=1, m=-2), 0),
+        Unit.becquerel: (_dimension(s=-1), 0),
+        Unit.gray: (_dimension(m=2, s=-2), 0),
+        Unit.sievert: (_dimension(m=2, s=-2), 0),
+        Unit.katal: (_dimension(mol=1, s=-1), 0),
+        Unit.hour: (_dimension(h=1), 0),
+        Unit.watt_hour: (_dimension(kg=1, m=2, s=-3, h=1), 0),
+    },
+)
+
+# named unit by dimension vector, first unit wins; becquerel and sievert share their
+# dimension with hertz and gray and are never derived
+_UNIT_BY_DIMENSION: typing.Final[types.MappingProxyType[tuple[int, ...], Unit]] = (
+    types.MappingProxyType(
+        {
+            dimension: unit
+            for unit, (dimension, _) in reversed(list(_UNIT_DIMENSIONS.items()))
+            if unit is not Unit.one
+        },
+    )
+)
+
+_UNIT_ORDER: typing.Final[types.MappingProxyType[Unit, int]] = types.MappingProxyType(
+    {unit: index for index, unit in enumerate(Unit)},
+)
+
+_SUPERSCRIPTS: typing.Final[dict[int, int]] = str.maketrans(
+    "-0123456789",
+    "⁻⁰¹²³⁴⁵⁶⁷⁸⁹",
+)
+
+
+def _multiply(
+    factors: tuple[tuple[Unit, int], ...],
+    other_factors: tuple[tuple[Unit, int], ...],
+    /,
+) -> tuple[tuple[Unit, int], ...]:
+    """Return canonical product of factors, ordered by unit without zero powers."""
+    exponents: dict[Unit, int] = dict(factors)
+    for unit, exponent in other_factors:
+        if unit is not Unit.one:
+            exponents[unit] = exponents.get(unit, 0) + exponent
+
+    return tuple(
+        sorted(
+            ((unit, exponent) for unit, exponent in exponents.items() if exponent),
+            key=lambda factor: _UNIT_ORDER[factor[0]],
+        ),
+    )
+
+
+def _power(
+    factors: tuple[tuple[Unit, int], ...],
+    exponent: int,
+    /,
+) -> tuple[tuple[Unit, int], ...]:
+    if not exponent:
+        return ()
+
+    return tuple((unit, power * exponent) for unit, power in factors)
+
+
+def _dimension_and_scale(
+    factors: tuple[tuple[Unit, int], ...],
+    /,
+) -> tuple[tuple[int, ...], int]:
+    """Return interned dimension vector and decimal exponent of factors."""
+    dimension: list[int] = [0] * len(_DIMENSION_AXES)
+    scale: int = 0
+    for unit, exponent in factors:
+        unit_dimension, unit_scale = _UNIT_DIMENSIONS[unit]
+        for index, axis_exponent in enumerate(unit_dimension):
+            dimension[index] += axis_exponent * exponent
+        scale += unit_scale * exponent
+
+    return _intern_dimension(tuple(dimension)), scale
+
+
+def _compound_symbol(factors: tuple[tuple[Unit, int], ...], /) -> str:
+    def symbol(unit: Unit, exponent: int) -> str:
+        if exponent == 1:
+            return unit.symbol
+
+        return f"{unit.symbol}{str(exponent).translate(_SUPERSCRIPTS)}"
+
+    numerator: list[str] = [symbol(unit, exp) for unit, exp in factors if exp > 0]
+    denominator: list[str] = [symbol(unit, -exp) for unit, exp in factors if exp < 0]
+    if not denominator:
+        return "·".join(numerator)
+
+    if len(denominator) == 1:
+        return f"{'·'.join(numerator) or '1'}/{denominator[0]}"
+
+    return f"{'·'.join(numerator) or '1'}/({'·'.join(denominator)})"
+
+
+@functools.cache
+def _simplify(
+    factors: tuple[tuple[Unit, int], ...],
+    /,
+) -> tuple[Unit | CompoundUnit | None, int]:
+    """Return unit of canonical factors and the decimal exponent it is off by.
+
+    Factors are resolved to a named unit of equal dimension where possible, the
+    decimal exponent then accounts for scaled units like gram. None is returned for
+    dimensionless factors.
+    """
+    if not factors:
+        return None, 0
+
+    (unit, exponent), *others = factors
+    if exponent == 1 and not others:
+        return unit, 0
+
+    dimension, scale = _dimension_and_scale(factors)
+    if not any(dimension):
+        return None, scale
+
+    try:
+        unit = _UNIT_BY_DIMENSION[dimension]
+    except KeyError:
+        return CompoundUnit(factors), 0
+
+    return unit, scale - _UNIT_DIMENSIONS[unit][1]
+
+
+@functools.cache
+def _combine(
+    unit: Unit | CompoundUnit | None,
+    other_unit: Unit | CompoundUnit | None,
+    exponent: int,
+    /,
+) -> tuple[Unit | CompoundUnit | None, int]:
+    """Return simplified unit of unit * other_unit**exponent, see _simplify."""
+    return _simplify(
+        _multiply(
+            () if unit is None else unit.factors,
+            () if other_unit is None else _power(other_unit.factors, exponent),
+        ),
+    )
+
+
+def _resolve(factors: tuple[tuple[Unit, int], ...], /) -> Unit | CompoundUnit:
+    """Return unit of canonical factors, named only where it is exactly equal."""
+    unit, scale = _simplify(factors)
+    if unit is None:
+        return Unit.one if not scale else CompoundUnit(factors)
+
+    if scale:
+        return CompoundUnit(factors)
+
+    return unit
+
 
 __all__ = [
+    "CompoundUnit",
     "Unit",
 ]
@@ -1,6 +1,7 @@
 # ruff: noqa: DTZ001
 
 import datetime
+import itertools
 import typing
 import zoneinfo
 
@@ -27,6 +28,29 @@ _VARIABLE_OFFSET_ZONE_INFO: typing.Final[zoneinfo.ZoneInfo] = zoneinfo.ZoneInfo(
 )
 
 
+class _CountingZoneInfo(datetime.tzinfo):
+    """Variable offset timezone counting calls of utcoffset and fromutc."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def utcoffset(self, dt):
+        self.calls += 1
+        return _VARIABLE_OFFSET_ZONE_INFO.utcoffset(dt)
+
+    def dst(self, dt):
+        return _VARIABLE_OFFSET_ZONE_INFO.dst(dt)
+
+    def tzname(self, dt):
+        return _VARIABLE_OFFSET_ZONE_INFO.tzname(dt)
+
+    def fromutc(self, dt):
+        self.calls += 1
+        return _VARIABLE_OFFSET_ZONE_INFO.fromutc(
+            dt.replace(tzinfo=_VARIABLE_OFFSET_ZONE_INFO),
+        ).replace(tzinfo=self)
+
+
 class TestGenericPeriod:
     @pytest.mark.parametrize(
         ("start", "end", "expected"),
@@ -505,3 +529,207 @@ class TestGenericPeriod:
             case _:
                 with pytest.raises(expected):
                     assert item in period
+
+
+class TestSplitPeriod:
+    @pytest.mark.parametrize(
+        ("period", "step", "expected"),
+        [
+            (
+                peprock.dt.Period(_NAIVE_DATETIME_1, _NAIVE_DATETIME_2),
+                datetime.timedelta(minutes=15),
+                [datetime.timedelta(minutes=15)] * 4,
+            ),
+            (
+                peprock.dt.Period(_AWARE_DATETIME_1, _AWARE_DATETIME_2),
+                datetime.timedelta(minutes=25),
+                [datetime.timedelta(minutes=25)] * 2 + [datetime.timedelta(minutes=10)],
+            ),
+            (
+                peprock.dt.Period(_NAIVE_DATETIME_1, _NAIVE_DATETIME_2),
+                datetime.timedelta(days=1),
+                [_OFFSET],
+            ),
+            (
+                peprock.dt.Period(_NAIVE_DATETIME_1, _NAIVE_DATETIME_1),
+                datetime.timedelta(minutes=15),
+                [],
+            ),
+        ],
+    )
+    def test_split(self, period, step, expected) -> None:
+        slots = period.split(step)
+        assert len(slots) == len(expected)
+        assert [slot.duration for slot in slots] == expected
+        assert list(slots) == [slots[index] for index in range(len(slots))]
+        assert slots[::-1] == list(reversed(slots))
+        if slots:
+            assert slots[0].start == period.start
+            assert slots[-1].end == period.end
+            assert slots[-1] == slots[len(slots) - 1]
+        for slot, next_slot in itertools.pairwise(slots):
+            assert slot.end == next_slot.start
+        with pytest.raises(IndexError):
+            slots[len(slots)]
+        with pytest.raises(IndexError):
+            slots[-len(slots) - 1]
+
+    def test_split_lazy(self) -> None:
+        start = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+        period = peprock.dt.Period(start, start.replace(year=2030))
+        slots = period.split(datetime.timedelta(minutes=15))
+        assert len(slots) == 3653 * 96
+        assert slots[96 * 366] == peprock.dt.Period(
+            datetime.datetime(2021, 1, 1, tzinfo=datetime.timezone.utc),
+            datetime.datetime(2021, 1, 1, 0, 15, tzinfo=datetime.timezone.utc),
+        )
+        assert repr(slots) == f"<PeriodSlots: {len(slots)} slots of {period!r}>"
+
+    @pytest.mark.parametrize(
+        ("period", "unit", "expected"),
+        [
+            (
+                peprock.dt.Period(
+                    datetime.datetime(2023, 11, 15, 12),
+                    datetime.datetime(2024, 3, 1),
+                ),
+                "month",
+                [
+                    (
+                        datetime.datetime(2023, 11, 15, 12),
+                        datetime.datetime(2023, 12, 1),
+                    ),
+                    (datetime.datetime(2023, 12, 1), datetime.datetime(2024, 1, 1)),
+                    (datetime.datetime(2024, 1, 1), datetime.datetime(2024, 2, 1)),
+                    (datetime.datetime(2024, 2, 1), datetime.datetime(2024, 3, 1)),
+                ],
+            ),
+            (
+                peprock.dt.Period(
+                    datetime.datetime(2023, 11, 15),
+                    datetime.datetime(2024, 4, 2),
+                ),
+                "quarter",
+                [
+                    (datetime.datetime(2023, 11, 15), datetime.datetime(2024, 1, 1)),
+                    (datetime.datetime(2024, 1, 1), datetime.datetime(2024, 4, 1)),
+                    (datetime.datetime(2024, 4, 1), datetime.datetime(2024, 4, 2)),
+                ],
+            ),
+            (
+                peprock.dt.Period(
+                    datetime.datetime(2022, 1, 1),
+                    datetime.datetime(2024, 6, 1),
+                ),
+                "year",
+                [
+                    (datetime.datetime(2022, 1, 1), datetime.datetime(2023, 1, 1)),
+                    (datetime.datetime(2023, 1, 1), datetime.datetime(2024, 1, 1)),
+                    (datetime.datetime(2024, 1, 1), datetime.datetime(2024, 6, 1)),
+                ],
+            ),
+            (
+                peprock.dt.Period(
+                    datetime.datetime(2024, 2, 28, 6),
+                    datetime.datetime(2024, 3, 1, 6),
+                ),
+                "day",
+                [
+                    (datetime.datetime(2024, 2, 28, 6), datetime.datetime(2024, 2, 29)),
+                    (datetime.datetime(2024, 2, 29), datetime.datetime(2024, 3, 1)),
+                    (datetime.datetime(2024, 3, 1), datetime.datetime(2024, 3, 1, 6)),
+                ],
+            ),
+            (
+                peprock.dt.Period(
+                    datetime.datetime(2024, 2, 28, 6),
+                    datetime.datetime(2024, 2, 28, 6),
+                ),
+                "day",
+                [],
+            ),
+        ],
+    )
+    def test_split_calendar(self, period, unit, expected) -> None:
+        slots = period.split_calendar(unit)
+        assert [(slot.start, slot.end) for slot in slots] == expected
+        assert slots[:] == list(slots)
+
+    def test_split_calendar_aware(self) -> None:
+        period = peprock.dt.Period(
+            _AWARE_DATETIME_1,
+            _AWARE_DATETIME_1 + datetime.timedelta(days=2),
+        ).split_calendar("day")
+        assert [slot.end for slot in period] == [
+            datetime.datetime(2023, 12, 25, tzinfo=datetime.timezone.utc),
+            datetime.datetime(2023, 12, 26, tzinfo=datetime.timezone.utc),
+            _AWARE_DATETIME_1 + datetime.timedelta(days=2),
+        ]
+        slots = peprock.dt.Period(
+            _AWARE_DATETIME_1.astimezone(_VARIABLE_OFFSET_ZONE_INFO),
+            _AWARE_DATETIME_1 + datetime.timedelta(days=1),
+        ).split_calendar("month")
+        assert len(slots) == 1
+        assert slots[0].end == _AWARE_DATETIME_1 + datetime.timedelta(days=1)
+
+    @pytest.mark.parametrize(
+        ("day", "hours", "offsets"),
+        [
+            (datetime.date(2024, 3, 31), 23, [1] * 2 + [2] * 21),
+            (datetime.date(2024, 10, 27), 25, [2] * 3 + [1] * 22),
+            (datetime.date(2024, 6, 1), 24, [2] * 24),
+        ],
+    )
+    def test_split_daylight_saving_time(self, day, hours, offsets) -> None:
+        (period,) = peprock.dt.Period(
+            datetime.datetime.combine(day, datetime.time(), _VARIABLE_OFFSET_ZONE_INFO),
+            datetime.datetime.combine(
+                day + datetime.timedelta(days=1),
+                datetime.time(),
+                _VARIABLE_OFFSET_ZONE_INFO,
+            ),
+        ).split_calendar("day")
+        assert period.duration == hours * _OFFSET
+        assert period.midpoint == (
+            period.start.astimezone(datetime.timezone.utc) + hours * _OFFSET / 2
+        )
+        assert period.midpoint.tzinfo is _VARIABLE_OFFSET_ZONE_INFO
+        slots = period.split(_OFFSET)
+        assert len(slots) == hours
+        assert [slot.duration for slot in slots] == [_OFFSET] * hours
+        assert [slot.start.utcoffset() // _OFFSET for slot in slots] == offsets
+        assert slots[-1].end == period.end
+        assert all(slot.start.tzinfo is _VARIABLE_OFFSET_ZONE_INFO for slot in slots)
+
+    def test_split_utc_offsets_cached(self) -> None:
+        zone_info = _CountingZoneInfo()
+        start = datetime.datetime(2023, 1, 1, tzinfo=zone_info)
+        period = peprock.dt.Period(start, start.replace(year=2024))
+        step = datetime.timedelta(minutes=15)
+        zone_info.calls = 0
+        slots = list(period.split(step))
+        assert len(slots) == 365 * 96
+        # a few calls per day and transition rather than per slot
+        assert zone_info.calls < 3 * 365
+        utc_start = start.astimezone(datetime.timezone.utc)
+        for index, slot in enumerate(slots):
+            assert slot.start.astimezone(datetime.timezone.utc) == (
+                utc_start + index * step
+            )
+            assert slot.end.astimezone(datetime.timezone.utc) == (
+                utc_start + (index + 1) * step
+            )
+
+    def test_split_invalid(self) -> None:
+        period = peprock.dt.Period(_NAIVE_DATETIME_2, _NAIVE_DATETIME_1)
+        with pytest.raises(ValueError, match="expected period ending after its start"):
+            period.split(_OFFSET)
+        with pytest.raises(ValueError, match="expected period ending after its start"):
+            period.split_calendar("day")
+        period = peprock.dt.Period(_NAIVE_DATETIME_1, _NAIVE_DATETIME_2)
+        with pytest.raises(ValueError, match="expected positive step"):
+            period.split(datetime.timedelta())
+        with pytest.raises(ValueError, match="expected day, month, quarter or year"):
+            period.split_calendar("week")
+        with pytest.raises(TypeError):
+            peprock.dt.Period(_NAIVE_DATETIME_1, _AWARE_DATETIME_2).split(_OFFSET)
@@ -0,0 +1,125 @@
+import datetime
+import operator
+import random
+
+import pytest
+
+import peprock.dt
+
+_START = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+_KEY = operator.attrgetter("start", "end")
+
+
+def _moment(hours):
+    return _START + datetime.timedelta(hours=hours)
+
+
+@pytest.fixture
+def periods():
+    random_ = random.Random(8)  # noqa: S311
+    periods = []
+    for _ in range(500):
+        start = random_.randrange(1000)
+        periods.append(
+            peprock.dt.Period(
+                _moment(start),
+                _moment(start + random_.choice([0, 1, 24, random_.randrange(500)])),
+            ),
+        )
+    return periods
+
+
+@pytest.fixture
+def queries():
+    random_ = random.Random(16)  # noqa: S311
+    queries = [
+        peprock.dt.Period(_moment(start), _moment(start + duration))
+        for start, duration in [(0, 0), (-10, 5), (1500, 10), (-10, 2000), (20, -5)]
+    ]
+    for _ in range(200):
+        start = random_.randrange(-100, 1600)
+        queries.append(
+            peprock.dt.Period(_moment(start), _moment(start + random_.randrange(100))),
+        )
+    return queries
+
+
+def test_sequence(periods):
+    index = peprock.dt.PeriodIndex(periods)
+    assert len(index) == len(periods)
+    assert list(index) == sorted(periods, key=_KEY)
+    assert index[0] == min(periods, key=_KEY)
+    assert index[:3] == list(index)[:3]
+    assert periods[0] in index
+    assert repr(peprock.dt.PeriodIndex()) == "PeriodIndex([])"
+    assert not peprock.dt.PeriodIndex().containing(_START)
+
+
+def test_containing(periods, queries):
+    index = peprock.dt.PeriodIndex(periods)
+    for query in queries:
+        for item in (query.start, query.end, query):
+            assert sorted(index.containing(item), key=_KEY) == sorted(
+                (period for period in periods if item in period),
+                key=_KEY,
+            )
+
+
+def test_overlapping(periods, queries):
+    index = peprock.dt.PeriodIndex(periods)
+    for query in queries:
+        start, end = sorted((query.start, query.end))
+        assert sorted(index.overlapping(query), key=_KEY) == sorted(
+            (
+                period
+                for period in periods
+                if max(period.start, start) <= min(period.end, end)
+            ),
+            key=_KEY,
+        )
+        if query.end < query.start:
+            assert sorted(index.overlapping(query), key=_KEY) == sorted(
+                index.containing(query),
+                key=_KEY,
+            )
+            assert index.overlapping(query)
+        assert sorted(index.overlapping(query.start), key=_KEY) == sorted(
+            (period for period in periods if query.start in period),
+            key=_KEY,
+        )
+
+
+def test_within(periods, queries):
+    index = peprock.dt.PeriodIndex(periods)
+    for query in queries:
+        assert sorted(index.within(query), key=_KEY) == sorted(
+            (period for period in periods if period in query),
+            key=_KEY,
+        )
+
+
+def test_naive():
+    start = datetime.datetime(2024, 1, 1)  # noqa: DTZ001
+    index = peprock.dt.PeriodIndex(
+        [peprock.dt.Period(start, start + datetime.timedelta(days=1))],
+    )
+    assert index.containing(start) == list(index)
+    with pytest.raises(TypeError):
+        index.containing(_START)
+
+
+def test_invalid():
+    with pytest.raises(ValueError, match="expected period ending after its start"):
+        peprock.dt.PeriodIndex([peprock.dt.Period(_moment(1), _moment(0))])
+    with pytest.raises(TypeError):
+        peprock.dt.PeriodIndex(
+            [
+                peprock.dt.Period(_START, _START),
+                peprock.dt.Period(
+                    _START.replace(tzinfo=None),
+                    _START.replace(tzinfo=None),
+                ),
+            ],
+        )
+    with pytest.raises(TypeError):
+        peprock.dt.PeriodIndex([peprock.dt.Period(_START, _START)]).containing(1)
@@ -0,0 +1,132 @@
+import datetime
+import random
+
+import pytest
+
+import peprock.dt
+
+np = pytest.importorskip("numpy")
+
+_START = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+_MICROSECOND = datetime.timedelta(microseconds=1)
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+@pytest.fixture
+def periods():
+    random_ = random.Random(4)  # noqa: S311
+    periods = []
+    for _ in range(300):
+        start = _START + random_.randrange(10**12) * _MICROSECOND
+        periods.append(
+            peprock.dt.Period(
+                start,
+                start + random_.randrange(-5, 10**10) * _MICROSECOND,
+            ),
+        )
+    return periods
+
+
+def test_from_periods(periods):
+    series = peprock.dt.PeriodSeries.from_periods(periods)
+    assert len(series) == len(periods)
+    assert list(series) == periods
+    assert [series[index] for index in range(-len(series), 0)] == periods
+    assert series[np.int64(3)] == periods[3]
+    assert series.starts.dtype == np.int64
+    assert series.ends.dtype == np.int64
+    assert periods[7] in series
+    assert peprock.dt.Period(_START, _START) not in series
+    assert peprock.dt.Period(_START.replace(tzinfo=None), _START) not in series
+    assert 1 not in series
+    with pytest.raises(IndexError):
+        series[len(series)]
+    assert len(peprock.dt.PeriodSeries.from_periods([])) == 0
+
+
+def test_vectorized(periods):
+    series = peprock.dt.PeriodSeries.from_periods(periods)
+    assert series.duration.tolist() == [
+        period.duration // _MICROSECOND for period in periods
+    ]
+    assert series.midpoint.tolist() == [
+        (period.midpoint - _EPOCH) // _MICROSECOND for period in periods
+    ]
+    for item in [
+        periods[0].start,
+        periods[1].midpoint,
+        periods[2],
+        peprock.dt.Period(periods[3].end, periods[3].start),
+        _START,
+    ]:
+        assert series.contains(item).tolist() == [item in period for period in periods]
+
+
+def test_midpoint_rounding():
+    series = peprock.dt.PeriodSeries(
+        np.zeros(8, dtype=np.int64),
+        np.array([-3, -2, -1, 0, 1, 2, 3, 5]),
+    )
+    assert series.midpoint.tolist() == [
+        period.midpoint.timestamp() * 1_000_000 for period in series
+    ]
+
+
+def test_slicing_and_sorting(periods):
+    series = peprock.dt.PeriodSeries.from_periods(periods)
+    assert list(series[10:20]) == periods[10:20]
+    assert list(series[::-3]) == periods[::-3]
+    mask = series.contains(periods[5].start)
+    assert list(series[mask]) == [
+        period for period in periods if periods[5].start in period
+    ]
+    assert list(series[[5, 3]]) == [periods[5], periods[3]]
+    assert list(series[mask.tolist()]) == list(series[mask])
+    assert len(series[[]]) == 0
+    sorted_series = series.sorted()
+    assert list(sorted_series) == sorted(periods, key=lambda p: (p.start, p.end))
+    assert list(series[series.argsort()]) == list(sorted_series)
+
+
+def test_tzinfo():
+    zone_info = datetime.timezone(datetime.timedelta(hours=-5))
+    series = peprock.dt.PeriodSeries.from_periods(
+        [peprock.dt.Period(_START, _START + datetime.timedelta(hours=1))],
+        tzinfo=zone_info,
+    )
+    assert series[0].start.tzinfo is zone_info
+    assert series[0].start == _START
+    assert series[:1].tzinfo is zone_info
+
+
+def test_assumed_tz():
+    zone_info = datetime.timezone(datetime.timedelta(hours=2))
+    naive = peprock.dt.Period(
+        datetime.datetime(2024, 1, 1, 2),  # noqa: DTZ001
+        datetime.datetime(2024, 1, 1, 3),  # noqa: DTZ001
+    )
+    series = peprock.dt.PeriodSeries.from_periods([naive], assumed_tz=zone_info)
+    assert series[0] == peprock.dt.Period(
+        _START,
+        _START + datetime.timedelta(hours=1),
+    )
+    assert naive not in series
+    assert series.contains(naive.start, assumed_tz=zone_info).tolist() == [True]
+    assert series.contains(naive, assumed_tz=datetime.timezone.utc).tolist() == [
+        False,
+    ]
+    with pytest.raises(peprock.dt.EnsureAwareError):
+        series.contains(naive.start)
+
+
+def test_invalid():
+    with pytest.raises(ValueError, match="expected one-dimensional starts and ends"):
+        peprock.dt.PeriodSeries(np.zeros(2), np.zeros(3))
+    with pytest.raises(ValueError, match="expected one-dimensional starts and ends"):
+        peprock.dt.PeriodSeries(np.zeros((2, 2)), np.zeros((2, 2)))
+    with pytest.raises(peprock.dt.EnsureAwareError):
+        peprock.dt.PeriodSeries.from_periods(
+            [peprock.dt.Period(_START.replace(tzinfo=None), _START)],
+        )
+    with pytest.raises(AttributeError):
+        peprock.dt.PeriodSeriez  # noqa: B018
@@ -0,0 +1,140 @@
+import datetime
+import itertools
+import random
+
+import pytest
+
+import peprock.dt
+
+_START = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+_HOUR = datetime.timedelta(hours=1)
+
+
+def _period(start, end):
+    return peprock.dt.Period(_START + start * _HOUR, _START + end * _HOUR)
+
+
+def _hours(periods):
+    """Return hours covered by hour-aligned periods, disregarding boundaries."""
+    return {
+        hour
+        for period in periods
+        for hour in range(
+            (period.start - _START) // _HOUR,
+            (period.end - _START) // _HOUR,
+        )
+    }
+
+
+def _random_periods(seed):
+    random_ = random.Random(seed)  # noqa: S311
+    periods = []
+    for _ in range(random_.randrange(50)):
+        start = random_.randrange(200)
+        periods.append(_period(start, start + random_.choice([0, 1, 5, 20])))
+    return periods
+
+
+def _check_normalized(period_set):
+    for period in period_set:
+        assert period.start < period.end
+    for period, next_period in itertools.pairwise(period_set):
+        assert period.end < next_period.start
+
+
+@pytest.fixture(params=range(20))
+def periods(request):
+    return _random_periods(request.param)
+
+
+@pytest.fixture(params=range(20, 25))
+def other_periods(request):
+    return _random_periods(request.param)
+
+
+def test_init(periods):
+    period_set = peprock.dt.PeriodSet(periods)
+    _check_normalized(period_set)
+    assert _hours(period_set) == _hours(periods)
+    assert period_set == peprock.dt.PeriodSet(reversed(periods))
+    assert hash(period_set) == hash(peprock.dt.PeriodSet(reversed(periods)))
+    assert period_set.duration == len(_hours(periods)) * _HOUR
+    assert period_set == peprock.dt.PeriodSet(period_set)
+    assert period_set != list(period_set)
+
+
+def test_coalesce():
+    period_set = peprock.dt.PeriodSet(
+        [_period(5, 6), _period(0, 2), _period(2, 3), _period(1, 2), _period(8, 8)],
+    )
+    assert list(period_set) == [_period(0, 3), _period(5, 6)]
+    assert repr(peprock.dt.PeriodSet()) == "PeriodSet([])"
+
+
+def test_contains():
+    period_set = peprock.dt.PeriodSet([_period(0, 2), _period(4, 6)])
+    for item, expected in [
+        (_START - _HOUR, False),
+        (_START, True),
+        (_START + 2 * _HOUR, True),
+        (_START + 3 * _HOUR, False),
+        (_START + 6 * _HOUR, True),
+        (_START + 7 * _HOUR, False),
+        (_period(4, 6), True),
+        (_period(1, 5), False),
+        (_period(5, 5), True),
+        (_period(6, 4), True),
+        (_period(3, 3), False),
+    ]:
+        assert (item in period_set) is expected
+    with pytest.raises(TypeError, match=r"expected peprock\.dt\.Period"):
+        assert 1 in period_set
+
+
+def test_set_operations(periods, other_periods):
+    period_set = peprock.dt.PeriodSet(periods)
+    other = peprock.dt.PeriodSet(other_periods)
+    bounds = _period(20, 150)
+    for result, expected in [
+        (period_set | other, _hours(periods) | _hours(other_periods)),
+        (period_set.union(other_periods), _hours(periods) | _hours(other_periods)),
+        (period_set & other, _hours(periods) & _hours(other_periods)),
+        (
+            period_set.intersection(other_periods),
+            _hours(periods) & _hours(other_periods),
+        ),
+        (period_set - other, _hours(periods) - _hours(other_periods)),
+        (
+            period_set.difference(other_periods),
+            _hours(periods) - _hours(other_periods),
+        ),
+        (period_set.complement(bounds), _hours([bounds]) - _hours(periods)),
+    ]:
+        _check_normalized(result)
+        assert _hours(result) == expected
+    assert (period_set | period_set) == period_set
+    assert (period_set & period_set) == period_set
+    assert not period_set - period_set
+
+
+def test_invalid():
+    with pytest.raises(ValueError, match="expected period ending after its start"):
+        peprock.dt.PeriodSet([_period(1, 0)])
+    with pytest.raises(ValueError, match="expected period ending after its start"):
+        peprock.dt.PeriodSet().complement(_period(1, 0))
+    with pytest.raises(TypeError):
+        peprock.dt.PeriodSet() | [_period(0, 1)]
+    with pytest.raises(TypeError):
+        peprock.dt.PeriodSet() & [_period(0, 1)]
+    with pytest.raises(TypeError):
+        peprock.dt.PeriodSet() - [_period(0, 1)]
+    with pytest.raises(TypeError):
+        peprock.dt.PeriodSet(
+            [
+                _period(0, 1),
+                peprock.dt.Period(
+                    datetime.datetime(2024, 1, 1),  # noqa: DTZ001
+                    datetime.datetime(2024, 1, 2),  # noqa: DTZ001
+                ),
+            ],
+        )
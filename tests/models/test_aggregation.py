@@ -0,0 +1,257 @@
+import decimal
+import fractions
+import math
+import pickle
+import statistics
+
+import pytest
+
+import peprock.models
+
+
+@pytest.fixture(
+    scope="session",
+    params=[
+        int,
+        float,
+        decimal.Decimal,
+        fractions.Fraction,
+    ],
+)
+def number_type(request):
+    return request.param
+
+
+@pytest.fixture(scope="session")
+def measurements(number_type):
+    return [
+        peprock.models.Measurement(
+            number_type(magnitude),
+            prefix,
+            peprock.models.Unit.watt,
+        )
+        for magnitude, prefix in [
+            (3, peprock.models.MetricPrefix.kilo),
+            (-1500, peprock.models.MetricPrefix.NONE),
+            (2, peprock.models.MetricPrefix.NONE),
+            (250000, peprock.models.MetricPrefix.milli),
+            (1, peprock.models.MetricPrefix.mega),
+        ]
+    ]
+
+
+def test_total(measurements, number_type):
+    result = peprock.models.total(measurements)
+    assert result == sum(measurements[1:], measurements[0])
+    assert result.magnitude == number_type(1001752000)
+    assert type(result.magnitude) is number_type
+    assert result.prefix is peprock.models.MetricPrefix.milli
+    assert result.unit is peprock.models.Unit.watt
+
+
+def test_total_exact():
+    measurements = [peprock.models.Measurement(0.1)] * 10
+    assert peprock.models.total(measurements).magnitude == 1.0
+    assert sum(measurements[1:], measurements[0]).magnitude != 1.0
+
+    measurements = [
+        peprock.models.Measurement(decimal.Decimal("1e30")),
+        peprock.models.Measurement(decimal.Decimal(1)),
+        peprock.models.Measurement(decimal.Decimal("-1e30")),
+    ]
+    assert peprock.models.total(measurements).magnitude == 1
+    assert sum(measurements[1:], measurements[0]).magnitude == 0
+
+    with decimal.localcontext(decimal.Context(prec=3)):
+        assert peprock.models.total(
+            [peprock.models.Measurement(decimal.Decimal("1.234"))] * 2,
+        ).magnitude == decimal.Decimal("2.47")
+
+
+def test_mean(measurements, number_type):
+    result = peprock.models.mean(measurements)
+    assert result.magnitude == number_type(1001752000) / 5
+    assert type(result.magnitude) is (float if number_type is int else number_type)
+    assert result.prefix is peprock.models.MetricPrefix.milli
+
+
+def test_weighted_mean(measurements, number_type):
+    weights = [number_type(weight) for weight in (1, 0, 2, 4, 1)]
+    result = peprock.models.weighted_mean(measurements, weights)
+    assert result.magnitude == number_type(1004004000) / 8
+    assert result.prefix is peprock.models.MetricPrefix.milli
+
+    with pytest.raises(ValueError, match="expected nonzero total weight"):
+        peprock.models.weighted_mean(measurements, [0] * 5)
+    with pytest.raises(ValueError, match="shorter than argument 1"):
+        peprock.models.weighted_mean(measurements, weights[:-1])
+
+
+def test_extremum(measurements):
+    assert peprock.models.minimum(measurements) is measurements[1]
+    assert peprock.models.maximum(measurements) is measurements[4]
+    assert peprock.models.minimum(iter(measurements[2:4])) is measurements[2]
+    assert peprock.models.maximum(iter(measurements[2:4])) is measurements[3]
+
+
+@pytest.mark.parametrize(
+    "function",
+    [
+        peprock.models.total,
+        peprock.models.mean,
+        peprock.models.minimum,
+        peprock.models.maximum,
+    ],
+)
+def test_invalid(function):
+    with pytest.raises(ValueError, match="expected at least one measurement"):
+        function([])
+    with pytest.raises(ValueError, match="expected measurements sharing a unit"):
+        function(
+            [
+                peprock.models.Measurement(1, unit=peprock.models.Unit.watt),
+                peprock.models.Measurement(1, unit=peprock.models.Unit.joule),
+            ],
+        )
+
+
+def test_invalid_magnitude_types():
+    with pytest.raises(TypeError, match="unsupported magnitude types"):
+        peprock.models.total(
+            [
+                peprock.models.Measurement(1.0),
+                peprock.models.Measurement(decimal.Decimal(1)),
+            ],
+        )
+
+
+@pytest.fixture(scope="session")
+def magnitudes():
+    return [(index * 7919 % 1000 - 250) / 8 for index in range(2000)]
+
+
+def test_measurement_statistics(magnitudes):
+    statistics_ = peprock.models.MeasurementStatistics().update(
+        peprock.models.Measurement(
+            magnitude,
+            peprock.models.MetricPrefix.kilo,
+            peprock.models.Unit.watt,
+        )
+        for magnitude in magnitudes
+    )
+    assert statistics_.count == len(magnitudes)
+    assert statistics_.total == peprock.models.Measurement(
+        math.fsum(magnitudes),
+        peprock.models.MetricPrefix.kilo,
+        peprock.models.Unit.watt,
+    )
+    assert statistics_.mean.magnitude == pytest.approx(statistics.fmean(magnitudes))
+    assert statistics_.variance == pytest.approx(statistics.pvariance(magnitudes))
+    assert statistics_.standard_deviation.magnitude == pytest.approx(
+        statistics.pstdev(magnitudes),
+    )
+    assert statistics_.minimum.magnitude == min(magnitudes)
+    assert statistics_.maximum.magnitude == max(magnitudes)
+    assert statistics_.quantile(0).magnitude == min(magnitudes)
+    assert statistics_.quantile(1).magnitude == max(magnitudes)
+    assert statistics_.quantile(0.9).magnitude == pytest.approx(
+        statistics.quantiles(magnitudes, n=10, method="inclusive")[-1],
+        rel=0.01,
+    )
+    assert statistics_.mean.prefix is peprock.models.MetricPrefix.kilo
+    assert statistics_.mean.unit is peprock.models.Unit.watt
+
+
+@pytest.mark.parametrize(
+    ("prefix", "unit", "scale"),
+    [
+        (peprock.models.MetricPrefix.kilo, peprock.models.Unit.watt, 1),
+        (peprock.models.MetricPrefix.NONE, peprock.models.Unit.watt, 1000),
+        (
+            peprock.models.MetricPrefix.milli,
+            peprock.models.Unit.joule / peprock.models.Unit.second,
+            1000000,
+        ),
+    ],
+)
+def test_measurement_statistics_merge(magnitudes, prefix, unit, scale):
+    statistics_ = peprock.models.MeasurementStatistics().update(
+        peprock.models.Measurement(
+            magnitude,
+            peprock.models.MetricPrefix.kilo,
+            peprock.models.Unit.watt,
+        )
+        for magnitude in magnitudes[:500]
+    )
+    other = peprock.models.MeasurementStatistics()
+    for magnitude in magnitudes[500:]:
+        other.add(peprock.models.Measurement(magnitude * scale, prefix, unit))
+
+    assert statistics_.merge(pickle.loads(pickle.dumps(other))) is statistics_  # noqa: S301
+    assert statistics_.count == len(magnitudes)
+    assert statistics_.total.magnitude == pytest.approx(math.fsum(magnitudes))
+    assert statistics_.mean.magnitude == pytest.approx(statistics.fmean(magnitudes))
+    assert statistics_.variance == pytest.approx(statistics.pvariance(magnitudes))
+    assert statistics_.minimum.magnitude == pytest.approx(min(magnitudes))
+    assert statistics_.maximum.magnitude == pytest.approx(max(magnitudes))
+    assert statistics_.quantile(0.5).magnitude == pytest.approx(
+        statistics.median(magnitudes),
+        rel=0.01,
+    )
+    assert statistics_.mean.prefix is peprock.models.MetricPrefix.kilo
+
+    empty = peprock.models.MeasurementStatistics()
+    assert empty.merge(statistics_).mean == statistics_.mean
+    assert statistics_.merge(peprock.models.MeasurementStatistics()).count == len(
+        magnitudes,
+    )
+
+
+def test_measurement_statistics_bounded():
+    statistics_ = peprock.models.MeasurementStatistics(max_bins=16).update(
+        peprock.models.Measurement(2.0**exponent) for exponent in range(-500, 500)
+    )
+    assert 16 - 16 // 8 <= len(statistics_._positive_bins) <= 16  # noqa: PLR2004
+    assert statistics_.quantile(1).magnitude == 2.0**499
+    assert statistics_.quantile(0.999).magnitude == pytest.approx(2.0**498, rel=0.01)
+
+
+def test_measurement_statistics_invalid():
+    statistics_ = peprock.models.MeasurementStatistics()
+    with pytest.raises(ValueError, match="expected finite magnitude"):
+        statistics_.add(
+            peprock.models.Measurement(
+                math.inf,
+                peprock.models.MetricPrefix.kilo,
+                peprock.models.Unit.joule,
+            ),
+        )
+    assert not statistics_.count
+    statistics_.add(peprock.models.Measurement(2, unit=peprock.models.Unit.watt))
+    assert statistics_.total == peprock.models.Measurement(
+        2,
+        unit=peprock.models.Unit.watt,
+    )
+    statistics_ = peprock.models.MeasurementStatistics()
+    with pytest.raises(ValueError, match="expected at least one measurement"):
+        _ = statistics_.mean
+    with pytest.raises(ValueError, match="expected at least one measurement"):
+        statistics_.quantile(0.5)
+
+    statistics_.add(peprock.models.Measurement(1, unit=peprock.models.Unit.watt))
+    with pytest.raises(ValueError, match="cannot convert"):
+        statistics_.add(peprock.models.Measurement(1, unit=peprock.models.Unit.joule))
+    with pytest.raises(ValueError, match="expected finite magnitude"):
+        statistics_.add(
+            peprock.models.Measurement(math.nan, unit=peprock.models.Unit.watt),
+        )
+    with pytest.raises(ValueError, match="expected quantile between 0 and 1"):
+        statistics_.quantile(1.5)
+    with pytest.raises(ValueError, match="expected statistics of equal relative"):
+        statistics_.merge(
+            peprock.models.MeasurementStatistics(relative_accuracy=0.05),
+        )
+    with pytest.raises(ValueError, match="expected relative accuracy between"):
+        peprock.models.MeasurementStatistics(relative_accuracy=1)
+    with pytest.raises(ValueError, match="expected positive max bins"):
+        peprock.models.MeasurementStatistics(max_bins=0)
@@ -0,0 +1,166 @@
+import decimal
+import fractions
+import math
+
+import pytest
+
+import peprock.models
+from peprock.models import codec
+
+
+@pytest.fixture(
+    scope="session",
+    params=[
+        0,
+        -(2**63),
+        2**63,
+        -(2**100),
+        12.0,
+        -34567.89012,
+        math.inf,
+        decimal.Decimal("-0.000"),
+        decimal.Decimal("-34567.89012"),
+        decimal.Decimal("1.23456789012345678901234567890123456789E+999"),
+        decimal.Decimal("NaN"),
+        decimal.Decimal("-Infinity"),
+        fractions.Fraction(-7, 3),
+        fractions.Fraction(2**80, 3),
+    ],
+    ids=repr,
+)
+def magnitude(request):
+    return request.param
+
+
+@pytest.fixture(
+    scope="session",
+    params=[
+        peprock.models.MetricPrefix.NONE,
+        peprock.models.MetricPrefix.quetta,
+        peprock.models.MetricPrefix.quecto,
+    ],
+)
+def prefix(request):
+    return request.param
+
+
+@pytest.fixture(
+    scope="session",
+    params=[
+        None,
+        peprock.models.Unit.one,
+        peprock.models.Unit.watt_hour,
+        peprock.models.Unit.watt / peprock.models.Unit.metre**2,
+        "pep",
+        "€/MWh",
+    ],
+    ids=str,
+)
+def unit(request):
+    return request.param
+
+
+@pytest.fixture(scope="session")
+def measurement(magnitude, prefix, unit):
+    return peprock.models.Measurement(magnitude, prefix, unit)
+
+
+def test_pack(measurement):
+    unpacked = peprock.models.unpack(peprock.models.pack(measurement))
+    assert repr(unpacked) == repr(measurement)
+    assert type(unpacked.magnitude) is type(measurement.magnitude)
+
+
+def test_pack_size():
+    assert (
+        len(
+            peprock.models.pack(
+                peprock.models.Measurement(
+                    1,
+                    peprock.models.MetricPrefix.kilo,
+                    peprock.models.Unit.watt,
+                ),
+            ),
+        )
+        == codec._HEADER.size + codec._INT64_STRUCT.size
+    )
+
+
+def test_pack_many(measurement):
+    measurements = [
+        measurement,
+        measurement,
+        peprock.models.Measurement(1.5),
+        peprock.models.Measurement(2.5),
+        measurement,
+    ]
+    data = peprock.models.pack_many(iter(measurements))
+    assert repr(peprock.models.unpack_many(data)) == repr(measurements)
+    assert repr(peprock.models.unpack_many(memoryview(bytearray(data)))) == repr(
+        measurements,
+    )
+
+
+def test_pack_many_empty():
+    assert peprock.models.pack_many([]) == b""
+    assert peprock.models.unpack_many(b"") == []
+
+
+def test_units():
+    assert set(codec._UNITS) == {None, *peprock.models.Unit}
+    assert len(codec._UNITS) == len(codec._UNIT_IDS)
+
+
+def test_pack_invalid():
+    with pytest.raises(TypeError, match="unsupported magnitude type 'complex'"):
+        peprock.models.pack(peprock.models.Measurement(1j))
+    for pack in (
+        peprock.models.pack,
+        lambda measurement: peprock.models.pack_many([measurement]),
+    ):
+        with pytest.raises(ValueError, match="expected decimal exponent between"):
+            pack(peprock.models.Measurement(decimal.Decimal("1E+3000000000")))
+        with pytest.raises(ValueError, match="expected string of at most 65535"):
+            pack(peprock.models.Measurement(1, unit="x" * 2**16))
+        with pytest.raises(
+            ValueError,
+            match="expected compound unit exponents between -128 and 127",
+        ):
+            pack(peprock.models.Measurement(1, unit=peprock.models.Unit.watt**200))
+
+
+def test_pack_unit_cache():
+    for index in range(1000):
+        peprock.models.pack(peprock.models.Measurement(1, unit=f"pep{index}"))
+    cache_info = codec._pack_unit.cache_info()
+    assert cache_info.currsize <= cache_info.maxsize
+
+
+@pytest.mark.parametrize(
+    ("data", "match"),
+    [
+        (b"", "truncated measurement data"),
+        (b"\x00\x00\x00\x00\x01\x02", "truncated measurement data"),
+        (b"\x00\x00\x00\x02\x10\x00\x00\x00\x01", "truncated measurement data"),
+        (b"\x00\x00\x00\x09", "invalid magnitude tag 9"),
+        (b"\x05\x00\x00\x00" + bytes(8), "invalid prefix exponent 5"),
+        (b"\x00\x00\x01\x00" + bytes(8), "invalid unit id 256"),
+        (b"\x00\xfe\xff\x00\x01\x00\x00\x01" + bytes(8), "invalid compound unit"),
+        (b"\x00\x00\x00\x00" + bytes(9), "unexpected 1 trailing bytes"),
+        (
+            b"\x00\x00\x00\x05\x01\x00\x00\x00\x01\x00\x00\x00\x00",
+            "invalid fraction denominator 0",
+        ),
+    ],
+)
+def test_unpack_invalid(data, match):
+    with pytest.raises(ValueError, match=match):
+        peprock.models.unpack(data)
+
+
+def test_unpack_many_invalid():
+    data = peprock.models.pack_many([peprock.models.Measurement(1.5)] * 2)
+    with pytest.raises(ValueError, match="truncated measurement data"):
+        peprock.models.unpack_many(data[:-1])
+    with pytest.raises(ValueError, match="truncated measurement data"):
+        peprock.models.unpack_many(data[:5])
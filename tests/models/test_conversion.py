@@ -0,0 +1,117 @@
+import decimal
+import fractions
+
+import pytest
+
+import peprock.models
+
+
+@pytest.mark.parametrize(
+    ("source", "target", "kwargs", "expected"),
+    [
+        (
+            peprock.models.Unit.watt_hour,
+            peprock.models.Unit.joule,
+            {},
+            (3600.0, 0.0),
+        ),
+        (
+            peprock.models.Unit.joule,
+            peprock.models.Unit.watt_hour,
+            {
+                "source_prefix": peprock.models.MetricPrefix.mega,
+                "target_prefix": peprock.models.MetricPrefix.kilo,
+                "number_type": fractions.Fraction,
+            },
+            (fractions.Fraction(5, 18), fractions.Fraction(0)),
+        ),
+        (
+            peprock.models.Unit.watt_hour,
+            peprock.models.Unit.joule,
+            {"source_prefix": peprock.models.MetricPrefix.kilo, "number_type": int},
+            (3600000, 0),
+        ),
+        (
+            peprock.models.Unit.kelvin,
+            peprock.models.Unit.degree_celsius,
+            {"number_type": decimal.Decimal},
+            (decimal.Decimal(1), decimal.Decimal("-273.15")),
+        ),
+        (
+            peprock.models.Unit.degree_celsius,
+            peprock.models.Unit.kelvin,
+            {"number_type": int},
+            (1, fractions.Fraction(5463, 20)),
+        ),
+        (
+            peprock.models.Unit.hour,
+            peprock.models.Unit.second,
+            {"target_prefix": peprock.models.MetricPrefix.kilo},
+            (3.6, 0.0),
+        ),
+        (
+            peprock.models.Unit.watt * peprock.models.Unit.hour,
+            peprock.models.Unit.joule,
+            {"number_type": int},
+            (3600, 0),
+        ),
+        (
+            peprock.models.Unit.gram,
+            peprock.models.Unit.joule
+            * peprock.models.Unit.second**2
+            / peprock.models.Unit.metre**2,
+            {"source_prefix": peprock.models.MetricPrefix.kilo},
+            (1.0, 0.0),
+        ),
+        (None, peprock.models.Unit.one, {}, (1.0, 0.0)),
+        (peprock.models.Unit.watt, peprock.models.Unit.joule, {}, None),
+        (peprock.models.Unit.hertz, peprock.models.Unit.becquerel, {}, None),
+        (peprock.models.Unit.watt, "pep", {}, None),
+        (
+            peprock.models.Unit.degree_celsius / peprock.models.Unit.second,
+            peprock.models.Unit.kelvin / peprock.models.Unit.second,
+            {},
+            None,
+        ),
+    ],
+    ids=str,
+)
+def test_conversion_plan(source, target, kwargs, expected):
+    plan = peprock.models.conversion_plan(source, target, **kwargs)
+    assert plan == expected
+    if plan is not None:
+        number_type = kwargs.get("number_type", float)
+        assert all(
+            isinstance(value, number_type | fractions.Fraction) for value in plan
+        )
+        assert peprock.models.conversion_plan(source, target, **kwargs) is plan
+
+
+def test_register_conversion():
+    peprock.models.register_conversion(
+        "kWh",
+        peprock.models.Unit.watt_hour,
+        factor=1000,
+    )
+    # registering again is fine, registering differently is not
+    peprock.models.register_conversion(
+        "kWh",
+        peprock.models.Unit.watt_hour,
+        factor=1000,
+    )
+    assert peprock.models.conversion_plan("kWh", peprock.models.Unit.joule) == (
+        3600000.0,
+        0.0,
+    )
+
+    with pytest.raises(ValueError, match="expected unit without conversion"):
+        peprock.models.register_conversion("kWh", peprock.models.Unit.joule)
+    with pytest.raises(ValueError, match="expected unit without conversion"):
+        peprock.models.register_conversion(
+            peprock.models.Unit.joule,
+            peprock.models.Unit.watt_hour,
+        )
+    with pytest.raises(ValueError, match="expected reference with conversion"):
+        peprock.models.register_conversion("MWh", "GWh")
+    with pytest.raises(ValueError, match="expected nonzero factor"):
+        peprock.models.register_conversion("MWh", "kWh", factor=0)
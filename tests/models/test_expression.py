@@ -0,0 +1,164 @@
+import decimal
+import fractions
+import operator
+
+import pytest
+
+import peprock.models
+
+
+@pytest.fixture(
+    params=[
+        int,
+        float,
+        decimal.Decimal,
+        fractions.Fraction,
+    ],
+)
+def measurements(request):
+    return [
+        peprock.models.Measurement(
+            request.param(magnitude),
+            prefix,
+            peprock.models.Unit.watt,
+        )
+        for magnitude, prefix in [
+            (3, peprock.models.MetricPrefix.kilo),
+            (250, peprock.models.MetricPrefix.NONE),
+            (-1500, peprock.models.MetricPrefix.milli),
+            (2, peprock.models.MetricPrefix.mega),
+        ]
+    ]
+
+
+@pytest.mark.parametrize(
+    "function",
+    [
+        lambda a, b, c, d: a + b - c + d,
+        lambda a, b, c, d: -(a - b) + (c - d),
+        lambda a, b, c, d: +a + b * 2 - c / 4 + d,
+        lambda a, b, c, d: (a + b + c + d) * 3 / 2,
+        lambda a, b, c, d: 2 * (a - (b - (c - d))),
+        lambda a, b, c, d: a + b * c / d,
+    ],
+)
+def test_evaluate(measurements, function):
+    expected = function(*measurements)
+    result = function(peprock.models.lazy(measurements[0]), *measurements[1:])
+    assert isinstance(result, peprock.models.Expression)
+    assert result.evaluate() == pytest.approx(expected)
+
+
+def test_evaluate_single(measurements):
+    assert peprock.models.lazy(measurements[0]).evaluate() is measurements[0]
+    assert (-peprock.models.lazy(measurements[1]) * 2).evaluate() == (
+        -measurements[1] * 2
+    )
+    assert (measurements[0] * peprock.models.lazy(measurements[1])).evaluate() == (
+        measurements[0] * measurements[1]
+    )
+    assert (measurements[0] / peprock.models.lazy(measurements[1])).evaluate() == (
+        measurements[0] / measurements[1]
+    )
+
+
+def test_evaluate_sum():
+    measurements = [
+        peprock.models.Measurement(
+            index,
+            peprock.models.MetricPrefix(3 * (index % 3 - 1)),
+            peprock.models.Unit.watt,
+        )
+        for index in range(5000)
+    ]
+    result = sum(measurements[1:], peprock.models.lazy(measurements[0])).evaluate()
+    assert result == sum(measurements[1:], measurements[0])
+    assert result.prefix is peprock.models.MetricPrefix.milli
+    assert type(result.magnitude) is int
+    assert sum(map(peprock.models.lazy, measurements)).evaluate() == result
+
+
+def test_evaluate_other_unit():
+    expression = peprock.models.lazy(
+        peprock.models.Measurement(2, unit=peprock.models.Unit.watt),
+    ) + peprock.models.Measurement(
+        3,
+        peprock.models.MetricPrefix.kilo,
+        peprock.models.Unit.joule / peprock.models.Unit.second,
+    )
+    assert expression.evaluate() == peprock.models.Measurement(
+        3002,
+        unit=peprock.models.Unit.watt,
+    )
+
+
+def test_evaluate_offset():
+    expression = peprock.models.lazy(
+        peprock.models.Measurement(10, unit=peprock.models.Unit.degree_celsius),
+    ) + peprock.models.Measurement(300, unit=peprock.models.Unit.kelvin)
+    with pytest.raises(TypeError, match="convert with an offset"):
+        expression.evaluate()
+
+
+def test_evaluate_offset_measurement_array():
+    np = pytest.importorskip("numpy")
+    expression = peprock.models.lazy(
+        peprock.models.MeasurementArray(
+            np.array([10.0, 20.0]),
+            unit=peprock.models.Unit.degree_celsius,
+        ),
+    ) - peprock.models.Measurement(300, unit=peprock.models.Unit.kelvin)
+    with pytest.raises(TypeError, match="convert with an offset"):
+        expression.evaluate()
+
+
+def test_evaluate_measurement_array():
+    np = pytest.importorskip("numpy")
+    measurement_array = peprock.models.MeasurementArray(
+        np.array([1.0, 2.0, 3.0]),
+        peprock.models.MetricPrefix.kilo,
+        peprock.models.Unit.watt,
+    )
+    measurement = peprock.models.Measurement(500, unit=peprock.models.Unit.watt)
+    result = (
+        (peprock.models.lazy(measurement_array) - measurement) * np.array([1, 2, 3]) / 2
+    ).evaluate()
+    expected = (measurement_array - measurement) * np.array([1, 2, 3]) / 2
+    assert isinstance(result, peprock.models.MeasurementArray)
+    assert result.unit is expected.unit
+    np.testing.assert_allclose(
+        result.convert(expected.prefix).magnitudes,
+        expected.magnitudes,
+    )
+
+    int_measurement_array = peprock.models.MeasurementArray(
+        np.array([1, 2, 3]),
+        unit=peprock.models.Unit.watt,
+    )
+    result = (
+        peprock.models.lazy(int_measurement_array) + int_measurement_array + measurement
+    ).evaluate()
+    assert result.magnitudes.tolist() == [502, 504, 506]
+    result = (
+        peprock.models.lazy(int_measurement_array)
+        + int_measurement_array
+        + peprock.models.Measurement(0.5, unit=peprock.models.Unit.watt)
+    ).evaluate()
+    assert result.magnitudes.tolist() == [2.5, 4.5, 6.5]
+
+
+def test_evaluate_invalid():
+    measurement = peprock.models.Measurement(1, unit=peprock.models.Unit.watt)
+    with pytest.raises(ValueError, match="cannot convert"):
+        (
+            peprock.models.lazy(measurement)
+            + peprock.models.Measurement(1, unit=peprock.models.Unit.second)
+        ).evaluate()
+    with pytest.raises(TypeError, match="unsupported operand type 'str' in sum"):
+        peprock.models.Expression(operator.add, (measurement, "pep")).evaluate()
+    with pytest.raises(TypeError):
+        peprock.models.lazy(measurement) + 1
+    with pytest.raises(TypeError):
+        1 - peprock.models.lazy(measurement)
+    with pytest.raises(TypeError):
+        1 + peprock.models.lazy(measurement)
@@ -0,0 +1,299 @@
+import datetime
+import decimal
+import fractions
+import itertools
+import zoneinfo
+
+import pytest
+
+import peprock.dt
+import peprock.models
+
+_START = datetime.datetime(2024, 3, 1, tzinfo=datetime.timezone.utc)
+_MICROSECOND = datetime.timedelta(microseconds=1)
+
+
+@pytest.fixture(
+    params=[
+        int,
+        float,
+        decimal.Decimal,
+        fractions.Fraction,
+    ],
+)
+def measurements(request):
+    return [
+        peprock.models.Measurement(
+            request.param(magnitude),
+            prefix,
+            peprock.models.Unit.watt,
+        )
+        for magnitude, prefix in [
+            (3, peprock.models.MetricPrefix.kilo),
+            (250, peprock.models.MetricPrefix.NONE),
+            (-1500, peprock.models.MetricPrefix.milli),
+            (2, peprock.models.MetricPrefix.mega),
+        ]
+    ]
+
+
+@pytest.fixture
+def timestamps():
+    return [
+        _START + datetime.timedelta(seconds=seconds)
+        for seconds in (0, 900, 1800, 2700, 3600)
+    ]
+
+
+def _expected(pairs):
+    """Return integral of measurement and duration pairs by eager arithmetic."""
+    second = peprock.models.Measurement(1, unit=peprock.models.Unit.second)
+    return sum(
+        (
+            measurement * (duration // _MICROSECOND) / 1_000_000 * second
+            for measurement, duration in pairs
+        ),
+        peprock.models.Measurement(0, unit=peprock.models.Unit.joule),
+    )
+
+
+def test_integrate_step(measurements, timestamps):
+    result = peprock.models.integrate(measurements, timestamps)
+    assert result.unit is peprock.models.Unit.joule
+    assert result.prefix is peprock.models.MetricPrefix.milli
+    assert type(result.magnitude) is (
+        type(measurements[0].magnitude)
+        if isinstance(measurements[0].magnitude, decimal.Decimal | fractions.Fraction)
+        else float
+    )
+    assert result == pytest.approx(
+        _expected(
+            zip(
+                measurements,
+                (end - start for start, end in itertools.pairwise(timestamps)),
+                strict=True,
+            ),
+        ),
+    )
+
+
+def test_integrate_trapezoid(measurements, timestamps):
+    result = peprock.models.integrate(
+        measurements,
+        timestamps[:-1],
+        rule="trapezoid",
+    )
+    assert result.unit is peprock.models.Unit.joule
+    assert result == pytest.approx(
+        _expected(
+            (
+                (start_measurement + end_measurement) / 2,
+                end - start,
+            )
+            for (start_measurement, end_measurement), (start, end) in zip(
+                itertools.pairwise(measurements),
+                itertools.pairwise(timestamps[:-1]),
+                strict=True,
+            )
+        ),
+    )
+
+
+def test_integrate_constant():
+    power = peprock.models.Measurement(
+        2,
+        peprock.models.MetricPrefix.kilo,
+        peprock.models.Unit.watt,
+    )
+    timestamps = [_START, _START + datetime.timedelta(hours=1)]
+    for result in (
+        peprock.models.integrate([power], timestamps),
+        peprock.models.integrate([power, power], timestamps, rule="trapezoid"),
+        peprock.models.integrate_periods([(peprock.dt.Period(*timestamps), power)]),
+    ):
+        assert result.to_unit(
+            peprock.models.Unit.watt_hour,
+            peprock.models.MetricPrefix.kilo,
+        ) == pytest.approx(
+            peprock.models.Measurement(
+                2,
+                peprock.models.MetricPrefix.kilo,
+                peprock.models.Unit.watt_hour,
+            ),
+        )
+
+    assert peprock.models.integrate(
+        [peprock.models.Measurement(3)],
+        timestamps,
+    ) == peprock.models.Measurement(10800.0, unit=peprock.models.Unit.second)
+
+
+def test_integrate_daylight_saving_time():
+    zone_info = zoneinfo.ZoneInfo("Europe/Paris")
+    timestamps = [
+        datetime.datetime(2024, 3, 31, tzinfo=zone_info),
+        datetime.datetime(2024, 4, 1, tzinfo=zone_info),
+    ]
+    power = peprock.models.Measurement(
+        2,
+        peprock.models.MetricPrefix.kilo,
+        peprock.models.Unit.watt,
+    )
+    assert peprock.models.integrate([power], timestamps).to_unit(
+        peprock.models.Unit.watt_hour,
+        peprock.models.MetricPrefix.kilo,
+    ) == pytest.approx(
+        peprock.models.Measurement(
+            46,
+            peprock.models.MetricPrefix.kilo,
+            peprock.models.Unit.watt_hour,
+        ),
+    )
+
+
+def test_integrate_periods(measurements):
+    periods = [
+        peprock.dt.Period(_START, _START + datetime.timedelta(minutes=15)),
+        peprock.dt.Period(_START, _START + datetime.timedelta(hours=2)),
+        peprock.dt.Period(_START, _START),
+        peprock.dt.Period(
+            _START + datetime.timedelta(days=1),
+            _START + datetime.timedelta(days=1, microseconds=1),
+        ),
+    ]
+    result = peprock.models.integrate_periods(
+        zip(periods, measurements, strict=True),
+    )
+    assert result.unit is peprock.models.Unit.joule
+    assert result == pytest.approx(
+        _expected(
+            (measurement, period.duration)
+            for period, measurement in zip(periods, measurements, strict=True)
+        ),
+    )
+
+
+def test_integrate_measurement_array(measurements, timestamps):
+    np = pytest.importorskip("numpy")
+    measurement_array = peprock.models.MeasurementArray.from_measurements(
+        measurement.replace(magnitude=float(measurement.magnitude))
+        for measurement in measurements
+    )
+    for arguments, expected in [
+        (
+            (measurement_array, timestamps),
+            peprock.models.integrate(measurements, timestamps),
+        ),
+        (
+            (
+                measurement_array,
+                np.array(
+                    [timestamp.replace(tzinfo=None) for timestamp in timestamps[:-1]],
+                    dtype="datetime64[us]",
+                ),
+            ),
+            peprock.models.integrate(
+                measurements,
+                timestamps[:-1],
+                rule="trapezoid",
+            ),
+        ),
+    ]:
+        result = peprock.models.integrate(
+            *arguments,
+            rule="step" if len(arguments[1]) > len(measurements) else "trapezoid",
+        )
+        assert type(result.magnitude) is float
+        assert result.unit is peprock.models.Unit.joule
+        assert result == pytest.approx(expected)
+
+
+def test_integrate_object_array(measurements, timestamps):
+    np = pytest.importorskip("numpy")
+    measurement_array = peprock.models.MeasurementArray.from_measurements(
+        measurements,
+    )
+    for rule, timestamps_ in [("step", timestamps), ("trapezoid", timestamps[:-1])]:
+        expected = peprock.models.integrate(measurements, timestamps_, rule=rule)
+        result = peprock.models.integrate(
+            peprock.models.MeasurementArray(
+                measurement_array.magnitudes.astype(object),
+                measurement_array.prefix,
+                measurement_array.unit,
+            ),
+            np.array(
+                [timestamp.replace(tzinfo=None) for timestamp in timestamps_],
+                dtype="datetime64[us]",
+            ),
+            rule=rule,
+        )
+        if measurement_array.magnitudes.dtype == object:
+            assert type(result.magnitude) is type(expected.magnitude)
+            assert result.magnitude == expected.magnitude
+        assert result == pytest.approx(expected)
+
+
+def test_integrate_unit(measurements, timestamps):
+    expected = peprock.models.integrate(measurements, timestamps)
+    for result in (
+        peprock.models.integrate(
+            measurements,
+            timestamps,
+            unit=peprock.models.Unit.watt_hour,
+        ),
+        peprock.models.integrate_periods(
+            zip(
+                itertools.starmap(peprock.dt.Period, itertools.pairwise(timestamps)),
+                measurements,
+                strict=True,
+            ),
+            unit=peprock.models.Unit.watt_hour,
+        ),
+    ):
+        assert result.unit is peprock.models.Unit.watt_hour
+        assert result.prefix is expected.prefix
+        assert result.to_unit(
+            peprock.models.Unit.joule,
+            expected.prefix,
+        ).magnitude == pytest.approx(expected.magnitude)
+
+
+def test_integrate_missing(timestamps):
+    pytest.importorskip("pandas")
+    np = pytest.importorskip("numpy")
+    extension_array = peprock.models.MeasurementExtensionArray(
+        np.array([1.0, 2.0, 3.0, 4.0]),
+        np.array([False, True, False, False]),
+        unit=peprock.models.Unit.watt,
+    )
+    with pytest.raises(ValueError, match="expected no missing measurements, got 1"):
+        peprock.models.integrate(extension_array, timestamps)
+
+
+def test_integrate_invalid(measurements, timestamps):
+    with pytest.raises(ValueError, match="expected rule 'step' or 'trapezoid'"):
+        peprock.models.integrate(measurements, timestamps, rule="midpoint")
+    with pytest.raises(ValueError, match="expected at least two timestamps"):
+        peprock.models.integrate([], timestamps[:1])
+    with pytest.raises(ValueError, match="expected non-decreasing timestamps"):
+        peprock.models.integrate(measurements, timestamps[::-1])
+    with pytest.raises(ValueError, match="expected 4 measurements for 5 timestamps"):
+        peprock.models.integrate(measurements[:3], timestamps)
+    with pytest.raises(ValueError, match="by the trapezoid rule, got 4"):
+        peprock.models.integrate(measurements, timestamps, rule="trapezoid")
+    with pytest.raises(ValueError, match="expected measurements sharing a unit"):
+        peprock.models.integrate(
+            [measurements[0], peprock.models.Measurement(1)],
+            timestamps[:3],
+        )
+    with pytest.raises(ValueError, match="expected period of non-negative duration"):
+        peprock.models.integrate_periods(
+            [(peprock.dt.Period(timestamps[1], timestamps[0]), measurements[0])],
+        )
+    with pytest.raises(ValueError, match="expected at least one measurement"):
+        peprock.models.integrate_periods([])
+    with pytest.raises(TypeError):
+        peprock.models.integrate(
+            [peprock.models.Measurement(1, unit="pep")],
+            timestamps[:2],
+        )
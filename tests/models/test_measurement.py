@@ -3,6 +3,10 @@
 import dataclasses
 import decimal
 import fractions
+import math
+import operator
+import pickle
+import random
 import sys
 
 import pytest
@@ -152,6 +156,21 @@ def test_str(measurement):
     assert str(measurement) == format(measurement)
 
 
+def test_format_many(measurement, measurement_plus_one):
+    measurements = [
+        measurement,
+        measurement_plus_one,
+        peprock.models.Measurement(1.5, unit=peprock.models.Unit.watt),
+        measurement,
+    ]
+    assert peprock.models.Measurement.format_many(iter(measurements)) == [
+        str(measurement_) for measurement_ in measurements
+    ]
+    assert peprock.models.Measurement.format_many(measurements[2:3], ".2f") == [
+        "1.50 W",
+    ]
+
+
 @pytest.mark.parametrize(
     "changes",
     [
@@ -176,6 +195,293 @@ def test_replace(measurement, changes):
     assert measurement.replace(**changes) == dataclasses.replace(measurement, **changes)
 
 
+@pytest.mark.parametrize(
+    "prefix_",
+    [
+        None,
+        peprock.models.MetricPrefix.giga,
+    ],
+)
+def test_derive(measurement, prefix_):
+    derived = measurement._derive(100, prefix_)
+    assert type(derived) is type(measurement)
+    assert derived == measurement.replace(
+        magnitude=100,
+        prefix=measurement.prefix if prefix_ is None else prefix_,
+    )
+
+
+def test_derive_subclass():
+    @dataclasses.dataclass(frozen=True)
+    class Subclass(peprock.models.Measurement):
+        source: str = ""
+
+        def __post_init__(self):
+            object.__setattr__(self, "source", self.source.upper())
+
+    derived = Subclass(1, source="meter")._derive(2)
+    assert type(derived) is Subclass
+    assert derived.magnitude == 2  # noqa: PLR2004
+    assert derived.source == "METER"
+
+
+def test_slots(measurement):
+    assert not hasattr(measurement, "__dict__")
+    assert pickle.loads(pickle.dumps(measurement)) == measurement  # noqa: S301
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        measurement.magnitude = 1
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        del measurement.unit
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        measurement.other = 1
+
+
+def test_generic_alias():
+    measurement = peprock.models.Measurement[int](1)
+    assert measurement == peprock.models.Measurement(1)
+    assert not hasattr(measurement, "__orig_class__")
+
+
+@pytest.mark.parametrize("engineering", [True, False])
+def test_normalize(measurement, engineering):
+    normalized = measurement.normalize(engineering=engineering)
+    assert type(normalized) is type(measurement)
+    assert normalized.unit == measurement.unit
+    if not measurement.magnitude:
+        assert normalized is measurement
+        return
+
+    assert float(normalized) == pytest.approx(float(measurement))
+    assert 1 <= abs(normalized.magnitude) < 1000  # noqa: PLR2004
+    if engineering:
+        assert normalized.prefix % 3 == 0
+
+
+@pytest.mark.parametrize(
+    ("measurement", "engineering", "expected"),
+    [
+        (
+            peprock.models.Measurement(12345),
+            True,
+            peprock.models.Measurement(
+                fractions.Fraction(12345, 1000),
+                peprock.models.MetricPrefix.kilo,
+            ),
+        ),
+        (
+            peprock.models.Measurement(999, peprock.models.MetricPrefix.milli),
+            True,
+            peprock.models.Measurement(999, peprock.models.MetricPrefix.milli),
+        ),
+        (
+            peprock.models.Measurement(
+                decimal.Decimal("0.0500"),
+                unit=peprock.models.Unit.metre,
+            ),
+            False,
+            peprock.models.Measurement(
+                decimal.Decimal("5.00"),
+                peprock.models.MetricPrefix.centi,
+                peprock.models.Unit.metre,
+            ),
+        ),
+        (
+            peprock.models.Measurement(fractions.Fraction(-1, 1000)),
+            True,
+            peprock.models.Measurement(
+                fractions.Fraction(-1),
+                peprock.models.MetricPrefix.milli,
+            ),
+        ),
+        (
+            peprock.models.Measurement(fractions.Fraction(999, 1000)),
+            True,
+            peprock.models.Measurement(
+                fractions.Fraction(999),
+                peprock.models.MetricPrefix.milli,
+            ),
+        ),
+        (
+            peprock.models.Measurement(3000),
+            True,
+            peprock.models.Measurement(3, peprock.models.MetricPrefix.kilo),
+        ),
+        (
+            peprock.models.Measurement(10**30),
+            True,
+            peprock.models.Measurement(1, peprock.models.MetricPrefix.quetta),
+        ),
+        (
+            peprock.models.Measurement(1000.0),
+            True,
+            peprock.models.Measurement(1.0, peprock.models.MetricPrefix.kilo),
+        ),
+        (
+            peprock.models.Measurement(999.9999999999999),
+            True,
+            peprock.models.Measurement(999.9999999999999),
+        ),
+        (
+            peprock.models.Measurement(1e-12),
+            True,
+            peprock.models.Measurement(1.0, peprock.models.MetricPrefix.pico),
+        ),
+        (
+            peprock.models.Measurement(2e-40),
+            True,
+            peprock.models.Measurement(2e-10, peprock.models.MetricPrefix.quecto),
+        ),
+        (
+            peprock.models.Measurement(float("-inf")),
+            True,
+            peprock.models.Measurement(float("-inf")),
+        ),
+    ],
+    ids=str,
+)
+def test_normalize_examples(measurement, engineering, expected):
+    normalized = measurement.normalize(engineering=engineering)
+    assert normalized.prefix is expected.prefix
+    assert normalized.magnitude == pytest.approx(expected.magnitude)
+    assert type(normalized.magnitude) is type(expected.magnitude)
+
+
+@pytest.mark.parametrize("exponent", range(-27, 28))
+@pytest.mark.parametrize(
+    "prefix",
+    [
+        peprock.models.MetricPrefix.NONE,
+        peprock.models.MetricPrefix.centi,
+        peprock.models.MetricPrefix.kilo,
+    ],
+)
+def test_normalize_powers_of_ten(exponent, prefix):
+    power = float(f"1e{exponent}")
+    for magnitude in (
+        power,
+        math.nextafter(power, 0),
+        math.nextafter(power, math.inf),
+        -power,
+    ):
+        normalized = peprock.models.Measurement(magnitude, prefix).normalize()
+        assert 1 <= abs(normalized.magnitude) < 1000  # noqa: PLR2004
+        assert normalized.prefix % 3 == 0
+
+
+def test_parse(measurement):
+    parsed = peprock.models.Measurement.parse(
+        str(measurement),
+        number_type=type(measurement.magnitude),
+    )
+    assert type(parsed.magnitude) is type(measurement.magnitude)
+    assert parsed.magnitude == measurement.magnitude
+    if isinstance(measurement.unit, str):
+        assert parsed.prefix is peprock.models.MetricPrefix.NONE
+        assert parsed.unit == f"{measurement.prefix.symbol}{measurement.unit}"
+    elif str(measurement).endswith(" m"):
+        # ambiguous suffix resolves to metre rather than milli
+        assert parsed.prefix is peprock.models.MetricPrefix.NONE
+        assert parsed.unit is peprock.models.Unit.metre
+    else:
+        assert parsed.prefix is measurement.prefix
+        assert parsed.unit is (
+            None if measurement.unit is peprock.models.Unit.one else measurement.unit
+        )
+
+
+@pytest.mark.parametrize(
+    ("string", "expected"),
+    [
+        ("12", peprock.models.Measurement(12)),
+        ("-12 W", peprock.models.Measurement(-12, unit=peprock.models.Unit.watt)),
+        (
+            " 24.6 MW ",
+            peprock.models.Measurement(
+                24.6,
+                peprock.models.MetricPrefix.mega,
+                peprock.models.Unit.watt,
+            ),
+        ),
+        (
+            "3/250 kJ",
+            peprock.models.Measurement(
+                fractions.Fraction(3, 250),
+                peprock.models.MetricPrefix.kilo,
+                peprock.models.Unit.joule,
+            ),
+        ),
+        ("1e-05 m", peprock.models.Measurement(1e-05, unit=peprock.models.Unit.metre)),
+        (
+            "5 mm",
+            peprock.models.Measurement(
+                5,
+                peprock.models.MetricPrefix.milli,
+                peprock.models.Unit.metre,
+            ),
+        ),
+        ("5 T", peprock.models.Measurement(5, unit=peprock.models.Unit.tesla)),
+        ("5 da", peprock.models.Measurement(5, peprock.models.MetricPrefix.deca)),
+        (
+            "5 dam",
+            peprock.models.Measurement(
+                5,
+                peprock.models.MetricPrefix.deca,
+                peprock.models.Unit.metre,
+            ),
+        ),
+        (
+            "5 µs",
+            peprock.models.Measurement(
+                5,
+                peprock.models.MetricPrefix.micro,
+                peprock.models.Unit.second,
+            ),
+        ),
+        ("5 kpep", peprock.models.Measurement(5, unit="kpep")),
+    ],
+    ids=str,
+)
+def test_parse_examples(string, expected):
+    parsed = peprock.models.Measurement.parse(string)
+    assert type(parsed.magnitude) is type(expected.magnitude)
+    assert parsed == expected
+    assert parsed.prefix is expected.prefix
+
+
+@pytest.mark.parametrize(
+    ("string", "number_type"),
+    [
+        ("", None),
+        ("W", None),
+        ("1.5 W", int),
+        ("1/0 W", None),
+        ("1/2 W", decimal.Decimal),
+        ("1  W", None),
+    ],
+)
+def test_parse_invalid(string, number_type):
+    with pytest.raises(ValueError, match="invalid measurement"):
+        peprock.models.Measurement.parse(string, number_type=number_type)
+
+
+def test_parse_many():
+    strings = ["1.5 kW", "2 W", "0.25 MW"]
+    assert peprock.models.Measurement.parse_many(strings) == [
+        peprock.models.Measurement.parse(string) for string in strings
+    ]
+    assert peprock.models.Measurement.parse_many(
+        strings,
+        number_type=decimal.Decimal,
+    ) == [
+        peprock.models.Measurement(
+            decimal.Decimal(string.split()[0]),
+            peprock.models.MetricPrefix.from_symbol(string.split()[1][:-1]),
+            peprock.models.Unit.watt,
+        )
+        for string in strings
+    ]
+
+
 def test_lt(
     magnitude,
     measurement,
@@ -438,6 +744,125 @@ def test_hash(
     assert hash(measurement) == hash(measurement_copy)
 
 
+@pytest.mark.parametrize(
+    "magnitude",
+    [
+        0,
+        1,
+        -1,
+        -2,
+        12345,
+        -(2**80),
+        fractions.Fraction(-7, 3),
+        decimal.Decimal(-2),
+    ],
+    ids=repr,
+)
+@pytest.mark.parametrize(
+    "prefix",
+    [
+        peprock.models.MetricPrefix.quetta,
+        peprock.models.MetricPrefix.kilo,
+        peprock.models.MetricPrefix.milli,
+        peprock.models.MetricPrefix.quecto,
+    ],
+)
+def test_hash_prefix(magnitude, prefix):
+    measurement = peprock.models.Measurement(
+        magnitude,
+        prefix,
+        peprock.models.Unit.watt,
+    )
+    converted = peprock.models.Measurement(
+        prefix.convert(magnitude),
+        unit=peprock.models.Unit.watt,
+    )
+    assert measurement == converted
+    assert hash(measurement) == hash(converted)
+
+
+@pytest.mark.parametrize(
+    ("measurement", "other"),
+    [
+        (
+            peprock.models.Measurement(5, peprock.models.MetricPrefix.milli),
+            peprock.models.Measurement(0.005),
+        ),
+        (
+            peprock.models.Measurement(5, peprock.models.MetricPrefix.milli),
+            peprock.models.Measurement(5.0, peprock.models.MetricPrefix.milli),
+        ),
+        (
+            peprock.models.Measurement(7, peprock.models.MetricPrefix.milli),
+            peprock.models.Measurement(0.007, peprock.models.MetricPrefix.NONE),
+        ),
+        (
+            peprock.models.Measurement(0.007, peprock.models.MetricPrefix.kilo),
+            peprock.models.Measurement(7),
+        ),
+        (
+            peprock.models.Measurement(fractions.Fraction(1, 2)),
+            peprock.models.Measurement(500.0, peprock.models.MetricPrefix.milli),
+        ),
+        (
+            peprock.models.Measurement(decimal.Decimal("0.005")),
+            peprock.models.Measurement(5, peprock.models.MetricPrefix.milli),
+        ),
+        (
+            peprock.models.Measurement(1, peprock.models.MetricPrefix.quetta),
+            peprock.models.Measurement(10**30),
+        ),
+        (
+            peprock.models.Measurement(2**60 + 1, peprock.models.MetricPrefix.kilo),
+            peprock.models.Measurement((2**60 + 1) * 1000),
+        ),
+    ],
+    ids=repr,
+)
+def test_hash_mixed_magnitude_types(measurement, other):
+    assert measurement == other
+    assert hash(measurement) == hash(other)
+    assert len({measurement, other}) == 1
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_hash_equal_across_prefixes(seed):
+    random_ = random.Random(seed)  # noqa: S311
+    prefixes = list(peprock.models.MetricPrefix)
+    equal = 0
+    for _ in range(1000):
+        magnitude = random_.uniform(-1e6, 1e6)
+        prefix = random_.choice(prefixes)
+        other_prefix = random_.choice(prefixes)
+        measurement = peprock.models.Measurement(magnitude, prefix)
+        for other_magnitude in (
+            prefix.convert(magnitude, to=other_prefix),
+            float(
+                fractions.Fraction(magnitude)
+                * prefix.to(other_prefix, number_type=fractions.Fraction),
+            ),
+        ):
+            other = peprock.models.Measurement(other_magnitude, other_prefix)
+            if measurement == other:
+                equal += 1
+                assert hash(measurement) == hash(other)
+                assert (measurement != other) is False
+
+    assert equal
+
+
+def test_hash_equal_across_prefixes_rounding():
+    measurement = peprock.models.Measurement(
+        901427.556184026,
+        peprock.models.MetricPrefix.milli,
+    )
+    other = peprock.models.Measurement(901.4275561840259)
+    assert (measurement == other) is (hash(measurement) == hash(other))
+    assert measurement == peprock.models.Measurement(
+        float(fractions.Fraction(measurement.magnitude) / 1000),
+    )
+
+
 def test_abs(measurement):
     measurement_abs = abs(measurement)
     assert measurement_abs.magnitude == abs(measurement.magnitude)
@@ -718,8 +1143,17 @@ def test_mul(measurement):
         assert other * measurement == expected
 
     # combine measurement with self
-    with pytest.raises(TypeError):
-        measurement * measurement
+    if isinstance(measurement.unit, str):
+        with pytest.raises(TypeError):
+            measurement * measurement
+    elif measurement.unit in {None, peprock.models.Unit.one}:
+        assert float(measurement * measurement) == pytest.approx(
+            float(measurement) ** 2,
+        )
+    else:
+        product = measurement * measurement
+        assert product.unit is measurement.unit**2
+        assert float(product) == pytest.approx(float(measurement) ** 2)
 
 
 def test_neg(measurement):
@@ -785,7 +1219,6 @@ def test_truediv(
     measurement,
     measurement_plus_one,
     measurement_prefix_shift,
-    measurement_other_unit,
 ):
     # combine measurement with str
     with pytest.raises(TypeError):
@@ -875,11 +1308,340 @@ def test_truediv(
         with pytest.raises((ZeroDivisionError, decimal.InvalidOperation)):
             measurement_prefix_shift / measurement
 
-    # combine measurement with measurement_other_unit
-    with pytest.raises(TypeError):
-        measurement / measurement_other_unit
-    with pytest.raises(TypeError):
-        measurement_other_unit / measurement
+
+def test_truediv_other_unit(measurement, measurement_other_unit):
+    if isinstance(measurement.unit, str):
+        with pytest.raises(TypeError):
+            measurement / measurement_other_unit
+        with pytest.raises(TypeError):
+            measurement_other_unit / measurement
+    elif measurement.magnitude:
+        unit = measurement.unit or peprock.models.Unit.one
+        quotient = measurement / measurement_other_unit
+        assert quotient.unit is unit / peprock.models.Unit.candela
+        assert float(quotient) == pytest.approx(1)
+        quotient = measurement_other_unit / measurement
+        assert quotient.unit is peprock.models.Unit.candela / unit
+        assert float(quotient) == pytest.approx(1)
+    else:
+        with pytest.raises((ZeroDivisionError, decimal.InvalidOperation)):
+            measurement / measurement_other_unit
+
+
+@pytest.mark.parametrize(
+    ("result", "expected"),
+    [
+        (
+            peprock.models.Measurement(2, unit=peprock.models.Unit.watt)
+            * peprock.models.Measurement(
+                3,
+                peprock.models.MetricPrefix.kilo,
+                peprock.models.Unit.second,
+            ),
+            peprock.models.Measurement(
+                6,
+                peprock.models.MetricPrefix.kilo,
+                peprock.models.Unit.joule,
+            ),
+        ),
+        (
+            peprock.models.Measurement(
+                decimal.Decimal("1.5"),
+                peprock.models.MetricPrefix.mega,
+                peprock.models.Unit.joule,
+            )
+            / peprock.models.Measurement(
+                decimal.Decimal(3),
+                peprock.models.MetricPrefix.milli,
+                peprock.models.Unit.second,
+            ),
+            peprock.models.Measurement(
+                decimal.Decimal("0.5"),
+                peprock.models.MetricPrefix.giga,
+                peprock.models.Unit.watt,
+            ),
+        ),
+        (
+            peprock.models.Measurement(
+                4,
+                peprock.models.MetricPrefix.kilo,
+                peprock.models.Unit.gram,
+            )
+            * peprock.models.Measurement(
+                2,
+                unit=peprock.models.Unit.metre / peprock.models.Unit.second**2,
+            ),
+            peprock.models.Measurement(8, unit=peprock.models.Unit.newton),
+        ),
+        (
+            peprock.models.Measurement(3, unit=peprock.models.Unit.gram)
+            * peprock.models.Measurement(
+                5,
+                peprock.models.MetricPrefix.deca,
+                peprock.models.Unit.metre,
+            ),
+            peprock.models.Measurement(
+                15,
+                peprock.models.MetricPrefix.deca,
+                peprock.models.Unit.gram * peprock.models.Unit.metre,
+            ),
+        ),
+        (
+            peprock.models.Measurement(
+                3,
+                peprock.models.MetricPrefix.deca,
+                peprock.models.Unit.watt,
+            )
+            * peprock.models.Measurement(
+                5,
+                peprock.models.MetricPrefix.kilo,
+                peprock.models.Unit.second,
+            ),
+            peprock.models.Measurement(
+                150,
+                peprock.models.MetricPrefix.kilo,
+                peprock.models.Unit.joule,
+            ),
+        ),
+        (
+            peprock.models.Measurement(
+                6,
+                peprock.models.MetricPrefix.kilo,
+                peprock.models.Unit.joule,
+            )
+            / peprock.models.Measurement(
+                2,
+                unit=peprock.models.Unit.watt * peprock.models.Unit.second,
+            ),
+            3000.0,
+        ),
+        (
+            peprock.models.Measurement(
+                1,
+                peprock.models.MetricPrefix.milli,
+                peprock.models.Unit.metre,
+            )
+            / peprock.models.Measurement(4, unit=peprock.models.Unit.metre),
+            0.00025,
+        ),
+        (
+            peprock.models.Measurement(
+                2,
+                peprock.models.MetricPrefix.kilo,
+                peprock.models.Unit.watt,
+            )
+            * peprock.models.Measurement(3, unit=peprock.models.Unit.hour),
+            peprock.models.Measurement(
+                6,
+                peprock.models.MetricPrefix.kilo,
+                peprock.models.Unit.watt_hour,
+            ),
+        ),
+    ],
+    ids=str,
+)
+def test_unit_algebra(result, expected):
+    assert type(result) is type(expected)
+    assert result == expected
+    if isinstance(result, peprock.models.Measurement):
+        assert result.prefix is expected.prefix
+        assert type(result.magnitude) is type(expected.magnitude)
+
+
+def test_other_unit_conversion():
+    kilowatt_hour = peprock.models.Measurement(
+        2,
+        peprock.models.MetricPrefix.kilo,
+        peprock.models.Unit.watt_hour,
+    )
+    megajoule = peprock.models.Measurement(
+        decimal.Decimal("7.2"),
+        peprock.models.MetricPrefix.mega,
+        peprock.models.Unit.joule,
+    )
+    assert kilowatt_hour + peprock.models.Measurement(
+        3600,
+        peprock.models.MetricPrefix.kilo,
+        peprock.models.Unit.joule,
+    ) == peprock.models.Measurement(
+        3,
+        peprock.models.MetricPrefix.kilo,
+        peprock.models.Unit.watt_hour,
+    )
+    assert megajoule - kilowatt_hour == peprock.models.Measurement(
+        decimal.Decimal(0),
+        peprock.models.MetricPrefix.mega,
+        peprock.models.Unit.joule,
+    )
+    assert megajoule / kilowatt_hour == 1
+    assert kilowatt_hour <= megajoule
+    assert kilowatt_hour >= megajoule
+    assert not kilowatt_hour < megajoule
+
+    # equality converts like ordering, consistent with hash
+    assert kilowatt_hour == megajoule
+    assert not kilowatt_hour != megajoule
+    assert hash(kilowatt_hour) == hash(megajoule)
+    assert kilowatt_hour != megajoule + peprock.models.Measurement(
+        1,
+        unit=peprock.models.Unit.joule,
+    )
+    assert peprock.models.Measurement(
+        1,
+        unit=peprock.models.Unit.hertz,
+    ) != peprock.models.Measurement(1, unit=peprock.models.Unit.becquerel)
+
+    celsius = peprock.models.Measurement(
+        fractions.Fraction(2315, 100),
+        unit=peprock.models.Unit.degree_celsius,
+    )
+    kelvin = peprock.models.Measurement(
+        fractions.Fraction(2963, 10),
+        unit=peprock.models.Unit.kelvin,
+    )
+    assert kelvin - celsius.to_unit(
+        peprock.models.Unit.kelvin,
+    ) == peprock.models.Measurement(
+        fractions.Fraction(0),
+        unit=peprock.models.Unit.kelvin,
+    )
+    assert celsius < kelvin + peprock.models.Measurement(
+        1,
+        peprock.models.MetricPrefix.milli,
+        peprock.models.Unit.kelvin,
+    )
+    assert celsius == kelvin
+    assert hash(celsius) == hash(kelvin)
+
+    # temperatures and temperature differences are ambiguous across the offset
+    for operation in (operator.add, operator.sub, operator.mod):
+        with pytest.raises(TypeError):
+            operation(celsius, kelvin)
+        with pytest.raises(TypeError):
+            operation(kelvin, celsius)
+
+
+def test_hour_and_hecto_round_trip():
+    for measurement in (
+        peprock.models.Measurement(5, peprock.models.MetricPrefix.hecto),
+        peprock.models.Measurement(5, unit=peprock.models.Unit.hour),
+        peprock.models.Measurement(
+            5,
+            peprock.models.MetricPrefix.kilo,
+            peprock.models.Unit.watt_hour,
+        ),
+    ):
+        assert peprock.models.Measurement.parse(str(measurement)) == measurement
+        assert (
+            peprock.models.Measurement.parse(str(measurement)).unit is measurement.unit
+        )
+
+
+def test_decimal_context():
+    magnitude = decimal.Decimal("1.2345")
+    kilowatt = peprock.models.Measurement(
+        magnitude,
+        peprock.models.MetricPrefix.kilo,
+        peprock.models.Unit.watt,
+    )
+    watt = peprock.models.Measurement(magnitude, unit=peprock.models.Unit.watt)
+    second = peprock.models.Measurement(magnitude, unit=peprock.models.Unit.second)
+    context = decimal.Context(prec=3, rounding=decimal.ROUND_DOWN)
+
+    with (
+        peprock.models.decimal_context(context, rounding=decimal.ROUND_UP) as copy,
+        decimal.localcontext(decimal.Context(prec=50)),
+    ):
+        assert copy is not context
+        assert copy.prec == 3  # noqa: PLR2004
+        assert copy.rounding == decimal.ROUND_UP
+        assert (kilowatt + watt).magnitude == decimal.Decimal("1.25E+3")
+        assert (watt - kilowatt).magnitude == decimal.Decimal("-1.24E+3")
+        assert (kilowatt * 3).magnitude == decimal.Decimal("3.71")
+        assert (kilowatt / 3).magnitude == decimal.Decimal("0.412")
+        assert (kilowatt // decimal.Decimal("0.1")).magnitude == 12  # noqa: PLR2004
+        assert (
+            kilowatt % dataclasses.replace(kilowatt, magnitude=decimal.Decimal("0.5"))
+        ).magnitude == decimal.Decimal("0.235")
+        assert kilowatt / watt == decimal.Decimal("1.01E+3")
+        assert (-kilowatt).magnitude == decimal.Decimal("-1.24")
+        assert (+kilowatt).magnitude == decimal.Decimal("1.24")
+        assert abs(-kilowatt).magnitude == decimal.Decimal("1.24")
+        assert (kilowatt * second).magnitude == decimal.Decimal("1.53")
+        assert (
+            watt
+            + peprock.models.Measurement(
+                magnitude,
+                unit=peprock.models.Unit.joule / peprock.models.Unit.second,
+            )
+        ).magnitude == decimal.Decimal("2.47")
+        assert (watt * second / second).magnitude == decimal.Decimal("1.24")
+        assert type((peprock.models.Measurement(1) * 2).magnitude) is int
+
+        with peprock.models.decimal_context(prec=5):
+            assert (kilowatt * 3).magnitude == decimal.Decimal("3.7035")
+
+        assert (kilowatt * 3).magnitude == decimal.Decimal("3.71")
+
+    assert (kilowatt * 3).magnitude == decimal.Decimal("3.7035")
+    assert context.prec == 3  # noqa: PLR2004
+    assert context.rounding == decimal.ROUND_DOWN
+
+    with (
+        peprock.models.decimal_context(),
+        pytest.raises(decimal.DivisionByZero),
+    ):
+        _ = kilowatt / 0
+
+
+@pytest.mark.parametrize(
+    ("measurement", "unit", "prefix", "expected"),
+    [
+        (
+            peprock.models.Measurement(
+                1,
+                peprock.models.MetricPrefix.kilo,
+                peprock.models.Unit.watt_hour,
+            ),
+            peprock.models.Unit.joule,
+            peprock.models.MetricPrefix.mega,
+            peprock.models.Measurement(
+                fractions.Fraction(18, 5),
+                peprock.models.MetricPrefix.mega,
+                peprock.models.Unit.joule,
+            ),
+        ),
+        (
+            peprock.models.Measurement(
+                25.0,
+                unit=peprock.models.Unit.degree_celsius,
+            ),
+            peprock.models.Unit.kelvin,
+            peprock.models.MetricPrefix.NONE,
+            peprock.models.Measurement(298.15, unit=peprock.models.Unit.kelvin),
+        ),
+        (
+            peprock.models.Measurement(
+                1.5,
+                peprock.models.MetricPrefix.kilo,
+                peprock.models.Unit.metre,
+            ),
+            peprock.models.Unit.metre,
+            peprock.models.MetricPrefix.NONE,
+            peprock.models.Measurement(1500.0, unit=peprock.models.Unit.metre),
+        ),
+    ],
+    ids=str,
+)
+def test_to_unit(measurement, unit, prefix, expected):
+    converted = measurement.to_unit(unit, prefix)
+    assert converted == expected
+    assert type(converted.magnitude) is type(expected.magnitude)
+
+
+def test_to_unit_invalid(measurement):
+    with pytest.raises(ValueError, match="cannot convert"):
+        measurement.to_unit(peprock.models.Unit.candela)
 
 
 def test_bool(measurement):
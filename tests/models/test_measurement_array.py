@@ -0,0 +1,366 @@
+import decimal
+import fractions
+import operator
+
+import numpy as np
+import pytest
+
+import peprock.models
+
+
+@pytest.fixture(
+    scope="session",
+    params=[
+        [0, 12, -34567],
+        [0.0, 12.5, -34567.89012],
+    ],
+    ids=["int", "float"],
+)
+def magnitudes(request):
+    return request.param
+
+
+@pytest.fixture(
+    scope="session",
+    params=[
+        peprock.models.MetricPrefix.NONE,
+        peprock.models.MetricPrefix.mega,
+        peprock.models.MetricPrefix.milli,
+    ],
+)
+def prefix(request):
+    return request.param
+
+
+@pytest.fixture(
+    scope="session",
+    params=[
+        None,
+        peprock.models.Unit.watt,
+        "pep",
+    ],
+)
+def unit(request):
+    return request.param
+
+
+@pytest.fixture(scope="session")
+def measurement_array(magnitudes, prefix, unit):
+    return peprock.models.MeasurementArray(magnitudes, prefix, unit)
+
+
+@pytest.fixture(scope="session")
+def measurements(magnitudes, prefix, unit):
+    return [
+        peprock.models.Measurement(magnitude, prefix, unit) for magnitude in magnitudes
+    ]
+
+
+@pytest.fixture(scope="session")
+def measurement_array_prefix_shift(measurement_array):
+    return peprock.models.MeasurementArray(
+        measurement_array.magnitudes[::-1] + 1,
+        peprock.models.MetricPrefix(measurement_array.prefix + 3),
+        measurement_array.unit,
+    )
+
+
+def test_init():
+    array = peprock.models.MeasurementArray([1, 2, 3])
+    assert isinstance(array.magnitudes, np.ndarray)
+    assert array.magnitudes.flags.c_contiguous
+    assert array.prefix is peprock.models.MetricPrefix.NONE
+    assert array.unit is None
+
+    with pytest.raises(ValueError, match="expected one-dimensional magnitudes"):
+        peprock.models.MeasurementArray([[1, 2], [3, 4]])
+
+
+def test_sequence(measurement_array, measurements):
+    assert len(measurement_array) == len(measurements)
+    assert list(measurement_array) == measurements
+    assert [type(m.magnitude) for m in measurement_array] == [
+        type(m.magnitude) for m in measurements
+    ]
+    assert measurement_array[1] == measurements[1]
+    assert list(measurement_array[1:]) == measurements[1:]
+
+
+def test_from_measurements(measurements, measurement_array_prefix_shift):
+    shifted = list(measurement_array_prefix_shift)
+    array = peprock.models.MeasurementArray.from_measurements(measurements + shifted)
+    assert array.prefix is measurements[0].prefix
+    assert list(array) == [
+        *measurements,
+        *(
+            m.replace(magnitude=m.magnitude * 1000, prefix=array.prefix)
+            for m in shifted
+        ),
+    ]
+
+    empty = peprock.models.MeasurementArray.from_measurements([])
+    assert len(empty) == 0
+    assert empty.prefix is peprock.models.MetricPrefix.NONE
+    assert empty.unit is None
+    empty = peprock.models.MeasurementArray.from_measurements(
+        iter(()),
+        prefix=peprock.models.MetricPrefix.kilo,
+        unit=peprock.models.Unit.watt,
+    )
+    assert len(empty) == 0
+    assert empty.prefix is peprock.models.MetricPrefix.kilo
+    assert empty.unit is peprock.models.Unit.watt
+
+    converted = peprock.models.MeasurementArray.from_measurements(
+        measurements,
+        prefix=peprock.models.MetricPrefix.kilo,
+        unit=measurements[0].unit,
+    )
+    assert converted.prefix is peprock.models.MetricPrefix.kilo
+    assert list(converted.magnitudes) == pytest.approx(
+        [
+            float(measurement.prefix.convert(measurement.magnitude, converted.prefix))
+            for measurement in measurements
+        ],
+    )
+
+    with pytest.raises(ValueError, match="expected measurements sharing a unit"):
+        peprock.models.MeasurementArray.from_measurements(
+            [
+                peprock.models.Measurement(1, unit=peprock.models.Unit.watt),
+                peprock.models.Measurement(1, unit=peprock.models.Unit.joule),
+            ],
+        )
+    with pytest.raises(ValueError, match="expected measurements sharing a unit"):
+        peprock.models.MeasurementArray.from_measurements(
+            [peprock.models.Measurement(1, unit=peprock.models.Unit.watt)],
+            unit=peprock.models.Unit.joule,
+        )
+
+
+@pytest.mark.parametrize(
+    "to",
+    [
+        peprock.models.MetricPrefix.NONE,
+        peprock.models.MetricPrefix.kilo,
+        peprock.models.MetricPrefix.micro,
+    ],
+)
+def test_convert(measurement_array, measurements, to):
+    converted = measurement_array.convert(to)
+    assert converted.prefix is to
+    assert converted.unit == measurement_array.unit
+    assert converted.magnitudes.tolist() == pytest.approx(
+        [float(m.prefix.convert(m.magnitude, to)) for m in measurements],
+    )
+
+
+@pytest.mark.parametrize(
+    "operator_",
+    [
+        operator.add,
+        operator.sub,
+        operator.lt,
+        operator.le,
+        operator.eq,
+        operator.ne,
+        operator.gt,
+        operator.ge,
+    ],
+)
+def test_binary_operator(
+    measurement_array,
+    measurement_array_prefix_shift,
+    operator_,
+):
+    for other in (measurement_array, measurement_array_prefix_shift):
+        expected = [
+            operator_(a, b) for a, b in zip(measurement_array, other, strict=True)
+        ]
+        result = operator_(measurement_array, other)
+        if isinstance(result, peprock.models.MeasurementArray):
+            result = list(result)
+        else:
+            result = result.tolist()
+        assert result == expected
+
+        # combine with scalar measurement in both directions
+        expected = [operator_(a, other[0]) for a in measurement_array]
+        result = operator_(measurement_array, other[0])
+        assert list(result) == expected
+        expected = [operator_(other[0], a) for a in measurement_array]
+        result = operator_(other[0], measurement_array)
+        assert list(result) == expected
+
+
+@pytest.mark.parametrize(
+    "operator_",
+    [
+        operator.mod,
+        operator.floordiv,
+        operator.truediv,
+    ],
+)
+def test_division_operator(
+    measurement_array,
+    measurement_array_prefix_shift,
+    operator_,
+):
+    other = measurement_array_prefix_shift
+    expected = [operator_(a, b) for a, b in zip(measurement_array, other, strict=True)]
+    result = operator_(measurement_array, other)
+    assert list(result) == pytest.approx(expected)
+
+    expected = [operator_(other[0], a) for a in measurement_array if a]
+    result = operator_(other[0], measurement_array[1:])
+    assert list(result) == pytest.approx(expected)
+
+
+def test_other_unit(measurement_array):
+    other = peprock.models.MeasurementArray(
+        measurement_array.magnitudes,
+        measurement_array.prefix,
+        peprock.models.Unit.candela,
+    )
+    with pytest.raises(TypeError):
+        measurement_array + other
+    with pytest.raises(TypeError):
+        assert measurement_array < other
+    with pytest.raises(TypeError):
+        measurement_array + 1
+
+
+def test_converted_unit():
+    joules = peprock.models.MeasurementArray(
+        [3.6, 0.0],
+        peprock.models.MetricPrefix.mega,
+        peprock.models.Unit.joule,
+    )
+    energy = peprock.models.MeasurementArray(
+        [1.0, 2.0],
+        peprock.models.MetricPrefix.kilo,
+        peprock.models.Unit.watt_hour,
+    )
+    assert list(joules == energy) == [True, False]
+    assert list(joules < energy) == [False, True]
+    total = joules + energy
+    assert total.prefix is peprock.models.MetricPrefix.mega
+    assert total.unit is peprock.models.Unit.joule
+    assert list(total.magnitudes) == pytest.approx([7.2, 7.2])
+
+    celsius = peprock.models.MeasurementArray(
+        [20.0, -10.0],
+        unit=peprock.models.Unit.degree_celsius,
+    )
+    kelvin = peprock.models.Measurement(273.15, unit=peprock.models.Unit.kelvin)
+    assert list(celsius > kelvin) == [True, False]
+    for operator_ in (operator.add, operator.sub, operator.mod):
+        with pytest.raises(TypeError):
+            operator_(celsius, kelvin)
+
+
+@pytest.mark.parametrize(
+    "other",
+    [
+        3,
+        2.5,
+        np.float64(2.5),
+        fractions.Fraction(1, 3),
+    ],
+)
+def test_scalar_operator(measurement_array, measurements, other):
+    for operator_ in (operator.mul, operator.truediv, operator.floordiv):
+        assert list(operator_(measurement_array, other)) == pytest.approx(
+            [operator_(m, other) for m in measurements],
+        )
+    assert list(other * measurement_array) == pytest.approx(
+        [other * m for m in measurements],
+    )
+
+    with pytest.raises(TypeError):
+        measurement_array * "test"
+
+
+def test_unary_operator(measurement_array, measurements):
+    assert list(abs(measurement_array)) == [abs(m) for m in measurements]
+    assert list(-measurement_array) == [-m for m in measurements]
+    assert list(+measurement_array) == [+m for m in measurements]
+
+
+@pytest.mark.parametrize(
+    "ndigits",
+    [
+        None,
+        1,
+        -2,
+    ],
+)
+def test_round(measurement_array, measurements, ndigits):
+    rounded = round(measurement_array, ndigits)
+    assert list(rounded) == [round(m, ndigits) for m in measurements]
+    if ndigits is None:
+        assert all(isinstance(m.magnitude, int) for m in rounded)
+
+
+def test_scalar_operator_decimal():
+    measurement_array = peprock.models.MeasurementArray([1, 2], unit="pep")
+    assert list(measurement_array * decimal.Decimal("1.5")) == [
+        peprock.models.Measurement(decimal.Decimal("1.5"), unit="pep"),
+        peprock.models.Measurement(decimal.Decimal("3.0"), unit="pep"),
+    ]
+    with pytest.raises(TypeError):
+        peprock.models.MeasurementArray([1.5]) * decimal.Decimal(2)
+
+
+@pytest.mark.parametrize(
+    ("magnitude", "exception"),
+    [
+        (float("nan"), ValueError),
+        (float("inf"), OverflowError),
+        (-float("inf"), OverflowError),
+        (1e19, OverflowError),
+    ],
+)
+def test_round_invalid(magnitude, exception):
+    with pytest.raises(exception):
+        round(peprock.models.MeasurementArray([1.5, magnitude]))
+
+
+@pytest.mark.parametrize("engineering", [True, False])
+def test_normalize(measurement_array, engineering):
+    normalized = measurement_array.normalize(engineering=engineering)
+    largest = max(measurement_array, key=abs)
+    assert normalized.prefix is largest.normalize(engineering=engineering).prefix
+    assert normalized.magnitudes.tolist() == pytest.approx(
+        measurement_array.convert(normalized.prefix).magnitudes.tolist(),
+    )
+
+    zeros = peprock.models.MeasurementArray([0.0, float("nan")])
+    assert zeros.normalize() is zeros
+
+
+def test_normalize_object():
+    decimals = peprock.models.MeasurementArray(
+        np.array(
+            [decimal.Decimal(1500), decimal.Decimal("NaN"), decimal.Decimal(-2)],
+            dtype=object,
+        ),
+        peprock.models.MetricPrefix.milli,
+    )
+    normalized = decimals.normalize()
+    assert normalized.prefix is peprock.models.MetricPrefix.NONE
+    assert normalized.magnitudes[0] == decimal.Decimal("1.5")
+    assert normalized.magnitudes[1].is_nan()
+    assert normalized.magnitudes[2] == decimal.Decimal("-0.002")
+    assert all(
+        type(magnitude) is decimal.Decimal
+        for magnitude in normalized.magnitudes.tolist()
+    )
+
+    powers = peprock.models.MeasurementArray([1e-12, 999.9999999999999e-12])
+    assert powers.normalize().prefix is peprock.models.MetricPrefix.pico
+
+
+def test_hash(measurement_array):
+    with pytest.raises(TypeError):
+        hash(measurement_array)
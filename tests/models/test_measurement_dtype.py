@@ -0,0 +1,271 @@
+import io
+import pickle
+
+import pytest
+
+import peprock.models
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+pa = pytest.importorskip("pyarrow")
+
+
+@pytest.fixture(
+    params=[
+        (peprock.models.MetricPrefix.NONE, None),
+        (peprock.models.MetricPrefix.kilo, peprock.models.Unit.watt),
+        (
+            peprock.models.MetricPrefix.milli,
+            peprock.models.Unit.watt / peprock.models.Unit.metre**2,
+        ),
+        (peprock.models.MetricPrefix.NONE, "pep"),
+    ],
+)
+def dtype(request):
+    return peprock.models.MeasurementDtype(*request.param)
+
+
+@pytest.fixture
+def measurements(dtype):
+    return [
+        peprock.models.Measurement(1.5, dtype.prefix, dtype.unit),
+        None,
+        peprock.models.Measurement(-250.0, dtype.prefix, dtype.unit),
+        peprock.models.Measurement(0.0, dtype.prefix, dtype.unit),
+    ]
+
+
+@pytest.fixture
+def series(measurements, dtype):
+    return pd.Series(measurements, dtype=dtype)
+
+
+def test_dtype(dtype):
+    if not isinstance(dtype.unit, peprock.models.CompoundUnit):
+        assert dtype == dtype.name
+        assert pd.api.types.pandas_dtype(dtype.name).name == dtype.name
+    assert pd.api.types.pandas_dtype("measurement").name == "measurement[float64]"
+    assert pickle.loads(pickle.dumps(dtype)) == dtype  # noqa: S301
+    assert hash(dtype) == hash(
+        peprock.models.MeasurementDtype(dtype.prefix, dtype.unit),
+    )
+    assert dtype != peprock.models.MeasurementDtype(
+        dtype.prefix,
+        dtype.unit,
+        "int64",
+    )
+    with pytest.raises(TypeError, match="expected int64 or float64 magnitudes"):
+        peprock.models.MeasurementDtype(magnitude_dtype="int32")
+    with pytest.raises(TypeError, match="cannot construct"):
+        peprock.models.MeasurementDtype.construct_from_string("measurement[int32]")
+
+
+def test_series(series, measurements, dtype):
+    assert series.dtype == dtype
+    assert series.tolist() == [
+        pd.NA if measurement is None else measurement for measurement in measurements
+    ]
+    assert series.isna().tolist() == [False, True, False, False]
+    assert series[2] == measurements[2]
+    assert series[1] is pd.NA
+    assert series.dropna().tolist() == [
+        measurement for measurement in measurements if measurement is not None
+    ]
+    assert series.sort_values().tolist() == [
+        measurements[2],
+        measurements[3],
+        measurements[0],
+        pd.NA,
+    ]
+    assert series.max() == measurements[0]
+    assert series.min() == measurements[2]
+    assert series.sum() == measurements[0] + measurements[2] + measurements[3]
+    assert series.sum(skipna=False) is pd.NA
+    assert series.mean() == series.sum() / 3
+    assert series.value_counts().to_dict() == {
+        measurement: 1 for measurement in measurements if measurement is not None
+    }
+    assert pd.concat([series, series]).tolist() == series.tolist() * 2
+    assert pickle.loads(pickle.dumps(series)).equals(series)  # noqa: S301
+
+    series = series.copy()
+    series[1] = measurements[0]
+    series[2:] = [measurements[0], None]
+    assert series.tolist() == [measurements[0]] * 3 + [pd.NA]
+
+
+def test_from_sequence():
+    kilowatt = peprock.models.Measurement(2, peprock.models.MetricPrefix.kilo)
+    array = peprock.models.MeasurementExtensionArray._from_sequence(
+        [kilowatt, peprock.models.Measurement(5)],
+    )
+    assert isinstance(array, peprock.models.MeasurementExtensionArray)
+    assert array.dtype == peprock.models.MeasurementDtype(magnitude_dtype="int64")
+    assert array.magnitudes.tolist() == [2000, 5]
+
+    array = pd.array(
+        [kilowatt, 500],
+        dtype=peprock.models.MeasurementDtype(peprock.models.MetricPrefix.kilo),
+    )
+    assert array.magnitudes.tolist() == [2.0, 500.0]
+
+    array = pd.array(
+        np.array([1.5, 2.5]),
+        dtype=peprock.models.MeasurementDtype(unit=peprock.models.Unit.watt),
+    )
+    assert array[1] == peprock.models.Measurement(2.5, unit=peprock.models.Unit.watt)
+
+    frame = pd.read_csv(
+        io.StringIO("power\n1.5 kW\n\n2 W\n"),
+        dtype={"power": peprock.models.MeasurementDtype(unit=peprock.models.Unit.watt)},
+        skip_blank_lines=False,
+    )
+    assert frame["power"].array.magnitudes[[0, 2]].tolist() == [1500.0, 2.0]
+    assert frame["power"].isna().tolist() == [False, True, False]
+
+    series = pd.Series(["1 kW", "2.5 kW", None]).astype("measurement[float64, W]")
+    assert series.array.magnitudes[:2].tolist() == [1000.0, 2500.0]
+    assert series.isna().tolist() == [False, False, True]
+    assert (
+        series.dtype.name
+        == peprock.models.MeasurementDtype(unit=peprock.models.Unit.watt).name
+    )
+
+    with pytest.raises(ValueError, match="expected measurements sharing a unit"):
+        peprock.models.MeasurementExtensionArray._from_sequence(
+            [
+                peprock.models.Measurement(1, unit=peprock.models.Unit.watt),
+                peprock.models.Measurement(1, unit=peprock.models.Unit.joule),
+            ],
+        )
+    with pytest.raises(TypeError, match="expected measurement"):
+        peprock.models.MeasurementExtensionArray._from_sequence([1])
+    with pytest.raises(TypeError, match="cannot store magnitudes as int64 exactly"):
+        peprock.models.MeasurementExtensionArray._from_sequence(
+            [1.5],
+            dtype=peprock.models.MeasurementDtype(magnitude_dtype="int64"),
+        )
+    with pytest.raises(TypeError, match="expected int or float magnitudes"):
+        peprock.models.MeasurementExtensionArray(np.array(["1"]))
+
+
+@pytest.mark.parametrize(
+    "operator_",
+    [
+        lambda a, b: a + b,
+        lambda a, b: a - b,
+        lambda a, b: a % b,
+        lambda a, b: a // b,
+        lambda a, b: a / b,
+        lambda a, b: a == b,
+        lambda a, b: a != b,
+        lambda a, b: a < b,
+        lambda a, b: a <= b,
+        lambda a, b: a > b,
+        lambda a, b: a >= b,
+    ],
+)
+def test_binary_operator(series, measurements, dtype, operator_):
+    other = peprock.models.Measurement(
+        125,
+        peprock.models.MetricPrefix.milli,
+        dtype.unit,
+    )
+    other_series = pd.Series(
+        [other] * len(series),
+        dtype=peprock.models.MeasurementDtype(other.prefix, other.unit),
+    )
+    for result, expected in [
+        (
+            operator_(series, other),
+            [operator_(measurement, other) for measurement in measurements[::2]],
+        ),
+        (
+            operator_(other, series),
+            [operator_(other, measurement) for measurement in measurements[::2]],
+        ),
+        (
+            operator_(series, other_series),
+            [operator_(measurement, other) for measurement in measurements[::2]],
+        ),
+    ]:
+        assert result[1] is pd.NA
+        assert result[::2].tolist() == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(
+    "operator_",
+    [
+        lambda a: a * 2,
+        lambda a: 2 * a,
+        lambda a: a / 4,
+        lambda a: a // 4,
+        lambda a: -a,
+        lambda a: +a,
+        abs,
+    ],
+)
+def test_unary_operator(series, measurements, operator_):
+    result = operator_(series)
+    assert result[1] is pd.NA
+    assert result[::2].tolist() == [
+        operator_(measurement) for measurement in measurements[::2]
+    ]
+
+
+def test_other_unit(series, dtype):
+    with pytest.raises(TypeError):
+        series + peprock.models.Measurement(1, unit=peprock.models.Unit.second)
+    if dtype.unit is not None:
+        with pytest.raises(ValueError, match="expected measurements sharing a unit"):
+            series[0] = peprock.models.Measurement(1)
+
+
+def test_arrow(series, dtype):
+    table = pa.table({"measurements": series})
+    assert table.schema.field("measurements").type == (
+        peprock.models.MeasurementArrowType(dtype.prefix, dtype.unit)
+    )
+
+    sink = io.BytesIO()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    table = pa.ipc.open_stream(sink.getvalue()).read_all()
+    assert table.schema.field("measurements").type.unit == dtype.unit
+    assert table.to_pandas()["measurements"].equals(series)
+
+    array = series.array.__arrow_array__()
+    assert array.null_count == 1
+    assert array.storage.buffers()[1].address == series.array.magnitudes.ctypes.data
+
+    result = dtype.__from_arrow__(pa.chunked_array([array.slice(1), array[:1]]))
+    assert result.tolist() == series[1:].tolist() + series[:1].tolist()
+
+    storage = pa.array([1.0, 2.0, 3.0])
+    result = dtype.__from_arrow__(storage.slice(1))
+    assert np.shares_memory(result.magnitudes, storage.to_numpy())
+    assert result.magnitudes.tolist() == [2.0, 3.0]
+    result[0] = peprock.models.Measurement(0, dtype.prefix, dtype.unit)
+    assert storage.to_pylist() == [1.0, 2.0, 3.0]
+    assert result.magnitudes.tolist() == [0.0, 3.0]
+
+    assert not len(dtype.__from_arrow__(pa.chunked_array([], type=pa.float64())))
+
+    with pytest.raises(TypeError, match="expected int64 or float64 storage"):
+        peprock.models.MeasurementArrowType(storage_type=pa.int32())
+    with pytest.raises(ValueError, match="truncated measurement type metadata"):
+        peprock.models.MeasurementArrowType.__arrow_ext_deserialize__(
+            pa.float64(),
+            b"\x00",
+        )
+
+
+def test_arrow_int64():
+    array = peprock.models.MeasurementExtensionArray._from_sequence(
+        [peprock.models.Measurement(index, unit="pep") for index in range(5)],
+    )
+    arrow_array = pa.array(array)
+    assert arrow_array.type.storage_type == pa.int64()
+    result = arrow_array.type.to_pandas_dtype().__from_arrow__(arrow_array)
+    assert result.dtype == array.dtype
+    assert np.shares_memory(result.magnitudes, array.magnitudes)
@@ -0,0 +1,145 @@
+import datetime
+import fractions
+
+import pytest
+
+import peprock.dt
+import peprock.models
+
+START = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+INTERVAL = datetime.timedelta(minutes=15)
+
+
+@pytest.fixture(
+    params=[
+        (int, peprock.models.MetricPrefix.kilo, peprock.models.Unit.watt),
+        (float, peprock.models.MetricPrefix.NONE, None),
+        (fractions.Fraction, peprock.models.MetricPrefix.milli, "pep"),
+        (
+            int,
+            peprock.models.MetricPrefix.NONE,
+            peprock.models.Unit.watt / peprock.models.Unit.metre**2,
+        ),
+    ],
+)
+def items(request):
+    number_type, prefix, unit = request.param
+    return [
+        (
+            START + index * INTERVAL,
+            peprock.models.Measurement(number_type(index - 50), prefix, unit),
+        )
+        for index in range(200)
+    ]
+
+
+@pytest.fixture
+def path(tmp_path, items):
+    path = tmp_path / "series.pep"
+    peprock.models.MeasurementSeries.write(path, iter(items))
+    return path
+
+
+def test_open(path, items):
+    with peprock.models.MeasurementSeries.open(path) as series:
+        assert len(series) == len(items)
+        assert series.prefix is items[0][1].prefix
+        assert series.unit == items[0][1].unit
+        assert list(series) == [measurement for _, measurement in items]
+        assert list(series.items()) == items
+        assert series[-1] == items[-1][1]
+        assert series.timestamp(3) == items[3][0]
+        assert series.timestamps[3] == (START + 3 * INTERVAL).timestamp() * 1000000
+        assert series[10:20:2].timestamps.tolist() == [
+            series.timestamps[index] for index in range(10, 20, 2)
+        ]
+        assert repr(series).startswith("<MeasurementSeries: 200 measurements")
+
+    with pytest.raises(ValueError, match="released"):
+        series[0]
+
+
+@pytest.mark.parametrize(
+    ("start", "end", "expected"),
+    [
+        (START, START, slice(0, 1)),
+        (START + INTERVAL / 2, START + 4 * INTERVAL, slice(1, 5)),
+        (START - INTERVAL, START + 1000 * INTERVAL, slice(0, 200)),
+        (
+            (START + 2 * INTERVAL).astimezone(
+                datetime.timezone(datetime.timedelta(hours=2)),
+            ),
+            START + 2 * INTERVAL,
+            slice(2, 3),
+        ),
+        (START + 1000 * INTERVAL, START + 2000 * INTERVAL, slice(200, 200)),
+    ],
+)
+def test_between(path, items, start, end, expected):
+    with peprock.models.MeasurementSeries.open(path) as series:
+        between = series.between(peprock.dt.Period(start, end))
+        assert list(between.items()) == items[expected]
+        between.close()
+
+
+def test_prefixes(tmp_path):
+    path = tmp_path / "series.pep"
+    peprock.models.MeasurementSeries.write(
+        path,
+        [
+            (START, peprock.models.Measurement(1, peprock.models.MetricPrefix.kilo)),
+            (START, peprock.models.Measurement(2)),
+            (START, peprock.models.Measurement(0.5, peprock.models.MetricPrefix.mega)),
+        ],
+    )
+    with peprock.models.MeasurementSeries.open(path) as series:
+        assert series.magnitudes.tolist() == [1000.0, 2.0, 500000.0]
+        assert series.prefix is peprock.models.MetricPrefix.NONE
+
+
+def test_empty(tmp_path):
+    path = tmp_path / "series.pep"
+    peprock.models.MeasurementSeries.write(path, [])
+    with peprock.models.MeasurementSeries.open(path) as series:
+        assert len(series) == 0
+        assert not list(series.between(peprock.dt.Period(START, START)))
+
+
+def test_write_invalid(tmp_path):
+    path = tmp_path / "series.pep"
+    with pytest.raises(ValueError, match="expected measurements sharing a unit"):
+        peprock.models.MeasurementSeries.write(
+            path,
+            [
+                (START, peprock.models.Measurement(1)),
+                (START, peprock.models.Measurement(1, unit="pep")),
+            ],
+        )
+    with pytest.raises(ValueError, match="expected non-decreasing timestamps"):
+        peprock.models.MeasurementSeries.write(
+            path,
+            [
+                (START + INTERVAL, peprock.models.Measurement(1)),
+                (START, peprock.models.Measurement(1)),
+            ],
+        )
+    with pytest.raises(peprock.dt.EnsureAwareError):
+        peprock.models.MeasurementSeries.write(
+            path,
+            [(START.replace(tzinfo=None), peprock.models.Measurement(1))],
+        )
+
+
+def test_open_invalid(tmp_path, path):
+    data = path.read_bytes()
+    invalid_path = tmp_path / "invalid.pep"
+    for invalid_data, match in [
+        (data[:10], "truncated measurement series header"),
+        (b"PEPMTX" + data[6:], "expected measurement series version 1"),
+        (data[:-8], "expected 200 measurements"),
+        (data[:9] + b"\x07" + data[10:], "invalid magnitude tag 7"),
+        (data[:8] + b"\x05" + data[9:], "invalid prefix exponent 5"),
+    ]:
+        invalid_path.write_bytes(invalid_data)
+        with pytest.raises(ValueError, match=match):
+            peprock.models.MeasurementSeries.open(invalid_path)
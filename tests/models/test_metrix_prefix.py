@@ -1,3 +1,4 @@
+import array
 import decimal
 import fractions
 
@@ -85,6 +86,51 @@ def test_to(metric_prefix, other, number_type):
     )
 
 
+@pytest.mark.parametrize(
+    ("exponent", "engineering", "expected"),
+    [
+        (-100, True, peprock.models.MetricPrefix.quecto),
+        (-4, True, peprock.models.MetricPrefix.micro),
+        (-1, True, peprock.models.MetricPrefix.milli),
+        (-1, False, peprock.models.MetricPrefix.deci),
+        (0, True, peprock.models.MetricPrefix.NONE),
+        (2, True, peprock.models.MetricPrefix.NONE),
+        (2, False, peprock.models.MetricPrefix.hecto),
+        (5, False, peprock.models.MetricPrefix.kilo),
+        (100, False, peprock.models.MetricPrefix.quetta),
+    ],
+)
+def test_from_exponent(exponent, engineering, expected):
+    assert (
+        peprock.models.MetricPrefix.from_exponent(exponent, engineering=engineering)
+        is expected
+    )
+
+
+@pytest.mark.parametrize(
+    "number_type",
+    [
+        int,
+        float,
+        complex,
+        decimal.Decimal,
+        fractions.Fraction,
+    ],
+)
+@pytest.mark.parametrize(
+    "exponent",
+    [-100, -60, -3, 0, 3, 60, 100],
+)
+def test_to_exact(exponent, number_type):
+    factor = peprock.models.MetricPrefix.NONE.to(-exponent, number_type=number_type)
+    if number_type is int and exponent < 0:
+        assert factor == fractions.Fraction(1, 10**-exponent)
+        assert isinstance(factor, fractions.Fraction)
+    else:
+        assert factor == number_type(10) ** exponent
+        assert isinstance(factor, number_type)
+
+
 @pytest.mark.parametrize(
     "value",
     [
@@ -134,3 +180,133 @@ def test_convert(metric_prefix, to, value):
             number_type=type(value),
         ),
     )
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [],
+        [0, 12, -34567],
+        [0.0, 12.5, -34567.89012],
+        [decimal.Decimal("-34567.89012"), decimal.Decimal(12)],
+        [fractions.Fraction(-7, 3), 2],
+        [1, 2.5, decimal.Decimal("0.5"), fractions.Fraction(1, 3)],
+    ],
+    ids=repr,
+)
+@pytest.mark.parametrize(
+    "to",
+    [
+        peprock.models.MetricPrefix.milli,
+        peprock.models.MetricPrefix.kilo,
+        peprock.models.MetricPrefix.mega,
+    ],
+)
+def test_convert_all(values, to):
+    values = list(values)
+    expected = [peprock.models.MetricPrefix.kilo.convert(value, to) for value in values]
+    assert peprock.models.MetricPrefix.kilo.convert_all(values, to) is values
+    assert values == expected
+    assert list(map(type, values)) == list(map(type, expected))
+
+
+def test_convert_all_decimal_context():
+    values = [decimal.Decimal("1.234")] * 2
+    with decimal.localcontext(decimal.Context(prec=3)):
+        peprock.models.MetricPrefix.kilo.convert_all(values)
+    assert values == [decimal.Decimal("1.23E+3")] * 2
+
+
+@pytest.mark.parametrize("typecode", ["d", "q", "h"])
+def test_convert_all_buffer(typecode):
+    values = array.array(typecode, [0, 1, 25])
+    assert peprock.models.MetricPrefix.deca.convert_all(values) is values
+    assert values.tolist() == [0, 10, 250]
+
+    view = memoryview(values)
+    assert peprock.models.MetricPrefix.deca.convert_all(view) is view
+    assert values.tolist() == [0, 100, 2500]
+
+    converted = peprock.models.MetricPrefix.deca.convert_all(view.toreadonly())
+    assert converted == array.array(typecode, [0, 1000, 25000])
+    assert values.tolist() == [0, 100, 2500]
+
+    assert peprock.models.MetricPrefix.NONE.convert_all(view.toreadonly()) == view
+
+
+def test_convert_all_buffer_float():
+    values = array.array("d", [0.0, 1.5])
+    assert peprock.models.MetricPrefix.NONE.convert_all(
+        values,
+        peprock.models.MetricPrefix.kilo,
+    ) == array.array("d", [0.0, 0.0015])
+
+
+def test_convert_all_ndarray():
+    np = pytest.importorskip("numpy")
+
+    values = np.array([0.0, 1.5, -2.25])
+    assert peprock.models.MetricPrefix.kilo.convert_all(values) is values
+    assert values.tolist() == [0.0, 1500.0, -2250.0]
+
+    values = np.array([0, 15, -225])
+    assert peprock.models.MetricPrefix.kilo.convert_all(values) is values
+    assert values.tolist() == [0, 15000, -225000]
+    converted = peprock.models.MetricPrefix.NONE.convert_all(
+        values,
+        peprock.models.MetricPrefix.kilo,
+    )
+    assert converted.tolist() == [0.0, 15.0, -225.0]
+    assert values.tolist() == [0, 15000, -225000]
+
+    values.flags.writeable = False
+    converted = peprock.models.MetricPrefix.kilo.convert_all(values)
+    assert converted.tolist() == [0, 15000000, -225000000]
+    assert peprock.models.MetricPrefix.NONE.convert_all(values) is values
+
+    zeros = np.zeros(3, dtype=np.int64)
+    assert peprock.models.MetricPrefix.quetta.convert_all(zeros) is zeros
+    assert zeros.tolist() == [0, 0, 0]
+    bounds = np.array(
+        [np.iinfo(np.int64).max // 1000, -(np.iinfo(np.int64).max // 1000)],
+    )
+    assert peprock.models.MetricPrefix.kilo.convert_all(bounds) is bounds
+
+    with pytest.raises(TypeError, match="unsupported dtype"):
+        peprock.models.MetricPrefix.kilo.convert_all(np.array(["a"]))
+
+
+@pytest.mark.parametrize(
+    ("values", "dtype", "prefix", "expected"),
+    [
+        ([1, 2**62], "int64", "kilo", [1000, 2**62 * 1000]),
+        ([-(2**62), 1], "int64", "kilo", [-(2**62) * 1000, 1000]),
+        ([3, 0], "int64", "quetta", [3 * 10**30, 0]),
+        ([200], "uint8", "deca", [2000]),
+    ],
+)
+def test_convert_all_ndarray_overflow(values, dtype, prefix, expected):
+    np = pytest.importorskip("numpy")
+    values_ = np.array(values, dtype=dtype)
+    converted = peprock.models.MetricPrefix[prefix].convert_all(values_)
+    assert converted.dtype == object
+    assert converted.tolist() == expected
+    assert values_.tolist() == values
+
+
+def test_convert_all_invalid():
+    with pytest.raises(TypeError, match="unsupported values type 'tuple'"):
+        peprock.models.MetricPrefix.kilo.convert_all((1, 2))
+    with pytest.raises(TypeError, match="cannot convert integer typecode 'q'"):
+        peprock.models.MetricPrefix.NONE.convert_all(
+            array.array("q", [1]),
+            peprock.models.MetricPrefix.kilo,
+        )
+    with pytest.raises(TypeError, match="unsupported typecode 'u'"):
+        peprock.models.MetricPrefix.kilo.convert_all(array.array("u", "a"))
+    with pytest.raises(TypeError, match="expected one-dimensional memoryview"):
+        peprock.models.MetricPrefix.kilo.convert_all(
+            memoryview(array.array("d", [1.0, 2.0])).cast("B").cast("d", (1, 2)),
+        )
+    with pytest.raises(OverflowError):
+        peprock.models.MetricPrefix.kilo.convert_all(array.array("B", [1]))
@@ -0,0 +1,150 @@
+import decimal
+import fractions
+
+import pytest
+
+import peprock.models
+
+
+@pytest.fixture(
+    params=[
+        int,
+        float,
+        decimal.Decimal,
+        fractions.Fraction,
+    ],
+)
+def measurements(request):
+    prefixes = [
+        peprock.models.MetricPrefix.NONE,
+        peprock.models.MetricPrefix.kilo,
+        peprock.models.MetricPrefix.milli,
+    ]
+    return [
+        peprock.models.Measurement(
+            request.param(index * 7919 % 200 - 100),
+            prefixes[index * 31 % 7 % 3],
+            peprock.models.Unit.watt,
+        )
+        for index in range(300)
+    ]
+
+
+def test_sort_key(measurements):
+    assert sorted(measurements, key=peprock.models.Measurement.sort_key) == sorted(
+        measurements,
+    )
+
+
+@pytest.mark.parametrize("load", [1, 4, 1000])
+def test_sorted_measurements(measurements, load):
+    sorted_measurements = peprock.models.SortedMeasurements(
+        measurements[:100],
+        load=load,
+    )
+    for measurement in measurements[100:200]:
+        sorted_measurements.add(measurement)
+    assert sorted_measurements.update(iter(measurements[200:])) is sorted_measurements
+
+    expected = sorted(measurements, key=peprock.models.Measurement.sort_key)
+    assert list(sorted_measurements) == expected
+    assert list(reversed(sorted_measurements)) == expected[::-1]
+    assert len(sorted_measurements) == len(expected)
+    assert sorted_measurements[0] is expected[0]
+    assert sorted_measurements[-1] is expected[-1]
+    assert sorted_measurements[10:20] == expected[10:20]
+
+    for measurement in measurements[::7]:
+        assert measurement in sorted_measurements
+        assert sorted_measurements.count(measurement) == expected.count(measurement)
+        index = sorted_measurements.index(measurement)
+        assert sorted_measurements[index] == measurement
+        assert sorted_measurements.bisect_left(measurement) == index
+        assert sorted_measurements.bisect_right(measurement) == index + (
+            expected.count(measurement)
+        )
+
+    minimum = peprock.models.Measurement(-50, unit=peprock.models.Unit.watt)
+    maximum = peprock.models.Measurement(50, unit=peprock.models.Unit.watt)
+    assert list(sorted_measurements.between(minimum, maximum)) == [
+        measurement for measurement in expected if minimum <= measurement <= maximum
+    ]
+    assert list(sorted_measurements.between(None, maximum)) == [
+        measurement for measurement in expected if measurement <= maximum
+    ]
+    assert list(sorted_measurements.between(minimum)) == [
+        measurement for measurement in expected if minimum <= measurement
+    ]
+
+    for measurement in measurements[::2]:
+        sorted_measurements.remove(measurement)
+        expected.remove(measurement)
+    del sorted_measurements[3]
+    del expected[3]
+    assert list(sorted_measurements) == expected
+
+    for measurement in measurements:
+        sorted_measurements.discard(measurement)
+    assert not sorted_measurements
+    assert list(sorted_measurements.between(minimum, maximum)) == []
+    assert sorted_measurements.bisect_left(minimum) == 0
+
+
+@pytest.mark.parametrize("load", [1, 2, 5])
+def test_sorted_measurements_positions(measurements, load):
+    sorted_measurements = peprock.models.SortedMeasurements(load=load)
+    expected = []
+    for index, measurement in enumerate(measurements):
+        sorted_measurements.add(measurement)
+        expected.append(measurement)
+        if not (index + 1) % 3:
+            del sorted_measurements[index % len(sorted_measurements)]
+            expected.sort(key=peprock.models.Measurement.sort_key)
+            del expected[index % len(expected)]
+
+        if index % 17 == 0:
+            expected.sort(key=peprock.models.Measurement.sort_key)
+            assert [
+                sorted_measurements[position]
+                for position in range(len(sorted_measurements))
+            ] == expected
+            middle = expected[len(expected) // 2]
+            assert sorted_measurements.index(middle) == expected.index(middle)
+            assert all(
+                len(bucket) <= 2 * load for bucket in sorted_measurements._buckets
+            )
+
+
+def test_sorted_measurements_empty():
+    sorted_measurements = peprock.models.SortedMeasurements()
+    assert repr(sorted_measurements) == "SortedMeasurements([])"
+    assert peprock.models.Measurement(1) not in sorted_measurements
+    sorted_measurements.add(peprock.models.Measurement(1, unit="pep"))
+    assert sorted_measurements.bisect_right(
+        peprock.models.Measurement(1, unit="pep"),
+    ) == len(sorted_measurements)
+
+
+def test_sorted_measurements_invalid():
+    sorted_measurements = peprock.models.SortedMeasurements(
+        [peprock.models.Measurement(1, unit=peprock.models.Unit.watt)],
+    )
+    other = peprock.models.Measurement(1, unit=peprock.models.Unit.joule)
+    assert other not in sorted_measurements
+    assert sorted_measurements.count(other) == 0
+    with pytest.raises(ValueError, match="expected measurements sharing a unit"):
+        sorted_measurements.add(other)
+    with pytest.raises(ValueError, match="expected measurements sharing a unit"):
+        sorted_measurements.update([other])
+    with pytest.raises(ValueError, match="expected measurements sharing a unit"):
+        sorted_measurements.bisect_left(other)
+    with pytest.raises(ValueError, match="not in SortedMeasurements"):
+        sorted_measurements.index(other)
+    with pytest.raises(ValueError, match="not in SortedMeasurements"):
+        sorted_measurements.remove(
+            peprock.models.Measurement(2, unit=peprock.models.Unit.watt),
+        )
+    with pytest.raises(IndexError, match="index out of range"):
+        sorted_measurements[1]
+    with pytest.raises(ValueError, match="expected positive load"):
+        peprock.models.SortedMeasurements(load=0)
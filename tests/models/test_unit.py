@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 import peprock.models
@@ -11,3 +13,74 @@ def test_symbol(unit):
     assert isinstance(unit.symbol, str)
     assert unit.symbol == unit.value
     assert peprock.models.Unit(unit.symbol) is unit
+
+
+@pytest.mark.parametrize(
+    ("unit", "expected"),
+    [
+        (peprock.models.Unit.watt * peprock.models.Unit.second, "J"),
+        (peprock.models.Unit.joule / peprock.models.Unit.second, "W"),
+        (peprock.models.Unit.volt * peprock.models.Unit.ampere, "W"),
+        (peprock.models.Unit.second**-1, "Hz"),
+        (peprock.models.Unit.candela * peprock.models.Unit.steradian, "lm"),
+        (peprock.models.Unit.metre / peprock.models.Unit.metre, "1"),
+        (peprock.models.Unit.one * peprock.models.Unit.ohm, "Ω"),
+        (peprock.models.Unit.metre**0, "1"),
+        (peprock.models.Unit.metre**2, "m²"),
+        (peprock.models.Unit.watt / peprock.models.Unit.metre**2, "W/m²"),
+        (
+            peprock.models.Unit.watt
+            / (peprock.models.Unit.metre**2 * peprock.models.Unit.kelvin),
+            "W/(m²·K)",
+        ),
+        (peprock.models.Unit.one / peprock.models.Unit.metre**3, "1/m³"),
+        (
+            peprock.models.Unit.metre
+            * peprock.models.Unit.gram
+            / peprock.models.Unit.second**2,
+            "m·g/s²",
+        ),
+        (peprock.models.Unit.joule / peprock.models.Unit.gram, "J/g"),
+        (peprock.models.Unit.radian / peprock.models.Unit.second, "rad/s"),
+        (peprock.models.Unit.watt * peprock.models.Unit.hour, "Wh"),
+        (peprock.models.Unit.watt_hour / peprock.models.Unit.hour, "W"),
+        (peprock.models.Unit.watt_hour / peprock.models.Unit.watt, "hr"),
+        (peprock.models.Unit.joule / peprock.models.Unit.watt_hour, "J/Wh"),
+    ],
+    ids=str,
+)
+def test_algebra(unit, expected):
+    assert unit.symbol == expected
+    if isinstance(unit, peprock.models.CompoundUnit):
+        assert str(unit) == expected
+        assert repr(unit) == f"<CompoundUnit: {expected!r}>"
+    else:
+        assert peprock.models.Unit(expected) is unit
+
+
+def test_compound_unit():
+    unit = peprock.models.Unit.watt / peprock.models.Unit.metre**2
+    assert unit is peprock.models.CompoundUnit(
+        [(peprock.models.Unit.metre, -2), (peprock.models.Unit.watt, 1)],
+    )
+    assert unit is peprock.models.Unit.watt / peprock.models.Unit.metre / (
+        peprock.models.Unit.metre
+    )
+    assert unit.factors == (
+        (peprock.models.Unit.metre, -2),
+        (peprock.models.Unit.watt, 1),
+    )
+    assert unit * peprock.models.Unit.metre**2 is peprock.models.Unit.watt
+    assert unit**-1 is peprock.models.Unit.metre**2 / peprock.models.Unit.watt
+    assert (
+        unit.dimension
+        is (peprock.models.Unit.gram / peprock.models.Unit.second**3).dimension
+    )
+    assert pickle.loads(pickle.dumps(unit)) is unit  # noqa: S301
+
+    with pytest.raises(AttributeError):
+        unit.symbol = "test"
+    with pytest.raises(TypeError):
+        unit * "test"
+    with pytest.raises(TypeError):
+        peprock.models.Unit.watt / 2